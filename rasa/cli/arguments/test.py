@@ -113,6 +113,14 @@ def add_test_nlu_argument_group(
         "multiple configs or a folder of configs are passed, models "
         "will be trained and compared directly.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes which train and evaluate models in parallel "
+        "(cross validation and comparison mode only).",
+    )
 
     cross_validation_arguments = parser.add_argument_group("Cross Validation")
     cross_validation_arguments.add_argument(
@@ -109,6 +109,12 @@ def add_augmentation_param(
         default=50,
         help="How much data augmentation to use during training.",
     )
+    parser.add_argument(
+        "--generation-workers",
+        type=int,
+        default=1,
+        help="Number of processes which generate and augment the training stories.",
+    )
 
 
 def add_debug_plots_param(
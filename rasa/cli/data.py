@@ -19,6 +19,7 @@ from rasa.importers.rasa import RasaFileImporter
 from rasa.nlu.convert import convert_training_data
 from rasa.utils.converter import TrainingDataConverter
 from rasa.validator import Validator
+import rasa.utils.io
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +174,7 @@ def validate_files(args: argparse.Namespace, stories_only: bool = False) -> None
         stories_only: If `True`, only the story structure is validated.
     """
     loop = asyncio.get_event_loop()
+    rasa.utils.io.configure_yaml_cache_from_environment()
     file_importer = RasaFileImporter(
         domain_path=args.domain, training_data_paths=args.data
     )
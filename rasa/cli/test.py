@@ -135,6 +135,7 @@ def run_nlu_test(args: argparse.Namespace) -> None:
             output=output,
             runs=args.runs,
             exclusion_percentages=args.percentages,
+            jobs=args.jobs,
         )
     elif args.cross_validation:
         logger.info("Test model using cross validation.")
@@ -150,6 +150,8 @@ def extract_core_additional_arguments(args: argparse.Namespace) -> Dict:
         arguments["augmentation_factor"] = args.augmentation
     if "debug_plots" in args:
         arguments["debug_plots"] = args.debug_plots
+    if "generation_workers" in args:
+        arguments["generation_workers"] = args.generation_workers
 
     return arguments
 
@@ -17,6 +17,9 @@ DEFAULT_CORE_SUBDIRECTORY_NAME = "core"
 DEFAULT_NLU_SUBDIRECTORY_NAME = "nlu"
 DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
 DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
+DEFAULT_CONNECTION_LIMIT = 100  # 0 means no limit
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0  # 0 means no limit
+DEFAULT_KEEPALIVE_TIMEOUT = 15  # seconds
 
 TEST_STORIES_FILE_PREFIX = "test_"
 TEST_DATA_FILE = "test.md"
@@ -88,3 +91,8 @@ ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
 
 DEFAULT_NLU_FALLBACK_INTENT_NAME = "nlu_fallback"
+
+DEFAULT_CACHE_DIR = os.path.join(".rasa", "cache")
+DEFAULT_MAX_CACHE_SIZE_IN_MB = 1000
+ENV_CACHE_DIR = "RASA_CACHE_DIRECTORY"
+ENV_MAX_CACHE_SIZE = "RASA_MAX_CACHE_SIZE"
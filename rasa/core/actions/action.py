@@ -1,8 +1,11 @@
 import copy
+import gzip
+import itertools
 import json
 import logging
 import typing
-from typing import List, Text, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Text, Optional, Dict, Any, Set
 import random
 
 import aiohttp
@@ -457,6 +460,110 @@ class ActionDeactivateForm(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+# `action_endpoint` options to opt into the incremental action server protocol
+# and into gzip-compressed request bodies
+INCREMENTAL_PAYLOADS_KEY = "incremental_payloads"
+COMPRESS_PAYLOADS_KEY = "compress_payloads"
+
+# request and response keys of the incremental action server protocol
+EVENT_OFFSET_KEY = "event_offset"
+TRACKER_EVENT_COUNT_KEY = "tracker_event_count"
+DOMAIN_FINGERPRINT_KEY = "domain_fingerprint"
+
+# status code with which the action server requests the full payload
+MISSING_STATE_STATUS_CODE = 409
+
+MAX_ACKNOWLEDGED_CONVERSATIONS = 10000
+
+
+class ActionServerState:
+    """State which an action server acknowledged to have cached.
+
+    Used to send incremental payloads to action servers which opted into the
+    incremental protocol. Only the events which were added since the latest
+    acknowledged event are sent, and the domain is replaced by its fingerprint
+    once the action server cached it.
+    """
+
+    def __init__(self, max_conversations: int = MAX_ACKNOWLEDGED_CONVERSATIONS) -> None:
+        self.max_conversations = max_conversations
+        self.domain_fingerprints: Set[Text] = set()
+
+        # number of acknowledged events and the latest acknowledged event of each
+        # conversation, ordered from the least to the most recently called one
+        self._acknowledged_events = OrderedDict()
+
+    def event_offset(self, tracker: "DialogueStateTracker") -> int:
+        """Return the number of `tracker` events the action server has cached."""
+
+        acknowledged = self._acknowledged_events.get(tracker.sender_id)
+        if not acknowledged:
+            return 0
+
+        number_of_events, latest_event = acknowledged
+        if (
+            number_of_events > len(tracker.events)
+            or tracker.events[number_of_events - 1].as_dict() != latest_event
+        ):
+            # the conversation was changed, e.g. because its events were replaced
+            self.forget_events(tracker.sender_id)
+            return 0
+
+        self._acknowledged_events.move_to_end(tracker.sender_id)
+        return number_of_events
+
+    def acknowledge(
+        self,
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        response: Optional[Dict[Text, Any]],
+    ) -> None:
+        """Remember which state the action server cached after an action call."""
+
+        if not response:
+            self.forget_events(tracker.sender_id)
+            return
+
+        if response.get(DOMAIN_FINGERPRINT_KEY) == domain.fingerprint:
+            self.domain_fingerprints.add(domain.fingerprint)
+
+        number_of_events = response.get(TRACKER_EVENT_COUNT_KEY)
+        if not isinstance(number_of_events, int) or not 0 < number_of_events <= len(
+            tracker.events
+        ):
+            self.forget_events(tracker.sender_id)
+            return
+
+        latest_event = tracker.events[number_of_events - 1].as_dict()
+        self._acknowledged_events[tracker.sender_id] = (number_of_events, latest_event)
+        self._acknowledged_events.move_to_end(tracker.sender_id)
+
+        while len(self._acknowledged_events) > self.max_conversations:
+            self._acknowledged_events.popitem(last=False)
+
+    def forget_events(self, sender_id: Text) -> None:
+        self._acknowledged_events.pop(sender_id, None)
+
+    def forget(self, sender_id: Text, domain: "Domain") -> None:
+        """Forget the cached state the action server doesn't have anymore."""
+
+        self.forget_events(sender_id)
+        self.domain_fingerprints.discard(domain.fingerprint)
+
+
+# acknowledged state of the action servers by their URL
+_action_server_states: Dict[Text, ActionServerState] = {}
+
+
+def action_server_state(action_endpoint: EndpointConfig) -> ActionServerState:
+    """Return the acknowledged state of the action server at `action_endpoint`."""
+
+    if action_endpoint.url not in _action_server_states:
+        _action_server_states[action_endpoint.url] = ActionServerState()
+
+    return _action_server_states[action_endpoint.url]
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
@@ -479,6 +586,83 @@ class RemoteAction(Action):
             "version": rasa.__version__,
         }
 
+    def _incremental_action_call_format(
+        self,
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        state: ActionServerState,
+    ) -> Dict[Text, Any]:
+        """Create the request json for action servers using the incremental protocol.
+
+        The tracker only contains the events after `event_offset`. The domain is
+        only included if the action server hasn't cached it yet.
+        """
+        from rasa.core.trackers import EventVerbosity
+
+        event_offset = state.event_offset(tracker)
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        tracker_state["events"] = [
+            event.as_dict()
+            for event in itertools.islice(tracker.events, event_offset, None)
+        ]
+
+        json_body = {
+            "next_action": self._name,
+            "sender_id": tracker.sender_id,
+            "tracker": tracker_state,
+            EVENT_OFFSET_KEY: event_offset,
+            DOMAIN_FINGERPRINT_KEY: domain.fingerprint,
+            "version": rasa.__version__,
+        }
+        if domain.fingerprint not in state.domain_fingerprints:
+            json_body["domain"] = domain.as_dict()
+
+        return json_body
+
+    async def _call_action_server(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Optional[Dict[Text, Any]]:
+        """Send the action call to the action server and return its response."""
+
+        if not self.action_endpoint.kwargs.get(INCREMENTAL_PAYLOADS_KEY):
+            return await self._post(self._action_call_format(tracker, domain))
+
+        state = action_server_state(self.action_endpoint)
+        json_body = self._incremental_action_call_format(tracker, domain, state)
+        try:
+            response = await self._post(json_body)
+        except ClientResponseError as e:
+            is_incremental = (
+                json_body[EVENT_OFFSET_KEY] > 0 or "domain" not in json_body
+            )
+            if e.status != MISSING_STATE_STATUS_CODE or not is_incremental:
+                raise
+
+            logger.debug(
+                f"The action server doesn't have the state of conversation "
+                f"'{tracker.sender_id}' cached anymore. Sending the full state."
+            )
+            state.forget(tracker.sender_id, domain)
+            json_body = self._incremental_action_call_format(tracker, domain, state)
+            response = await self._post(json_body)
+
+        state.acknowledge(tracker, domain, response)
+
+        return response
+
+    async def _post(self, json_body: Dict[Text, Any]) -> Optional[Dict[Text, Any]]:
+        if self.action_endpoint.kwargs.get(COMPRESS_PAYLOADS_KEY):
+            return await self.action_endpoint.request(
+                data=gzip.compress(json.dumps(json_body).encode()),
+                headers={"Content-Encoding": "gzip"},
+                method="post",
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+            )
+
+        return await self.action_endpoint.request(
+            json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+        )
+
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
         """Expected response schema for an Action endpoint.
@@ -556,7 +740,6 @@ class RemoteAction(Action):
         tracker: "DialogueStateTracker",
         domain: "Domain",
     ) -> List[Event]:
-        json_body = self._action_call_format(tracker, domain)
         if not self.action_endpoint:
             logger.error(
                 "The model predicted the custom action '{}', "
@@ -573,9 +756,7 @@ class RemoteAction(Action):
             logger.debug(
                 "Calling action endpoint to run action '{}'.".format(self.name())
             )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
+            response = await self._call_action_server(tracker, domain)
 
             self._validate_action_result(response)
 
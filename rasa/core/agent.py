@@ -18,6 +18,7 @@ from rasa.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
 from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.lock_store import InMemoryLockStore, LockStore
+from rasa.core.reminder_store import ReminderStore
 from rasa.core.nlg import NaturalLanguageGenerator
 from rasa.core.policies.ensemble import PolicyEnsemble, SimplePolicyEnsemble
 from rasa.core.policies.memoization import MemoizationPolicy
@@ -81,7 +82,9 @@ def _load_interpreter(
         The NLU interpreter.
     """
     if nlu_path:
-        return NaturalLanguageInterpreter.create(nlu_path)
+        # keep the inference configuration of the currently loaded model
+        inference_config = getattr(agent.interpreter, "inference_config", None)
+        return NaturalLanguageInterpreter.create(nlu_path, inference_config)
 
     return agent.interpreter or RegexInterpreter()
 
@@ -170,59 +173,58 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
-        try:
-            params = model_server.combine_parameters()
-            async with session.request(
-                "GET",
-                model_server.url,
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers=headers,
-                params=params,
-            ) as resp:
-
-                if resp.status in [204, 304]:
-                    logger.debug(
-                        "Model server returned {} status code, "
-                        "indicating that no new model is available. "
-                        "Current fingerprint: {}"
-                        "".format(resp.status, fingerprint)
-                    )
-                    return None
-                elif resp.status == 404:
-                    logger.debug(
-                        "Model server could not find a model at the requested "
-                        "endpoint '{}'. It's possible that no model has been "
-                        "trained, or that the requested tag hasn't been "
-                        "assigned.".format(model_server.url)
-                    )
-                    return None
-                elif resp.status != 200:
-                    logger.debug(
-                        "Tried to fetch model from server, but server response "
-                        "status code is {}. We'll retry later..."
-                        "".format(resp.status)
-                    )
-                    return None
-
-                model_directory = tempfile.mkdtemp()
-                rasa.utils.io.unarchive(await resp.read(), model_directory)
+    try:
+        params = model_server.combine_parameters()
+        async with model_server.pooled_session().request(
+            "GET",
+            model_server.url,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            headers=headers,
+            params=params,
+        ) as resp:
+
+            if resp.status in [204, 304]:
                 logger.debug(
-                    "Unzipped model to '{}'".format(os.path.abspath(model_directory))
+                    "Model server returned {} status code, "
+                    "indicating that no new model is available. "
+                    "Current fingerprint: {}"
+                    "".format(resp.status, fingerprint)
                 )
+                return None
+            elif resp.status == 404:
+                logger.debug(
+                    "Model server could not find a model at the requested "
+                    "endpoint '{}'. It's possible that no model has been "
+                    "trained, or that the requested tag hasn't been "
+                    "assigned.".format(model_server.url)
+                )
+                return None
+            elif resp.status != 200:
+                logger.debug(
+                    "Tried to fetch model from server, but server response "
+                    "status code is {}. We'll retry later..."
+                    "".format(resp.status)
+                )
+                return None
 
-                # get the new fingerprint
-                new_fingerprint = resp.headers.get("ETag")
-                # return new tmp model directory and new fingerprint
-                return model_directory, new_fingerprint
-
-        except aiohttp.ClientError as e:
+            model_directory = tempfile.mkdtemp()
+            rasa.utils.io.unarchive(await resp.read(), model_directory)
             logger.debug(
-                "Tried to fetch model from server, but "
-                "couldn't reach server. We'll retry later... "
-                "Error: {}.".format(e)
+                "Unzipped model to '{}'".format(os.path.abspath(model_directory))
             )
-            return None
+
+            # get the new fingerprint
+            new_fingerprint = resp.headers.get("ETag")
+            # return new tmp model directory and new fingerprint
+            return model_directory, new_fingerprint
+
+    except aiohttp.ClientError as e:
+        logger.debug(
+            "Tried to fetch model from server, but "
+            "couldn't reach server. We'll retry later... "
+            "Error: {}.".format(e)
+        )
+        return None
 
 
 async def _run_model_pulling_worker(
@@ -260,6 +262,7 @@ async def load_agent(
     generator: Union[EndpointConfig, NaturalLanguageGenerator] = None,
     tracker_store: Optional[TrackerStore] = None,
     lock_store: Optional[LockStore] = None,
+    reminder_store: Optional[ReminderStore] = None,
     action_endpoint: Optional[EndpointConfig] = None,
 ):
     try:
@@ -270,6 +273,7 @@ async def load_agent(
                     generator=generator,
                     tracker_store=tracker_store,
                     lock_store=lock_store,
+                    reminder_store=reminder_store,
                     action_endpoint=action_endpoint,
                     model_server=model_server,
                     remote_storage=remote_storage,
@@ -285,6 +289,7 @@ async def load_agent(
                 generator=generator,
                 tracker_store=tracker_store,
                 lock_store=lock_store,
+                reminder_store=reminder_store,
                 action_endpoint=action_endpoint,
                 model_server=model_server,
             )
@@ -296,6 +301,7 @@ async def load_agent(
                 generator=generator,
                 tracker_store=tracker_store,
                 lock_store=lock_store,
+                reminder_store=reminder_store,
                 action_endpoint=action_endpoint,
                 model_server=model_server,
                 remote_storage=remote_storage,
@@ -327,6 +333,7 @@ class Agent:
         generator: Union[EndpointConfig, NaturalLanguageGenerator, None] = None,
         tracker_store: Optional[TrackerStore] = None,
         lock_store: Optional[LockStore] = None,
+        reminder_store: Optional[ReminderStore] = None,
         action_endpoint: Optional[EndpointConfig] = None,
         fingerprint: Optional[Text] = None,
         model_directory: Optional[Text] = None,
@@ -352,6 +359,7 @@ class Agent:
         self.nlg = NaturalLanguageGenerator.create(generator, self.domain)
         self.tracker_store = self.create_tracker_store(tracker_store, self.domain)
         self.lock_store = self._create_lock_store(lock_store)
+        self.reminder_store = ReminderStore.create(reminder_store)
         self.action_endpoint = action_endpoint
 
         self._set_fingerprint(fingerprint)
@@ -372,7 +380,11 @@ class Agent:
         self.policy_ensemble = policy_ensemble
 
         if interpreter:
-            self.interpreter = NaturalLanguageInterpreter.create(interpreter)
+            interpreter = NaturalLanguageInterpreter.create(interpreter)
+            if self.interpreter is not None and self.interpreter is not interpreter:
+                # the replaced interpreter isn't used for new messages anymore
+                self.interpreter.close()
+            self.interpreter = interpreter
 
         self._set_fingerprint(fingerprint)
 
@@ -391,6 +403,7 @@ class Agent:
         generator: Union[EndpointConfig, NaturalLanguageGenerator] = None,
         tracker_store: Optional[TrackerStore] = None,
         lock_store: Optional[LockStore] = None,
+        reminder_store: Optional[ReminderStore] = None,
         action_endpoint: Optional[EndpointConfig] = None,
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
@@ -435,6 +448,7 @@ class Agent:
             generator=generator,
             tracker_store=tracker_store,
             lock_store=lock_store,
+            reminder_store=reminder_store,
             action_endpoint=action_endpoint,
             model_directory=model_path,
             model_server=model_server,
@@ -442,6 +456,17 @@ class Agent:
             path_to_model_archive=path_to_model_archive,
         )
 
+    async def handle_due_reminders(
+        self, output_channel_for: Callable[[Optional[Text]], OutputChannel]
+    ) -> None:
+        """Trigger the due reminders which weren't claimed by any Rasa server yet."""
+
+        if not self.is_core_ready():
+            return
+
+        processor = self.create_processor()
+        await processor.handle_due_reminders(output_channel_for)
+
     def is_core_ready(self) -> bool:
         """Check if all necessary components and policies are ready to use the agent.
         """
@@ -655,6 +680,7 @@ class Agent:
         use_story_concatenation: bool = True,
         debug_plots: bool = False,
         exclusion_percentage: Optional[int] = None,
+        generation_workers: int = 1,
     ) -> List[DialogueStateTracker]:
         """Load training data from a resource."""
 
@@ -688,6 +714,7 @@ class Agent:
             use_story_concatenation,
             debug_plots,
             exclusion_percentage=exclusion_percentage,
+            generation_workers=generation_workers,
         )
 
     def train(
@@ -821,6 +848,7 @@ class Agent:
             self.nlg,
             action_endpoint=self.action_endpoint,
             message_preprocessor=preprocessor,
+            reminder_store=self.reminder_store,
         )
 
     @staticmethod
@@ -885,6 +913,7 @@ class Agent:
         generator: Union[EndpointConfig, NaturalLanguageGenerator] = None,
         tracker_store: Optional[TrackerStore] = None,
         lock_store: Optional[LockStore] = None,
+        reminder_store: Optional[ReminderStore] = None,
         action_endpoint: Optional[EndpointConfig] = None,
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
@@ -909,6 +938,7 @@ class Agent:
             generator=generator,
             tracker_store=tracker_store,
             lock_store=lock_store,
+            reminder_store=reminder_store,
             action_endpoint=action_endpoint,
             model_server=model_server,
             remote_storage=remote_storage,
@@ -923,6 +953,7 @@ class Agent:
         generator: Union[EndpointConfig, NaturalLanguageGenerator] = None,
         tracker_store: Optional[TrackerStore] = None,
         lock_store: Optional[LockStore] = None,
+        reminder_store: Optional[ReminderStore] = None,
         action_endpoint: Optional[EndpointConfig] = None,
         model_server: Optional[EndpointConfig] = None,
     ) -> Optional["Agent"]:
@@ -940,6 +971,7 @@ class Agent:
                 generator=generator,
                 tracker_store=tracker_store,
                 lock_store=lock_store,
+                reminder_store=reminder_store,
                 action_endpoint=action_endpoint,
                 model_server=model_server,
                 remote_storage=remote_storage,
@@ -1,12 +1,18 @@
 import json
 import logging
-from typing import Optional
+from typing import Optional, Text, Union
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.shared.utils.io import DEFAULT_ENCODING
 
 logger = logging.getLogger(__name__)
 
+# default settings of the `kafka.KafkaProducer`, except for `linger_ms` which is
+# increased so that the events of a conversation turn are sent in one batch
+DEFAULT_LINGER_MS = 5
+DEFAULT_BATCH_SIZE = 16384
+DEFAULT_ACKS = 1
+
 
 class KafkaEventBroker(EventBroker):
     def __init__(
@@ -21,8 +27,33 @@ class KafkaEventBroker(EventBroker):
         topic="rasa_core_events",
         security_protocol="SASL_PLAINTEXT",
         loglevel=logging.ERROR,
+        linger_ms: int = DEFAULT_LINGER_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compression_type: Optional[Text] = None,
+        acks: Union[int, Text] = DEFAULT_ACKS,
     ) -> None:
+        """Kafka event broker.
 
+        Args:
+            host: Bootstrap server of the Kafka cluster.
+            sasl_username: Username for SASL authentication.
+            sasl_password: Password for SASL authentication.
+            ssl_cafile: CA file for SSL certificate verification.
+            ssl_certfile: Client certificate file.
+            ssl_keyfile: Client private key file.
+            ssl_check_hostname: Whether the producer should verify the hostname of the
+                broker's certificate.
+            topic: Topic the events are published to.
+            security_protocol: `SASL_PLAINTEXT` or `SSL`.
+            loglevel: Log level of the `kafka` logger.
+            linger_ms: Time in milliseconds the producer waits for further events
+                before sending a batch, e.g. the events of the same conversation turn.
+            batch_size: Maximum size of a batch in bytes.
+            compression_type: Compression of the batches (`gzip`, `snappy`, `lz4` or
+                `None`).
+            acks: Number of acknowledgments the producer requires from the Kafka
+                cluster (`0`, `1` or `all`).
+        """
         self.producer = None
         self.host = host
         self.topic = topic
@@ -33,6 +64,10 @@ class KafkaEventBroker(EventBroker):
         self.ssl_certfile = ssl_certfile
         self.ssl_keyfile = ssl_keyfile
         self.ssl_check_hostname = ssl_check_hostname
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self.compression_type = compression_type
+        self.acks = acks
 
         logging.getLogger("kafka").setLevel(loglevel)
 
@@ -44,35 +79,50 @@ class KafkaEventBroker(EventBroker):
         return cls(broker_config.url, **broker_config.kwargs)
 
     def publish(self, event) -> None:
-        self._create_producer()
+        # the producer is kept open to send events in batches and to avoid connecting
+        # to the cluster for each event, it's closed in `close`
+        if self.producer is None:
+            self._create_producer()
         self._publish(event)
-        self._close()
+
+    def close(self) -> None:
+        """Send all pending events and close the producer."""
+        if self.producer is not None:
+            self._close()
 
     def _create_producer(self) -> None:
         import kafka
 
+        producer_kwargs = dict(
+            bootstrap_servers=[self.host],
+            value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+            linger_ms=self.linger_ms,
+            batch_size=self.batch_size,
+            compression_type=self.compression_type,
+            acks=self.acks,
+            security_protocol=self.security_protocol,
+        )
+
         if self.security_protocol == "SASL_PLAINTEXT":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 sasl_plain_username=self.sasl_username,
                 sasl_plain_password=self.sasl_password,
                 sasl_mechanism="PLAIN",
-                security_protocol=self.security_protocol,
+                **producer_kwargs,
             )
         elif self.security_protocol == "SSL":
             self.producer = kafka.KafkaProducer(
-                bootstrap_servers=[self.host],
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
                 ssl_cafile=self.ssl_cafile,
                 ssl_certfile=self.ssl_certfile,
                 ssl_keyfile=self.ssl_keyfile,
                 ssl_check_hostname=False,
-                security_protocol=self.security_protocol,
+                **producer_kwargs,
             )
 
     def _publish(self, event) -> None:
         self.producer.send(self.topic, event)
 
     def _close(self) -> None:
+        self.producer.flush()
         self.producer.close()
+        self.producer = None
@@ -1,11 +1,13 @@
+import asyncio
 import json
 import logging
 import os
 import time
 import typing
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from threading import Thread
+from threading import Condition, Thread
 from typing import (
     Callable,
     Deque,
@@ -38,9 +40,26 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# body and headers of a message
+_Message = Tuple[Text, Optional[Dict[Text, Text]]]
+
 RABBITMQ_EXCHANGE = "rasa-exchange"
 DEFAULT_QUEUE_NAME = "rasa_core_events"
 
+# what to do with a new message if the buffer of unpublished messages is full
+OVERFLOW_POLICY_BLOCK = "block"
+OVERFLOW_POLICY_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICY_SPILL_TO_DISK = "spill_to_disk"
+OVERFLOW_POLICIES = [
+    OVERFLOW_POLICY_BLOCK,
+    OVERFLOW_POLICY_DROP_OLDEST,
+    OVERFLOW_POLICY_SPILL_TO_DISK,
+]
+
+DEFAULT_MAX_UNPUBLISHED_MESSAGES = 10000
+DEFAULT_OVERFLOW_BLOCK_TIMEOUT_IN_SECONDS = 1
+DEFAULT_CLOSE_TIMEOUT_IN_SECONDS = 10
+
 
 def initialise_pika_connection(
     host: Text,
@@ -267,6 +286,14 @@ class PikaEventBroker(EventBroker):
         log_level: Union[Text, int] = os.environ.get(
             ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES
         ),
+        max_unpublished_messages: int = DEFAULT_MAX_UNPUBLISHED_MESSAGES,
+        overflow_policy: Text = OVERFLOW_POLICY_DROP_OLDEST,
+        overflow_block_timeout_in_seconds: float = (
+            DEFAULT_OVERFLOW_BLOCK_TIMEOUT_IN_SECONDS
+        ),
+        overflow_spill_path: Optional[Text] = None,
+        use_publisher_confirms: bool = True,
+        close_timeout_in_seconds: float = DEFAULT_CLOSE_TIMEOUT_IN_SECONDS,
         **kwargs: Any,
     ):
         """Initialise RabbitMQ event broker.
@@ -279,11 +306,44 @@ class PikaEventBroker(EventBroker):
             queues: Pika queues to declare and publish to.
             should_keep_unpublished_messages: Whether or not the event broker should
                 maintain a queue of unpublished messages to be published later in
-                case of errors.
+                case of errors. If `False`, messages are dropped if the channel isn't
+                open or publishing them fails.
             raise_on_failure: Whether to raise an exception if publishing fails. If
-                `False`, keep retrying.
+                `True`, messages are published synchronously. If `False`, messages
+                are added to a buffer and published by the Pika IO thread.
             log_level: Logging level.
+            max_unpublished_messages: Maximum number of messages in the buffer of
+                unpublished messages.
+            overflow_policy: What to do with new messages if the buffer is full.
+                `block` waits up to `overflow_block_timeout_in_seconds` for the buffer
+                to have space and drops the message otherwise. On an event loop the
+                wait is handed to a separate thread, so that `publish` returns
+                immediately. `drop_oldest` drops the oldest message in the buffer.
+                `spill_to_disk` appends the message to the file at
+                `overflow_spill_path`. Once messages were spilled, new messages are
+                spilled as well until the buffer is empty and the spilled messages are
+                published, so that messages are published in order.
+            overflow_block_timeout_in_seconds: Time to wait for the buffer to have
+                space if the overflow policy is `block`.
+            overflow_spill_path: File to spill messages to if the overflow policy is
+                `spill_to_disk`.
+            use_publisher_confirms: Whether to keep messages until RabbitMQ confirms
+                them. Messages which RabbitMQ rejects or which are unconfirmed when the
+                channel closes are published again.
+            close_timeout_in_seconds: Time `close` waits for unpublished messages to
+                be published.
         """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid overflow policy '{overflow_policy}' for the Pika event "
+                f"broker. Valid policies are {OVERFLOW_POLICIES}."
+            )
+        if overflow_policy == OVERFLOW_POLICY_SPILL_TO_DISK and not overflow_spill_path:
+            raise ValueError(
+                f"The overflow policy '{OVERFLOW_POLICY_SPILL_TO_DISK}' of the Pika "
+                f"event broker requires an `overflow_spill_path`."
+            )
+
         logging.getLogger("pika").setLevel(log_level)
 
         self.host = host
@@ -294,20 +354,84 @@ class PikaEventBroker(EventBroker):
         self.queues = self._get_queues_from_args(queues)
         self.should_keep_unpublished_messages = should_keep_unpublished_messages
         self.raise_on_failure = raise_on_failure
+        self.max_unpublished_messages = max_unpublished_messages
+        self.overflow_policy = overflow_policy
+        self.overflow_block_timeout_in_seconds = overflow_block_timeout_in_seconds
+        self.overflow_spill_path = overflow_spill_path
+        self.use_publisher_confirms = use_publisher_confirms
+        self.close_timeout_in_seconds = close_timeout_in_seconds
+
+        # Buffer of messages (body and headers) which are published by the Pika IO
+        # thread. `_condition` guards the buffer as it's shared between threads.
+        self._unpublished_messages: Deque[_Message] = deque()
+        self._condition = Condition()
+        self._is_flush_scheduled = False
+        # Published messages which weren't confirmed yet by their delivery tag
+        self._unconfirmed_messages: Dict[int, _Message] = {}
+        self._delivery_tag = 0
+        self._number_of_dropped_messages = 0
+        self._number_of_spilled_messages = 0
+        # messages spilled by previous runs are published before new ones
+        self._has_spilled_messages = (
+            overflow_policy == OVERFLOW_POLICY_SPILL_TO_DISK
+            and os.path.exists(overflow_spill_path)
+        )
+        # thread which waits for space in the buffer if the overflow policy is
+        # `block` and messages are published on an event loop
+        self._overflow_thread_pool: Optional[ThreadPoolExecutor] = None
+        self._number_of_waiting_messages = 0
 
-        # List to store unpublished messages which hopefully will be published later
-        self._unpublished_messages: Deque[Text] = deque()
+        self._pika_connection: Optional["SelectConnection"] = None
         self._run_pika()
 
     def __del__(self) -> None:
-        if self.channel:
+        if getattr(self, "channel", None):
             close_pika_channel(self.channel)
             close_pika_connection(self.channel.connection)
 
     def close(self) -> None:
-        """Close the pika channel and connection."""
+        """Publish the unpublished messages and close the pika channel and connection.
+
+        Waits up to `close_timeout_in_seconds` for the unpublished messages.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._unpublished_messages
+                and not self._unconfirmed_messages
+                and not self._number_of_waiting_messages,
+                timeout=self.close_timeout_in_seconds,
+            )
+            if self._unpublished_messages or self._unconfirmed_messages:
+                logger.warning(
+                    f"Closing the Pika event broker with "
+                    f"{len(self._unpublished_messages)} unpublished and "
+                    f"{len(self._unconfirmed_messages)} unconfirmed messages."
+                )
+
+        if self._overflow_thread_pool is not None:
+            self._overflow_thread_pool.shutdown(wait=False)
+            self._overflow_thread_pool = None
+
         self.__del__()
 
+    def metrics(self) -> Dict[Text, int]:
+        """Return metrics about the buffer of unpublished messages.
+
+        Returns:
+            The number of messages in the buffer (`unpublished_messages`), the number
+            of messages waiting for a confirmation (`unconfirmed_messages`) and how
+            many messages were dropped (`dropped_messages`) or spilled to disk
+            (`spilled_messages`) because the buffer was full or they couldn't be
+            published.
+        """
+        with self._condition:
+            return {
+                "unpublished_messages": len(self._unpublished_messages),
+                "unconfirmed_messages": len(self._unconfirmed_messages),
+                "dropped_messages": self._number_of_dropped_messages,
+                "spilled_messages": self._number_of_spilled_messages,
+            }
+
     @property
     def rasa_environment(self) -> Optional[Text]:
         """Get value of the `RASA_ENVIRONMENT` environment variable."""
@@ -400,16 +524,63 @@ class PikaEventBroker(EventBroker):
             channel.queue_declare(queue=queue, durable=True)
             channel.queue_bind(exchange=RABBITMQ_EXCHANGE, queue=queue)
 
+        if self.use_publisher_confirms:
+            channel.confirm_delivery(self._on_delivery_confirmation)
+        channel.add_on_close_callback(self._on_channel_closed)
+
+        with self._condition:
+            # delivery tags are counted per channel
+            self._requeue_unconfirmed_messages()
+            self._delivery_tag = 0
+
         self.channel = channel
+        self._flush_unpublished_messages()
+
+    def _on_channel_closed(self, channel: "Channel", reason: Exception) -> None:
+        logger.warning(f"RabbitMQ channel was closed: {reason}.")
+        self.channel = None
+
+        with self._condition:
+            self._requeue_unconfirmed_messages()
+
+        if channel.connection.is_open:
+            channel.connection.channel(on_open_callback=self._on_channel_open)
+
+    def _on_delivery_confirmation(self, frame: "pika.frame.Method") -> None:
+        from pika.spec import Basic
+
+        delivery_tag = frame.method.delivery_tag
+        with self._condition:
+            if frame.method.multiple:
+                delivery_tags = [
+                    tag for tag in self._unconfirmed_messages if tag <= delivery_tag
+                ]
+            else:
+                delivery_tags = [delivery_tag]
+
+            messages = [
+                self._unconfirmed_messages.pop(tag)
+                for tag in delivery_tags
+                if tag in self._unconfirmed_messages
+            ]
+
+            if isinstance(frame.method, Basic.Nack):
+                logger.warning(
+                    f"RabbitMQ rejected {len(messages)} messages. Publishing them again."
+                )
+                self._unpublished_messages.extendleft(reversed(messages))
+                self._schedule_flush()
 
-        while self._unpublished_messages:
-            # Send unpublished messages
-            message = self._unpublished_messages.popleft()
-            self._publish(message)
-            logger.debug(
-                f"Published message from queue of unpublished messages. "
-                f"Remaining unpublished messages: {len(self._unpublished_messages)}."
-            )
+            self._condition.notify_all()
+
+    def _requeue_unconfirmed_messages(self) -> None:
+        """Add the unconfirmed messages to the front of the unpublished messages."""
+        messages = [
+            self._unconfirmed_messages[tag]
+            for tag in sorted(self._unconfirmed_messages)
+        ]
+        self._unpublished_messages.extendleft(reversed(messages))
+        self._unconfirmed_messages.clear()
 
     def _run_pika_io_loop_in_thread(self) -> None:
         thread = Thread(target=self._run_pika_io_loop, daemon=True)
@@ -451,33 +622,242 @@ class PikaEventBroker(EventBroker):
     ) -> None:
         """Publish `event` into Pika queue.
 
+        Unless `raise_on_failure` is set, the event is added to the buffer of
+        unpublished messages and published by the Pika IO thread, so that publishing
+        doesn't block.
+
         Args:
             event: Serialised event to be published.
-            retries: Number of retries if publishing fails
-            retry_delay_in_seconds: Delay in seconds between retries.
+            retries: Deprecated, messages are published again until RabbitMQ
+                confirms them.
+            retry_delay_in_seconds: Deprecated, see `retries`.
             headers: Message headers to append to the published message (key-value
                 dictionary). The headers can be retrieved in the consumer from the
                 `headers` attribute of the message's `BasicProperties`.
         """
         body = json.dumps(event)
 
-        while retries:
+        if self.raise_on_failure:
             try:
                 self._publish(body, headers)
-                return
             except Exception as e:
                 logger.error(
                     f"Could not open Pika channel at host '{self.host}'. "
                     f"Failed with error: {e}"
                 )
                 self.channel = None
-                if self.raise_on_failure:
-                    raise e
+                raise e
+            return
+
+        if self._pika_connection is not None and self._pika_connection.is_closed:
+            # Try to reset connection, the unpublished messages are published as soon
+            # as the new channel is open
+            self._run_pika()
+
+        with self._condition:
+            if not self.channel and not self.should_keep_unpublished_messages:
+                self._number_of_dropped_messages += 1
+                logger.warning(
+                    f"RabbitMQ channel has not been assigned. Dropping message:\n{body}"
+                )
+                return
+
+            if self._must_overflow():
+                if not self._handle_overflow(body, headers):
+                    return
+            self._unpublished_messages.append((body, headers))
+            self._schedule_flush()
+
+    def _must_overflow(self) -> bool:
+        """Whether a new message can't be added to the buffer right away.
+
+        Besides a full buffer, this is the case if older messages still wait for
+        space or were spilled to disk, as they have to be published first.
+        """
+        return (
+            len(self._unpublished_messages) >= self.max_unpublished_messages
+            or self._number_of_waiting_messages > 0
+            or self._has_spilled_messages
+        )
+
+    def _handle_overflow(
+        self, body: Text, headers: Optional[Dict[Text, Text]] = None
+    ) -> bool:
+        """Apply the overflow policy if the buffer of unpublished messages is full.
+
+        Args:
+            body: Body of the new message.
+            headers: Headers of the new message.
+
+        Returns:
+            `True` if the new message should be added to the buffer.
+        """
+        if self.overflow_policy == OVERFLOW_POLICY_SPILL_TO_DISK:
+            with open(self.overflow_spill_path, "a", encoding=DEFAULT_ENCODING) as f:
+                f.write(json.dumps([body, headers]) + "\n")
+            self._number_of_spilled_messages += 1
+            self._has_spilled_messages = True
+            return False
+
+        if self.overflow_policy == OVERFLOW_POLICY_BLOCK:
+            if _is_event_loop_running():
+                # waiting would block all conversations of the Rasa server
+                return self._wait_for_space_in_thread(body, headers)
+
+            if self._condition.wait_for(
+                lambda: not self._must_overflow(),
+                timeout=self.overflow_block_timeout_in_seconds,
+            ):
+                return True
 
-            retries -= 1
-            time.sleep(retry_delay_in_seconds)
+        self._drop_on_overflow(body)
+        return self.overflow_policy == OVERFLOW_POLICY_DROP_OLDEST
 
-        logger.error(f"Failed to publish Pika event on host '{self.host}':\n{body}")
+    def _drop_on_overflow(self, body: Text) -> None:
+        self._number_of_dropped_messages += 1
+        if self.overflow_policy == OVERFLOW_POLICY_DROP_OLDEST:
+            body = self._unpublished_messages.popleft()[0]
+
+        logger.error(
+            f"The buffer of unpublished Pika messages is full "
+            f"({self.max_unpublished_messages} messages). Dropping message:\n{body}"
+        )
+
+    def _wait_for_space_in_thread(
+        self, body: Text, headers: Optional[Dict[Text, Text]] = None
+    ) -> bool:
+        """Let a separate thread add the new message once the buffer has space.
+
+        Args:
+            body: Body of the new message.
+            headers: Headers of the new message.
+
+        Returns:
+            `False` as the new message is added to the buffer by the thread.
+        """
+        if self._number_of_waiting_messages >= self.max_unpublished_messages:
+            self._drop_on_overflow(body)
+            return False
+
+        if self._overflow_thread_pool is None:
+            # a single thread keeps the waiting messages in order
+            self._overflow_thread_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pika_overflow"
+            )
+
+        self._number_of_waiting_messages += 1
+        self._overflow_thread_pool.submit(self._add_when_space, body, headers)
+        return False
+
+    def _add_when_space(
+        self, body: Text, headers: Optional[Dict[Text, Text]] = None
+    ) -> None:
+        """Add a message to the buffer once it has space. Runs in a separate thread."""
+        with self._condition:
+            if self._condition.wait_for(
+                lambda: len(self._unpublished_messages) < self.max_unpublished_messages,
+                timeout=self.overflow_block_timeout_in_seconds,
+            ):
+                self._unpublished_messages.append((body, headers))
+                self._schedule_flush()
+            else:
+                self._drop_on_overflow(body)
+
+            self._number_of_waiting_messages -= 1
+            self._condition.notify_all()
+
+    def _schedule_flush(self) -> None:
+        """Let the Pika IO thread publish the buffered messages.
+
+        Messages which are added before the IO thread runs the flush are published in
+        the same batch.
+        """
+        if self._is_flush_scheduled or not self.channel:
+            # the messages are published once the channel is open
+            return
+
+        try:
+            self._pika_connection.ioloop.add_callback_threadsafe(
+                self._flush_unpublished_messages
+            )
+            self._is_flush_scheduled = True
+        except Exception as e:
+            logger.warning(f"Failed to schedule publishing of Pika messages: {e}")
+
+    def _flush_unpublished_messages(self) -> None:
+        """Publish the buffered messages. Runs in the Pika IO thread."""
+        with self._condition:
+            self._is_flush_scheduled = False
+
+        number_of_published_messages = 0
+        while self.channel:
+            with self._condition:
+                if not self._unpublished_messages:
+                    self._load_spilled_messages()
+                if not self._unpublished_messages:
+                    break
+                # the message stays in the buffer until it's published
+                message = self._unpublished_messages[0]
+
+            try:
+                self._basic_publish(*message)
+            except Exception as e:
+                if self.should_keep_unpublished_messages:
+                    logger.error(
+                        f"Failed to publish Pika message on host '{self.host}': {e}. "
+                        f"Trying again once the channel is open."
+                    )
+                    break
+
+                logger.error(
+                    f"Failed to publish Pika message on host '{self.host}': {e}. "
+                    f"Dropping message:\n{message[0]}"
+                )
+                with self._condition:
+                    if (
+                        self._unpublished_messages
+                        and self._unpublished_messages[0] is message
+                    ):
+                        self._unpublished_messages.popleft()
+                    self._number_of_dropped_messages += 1
+                    self._condition.notify_all()
+                continue
+
+            with self._condition:
+                if (
+                    self._unpublished_messages
+                    and self._unpublished_messages[0] is message
+                ):
+                    self._unpublished_messages.popleft()
+                if self.use_publisher_confirms:
+                    self._delivery_tag += 1
+                    self._unconfirmed_messages[self._delivery_tag] = message
+                self._condition.notify_all()
+            number_of_published_messages += 1
+
+        if number_of_published_messages:
+            logger.debug(f"Published {number_of_published_messages} Pika messages.")
+
+    def _load_spilled_messages(self) -> None:
+        """Move messages which were spilled to disk back to the buffer."""
+        if not self.overflow_spill_path or not os.path.exists(self.overflow_spill_path):
+            self._has_spilled_messages = False
+            return
+
+        with open(self.overflow_spill_path, encoding=DEFAULT_ENCODING) as f:
+            lines = f.readlines()
+
+        for line in lines[: self.max_unpublished_messages]:
+            body, headers = json.loads(line)
+            self._unpublished_messages.append((body, headers))
+
+        remaining = lines[self.max_unpublished_messages :]
+        with open(self.overflow_spill_path, "w", encoding=DEFAULT_ENCODING) as f:
+            f.writelines(remaining)
+
+        if not remaining:
+            os.remove(self.overflow_spill_path)
+            self._has_spilled_messages = False
 
     def _get_message_properties(
         self, headers: Optional[Dict[Text, Text]] = None
@@ -539,11 +919,21 @@ class PikaEventBroker(EventBroker):
                 f"later. Current number of unpublished messages is "
                 f"{len(self._unpublished_messages)}."
             )
-            self._unpublished_messages.append(body)
+            with self._condition:
+                self._unpublished_messages.append((body, headers))
         else:
             self._basic_publish(body, headers)
 
 
+def _is_event_loop_running() -> bool:
+    """Whether the current thread runs an event loop."""
+    try:
+        return asyncio.get_event_loop().is_running()
+    except RuntimeError:
+        # threads other than the main thread don't have an event loop by default
+        return False
+
+
 def create_rabbitmq_ssl_options(
     rabbitmq_host: Optional[Text] = None,
 ) -> Optional["pika.SSLOptions"]:
@@ -16,6 +16,27 @@ DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 DEFAULT_LOCK_LIFETIME = 60  # in seconds
 
+# time a Rasa server has to handle a due reminder before others may claim it
+DEFAULT_REMINDER_LEASE_LIFETIME = 60  # in seconds
+
+# interval in which persistent reminder stores are checked for due reminders
+DEFAULT_REMINDER_POLLING_INTERVAL = 5  # in seconds
+
+# maximum number of due reminders which are claimed at once
+DEFAULT_REMINDER_BATCH_SIZE = 100
+
+# number of threads which run the blocking calls of persistent reminder stores
+DEFAULT_REMINDER_STORE_THREAD_POOL_SIZE = 4
+
+# maximum number of messages which are parsed in one NLU pipeline pass
+DEFAULT_NLU_INFERENCE_MAX_BATCH_SIZE = 32
+
+# maximum time a message waits for other messages to be parsed in the same batch
+DEFAULT_NLU_INFERENCE_MAX_WAIT_TIME_IN_MS = 0
+
+# number of threads which run the NLU pipeline
+DEFAULT_NLU_INFERENCE_WORKERS = 1
+
 REQUESTED_SLOT = "requested_slot"
 # rules allow setting a value of slots or active_loops to None;
 # generator substitutes `None`s with this constant to notify rule policy that
@@ -84,6 +105,11 @@ POSTGRESQL_SCHEMA = "POSTGRESQL_SCHEMA"
 POSTGRESQL_POOL_SIZE = "SQL_POOL_SIZE"
 POSTGRESQL_MAX_OVERFLOW = "SQL_MAX_OVERFLOW"
 
+# Name of the environment variable defining the number of threads which run the
+# blocking calls of tracker stores
+TRACKER_STORE_THREAD_POOL_SIZE = "TRACKER_STORE_THREAD_POOL_SIZE"
+DEFAULT_TRACKER_STORE_THREAD_POOL_SIZE = 10
+
 # the keys for State (USER, PREVIOUS_ACTION, SLOTS, ACTIVE_LOOP)
 # represent the origin of a SubState
 USER = "user"
@@ -489,15 +489,26 @@ class Domain:
             )
 
     def __hash__(self) -> int:
+        return int(self._text_hash(), 16)
+
+    def _text_hash(self) -> Text:
         self_as_dict = self.as_dict()
         self_as_dict[KEY_INTENTS] = sort_list_of_dicts_by_first_key(
             self_as_dict[KEY_INTENTS]
         )
         self_as_dict[KEY_ACTIONS] = self.action_names
         self_as_string = json.dumps(self_as_dict, sort_keys=True)
-        text_hash = rasa.shared.utils.io.get_text_hash(self_as_string)
 
-        return int(text_hash, 16)
+        return rasa.shared.utils.io.get_text_hash(self_as_string)
+
+    @lazy_property
+    def fingerprint(self) -> Text:
+        """Returns a fingerprint of the domain.
+
+        The fingerprint is computed once, so the domain must not be modified
+        after the fingerprint was used.
+        """
+        return self._text_hash()
 
     @lazy_property
     def user_actions_and_forms(self):
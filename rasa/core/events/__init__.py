@@ -835,6 +835,25 @@ class ReminderCancelled(Event):
             and ((not self.entities) or self._matches_entities_hash(entities_hash))
         )
 
+    def cancels_reminder(self, reminder: ReminderScheduled) -> bool:
+        """Determines if this `ReminderCancelled` event should cancel `reminder`.
+
+        Args:
+            reminder: A reminder of the same conversation.
+
+        Returns:
+            `True`, if this `ReminderCancelled` event should cancel the reminder,
+            and `False` otherwise.
+        """
+
+        # Cancel everything unless names/intents/entities are given to
+        # narrow it down.
+        return (
+            ((not self.name) or self.name == reminder.name)
+            and ((not self.intent) or self.intent == reminder.intent)
+            and ((not self.entities) or str(self.entities) == str(reminder.entities))
+        )
+
     def _matches_name_hash(self, name_hash: Text) -> bool:
         return str(hash(self.name)) == name_hash
 
@@ -1,10 +1,12 @@
 import logging
+import os
 import numpy as np
 import scipy.sparse
-from typing import List, Optional, Dict, Text, Set
+from typing import Any, List, Optional, Dict, Text, Set, Tuple, FrozenSet
 from collections import defaultdict
 
 import rasa.shared.utils.io
+import rasa.utils.io as io_utils
 from rasa.core.domain import Domain, State, SubState
 from rasa.core.interpreter import NaturalLanguageInterpreter
 from rasa.core.constants import USER, PREVIOUS_ACTION, SLOTS, ACTIVE_LOOP
@@ -16,12 +18,18 @@ from rasa.shared.nlu.constants import (
     ACTION_TEXT,
     ACTION_NAME,
     INTENT,
+    TEXT,
 )
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.nlu.training_data.message import Message
 
 logger = logging.getLogger(__name__)
 
+FEATURES_CACHE_FILE_NAME = "state_featurizer_features.pkl"
+
+# sub state (without its entities) and whether the features are sparse
+FeaturesCacheKey = Tuple[FrozenSet[Tuple[Text, Any]], bool]
+
 
 class SingleStateFeaturizer:
     """Base class to transform the dialogue state into an ML format.
@@ -31,17 +39,36 @@ class SingleStateFeaturizer:
     to its features. Possible attributes are: INTENT, TEXT, ACTION_NAME,
     ACTION_TEXT, ENTITIES, SLOTS and ACTIVE_LOOP. Each attribute will be
     featurized into a list of `rasa.utils.features.Features`.
+
+    Intents, action names and action texts are only featurized once. Their
+    features are cached and persisted together with the policy, so that the NLU
+    pipeline only has to featurize user texts during prediction.
     """
 
     def __init__(self) -> None:
         self._default_feature_states = {}
         self.action_texts = []
+        self._features_cache: Dict[FeaturesCacheKey, Dict[Text, List[Features]]] = {}
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # the cached features are persisted separately, see `persist_features`
+        state = self.__dict__.copy()
+        state.pop("_features_cache", None)
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        self.__dict__.update(state)
+        self._features_cache = {}
 
-    def prepare_from_domain(self, domain: Domain) -> None:
+    def prepare_from_domain(
+        self, domain: Domain, interpreter: Optional[NaturalLanguageInterpreter] = None,
+    ) -> None:
         """Gets necessary information for featurization from domain.
 
         Args:
             domain: a :class:`rasa.core.domain.Domain`
+            interpreter: If given, the features of all intents and actions of the
+                domain are computed upfront with this interpreter.
         """
         # store feature states for each attribute in order to create binary features
         def convert_to_dict(feature_states: List[Text]) -> Dict[Text, int]:
@@ -56,6 +83,45 @@ class SingleStateFeaturizer:
         self._default_feature_states[ACTIVE_LOOP] = convert_to_dict(domain.form_names)
         self.action_texts = domain.action_texts
 
+        # features depend on the domain and the interpreter
+        self._features_cache = {}
+        if interpreter is not None:
+            self._cache_domain_features(domain, interpreter)
+
+    def _cache_domain_features(
+        self, domain: Domain, interpreter: NaturalLanguageInterpreter
+    ) -> None:
+        for intent in domain.intents:
+            self._features_for_sub_state({INTENT: intent}, interpreter, sparse=True)
+
+        for action in domain.action_names:
+            action_as_sub_state = self._action_as_sub_state(action)
+            # previous actions are featurized as sparse features, labels are not
+            self._features_for_sub_state(action_as_sub_state, interpreter, sparse=True)
+            self._features_for_sub_state(action_as_sub_state, interpreter)
+
+    def persist_features(self, path: Text) -> None:
+        """Persist the cached features of intents and actions.
+
+        Args:
+            path: The directory to persist the features to.
+        """
+        io_utils.pickle_dump(
+            os.path.join(path, FEATURES_CACHE_FILE_NAME), self._features_cache
+        )
+
+    def load_features(self, path: Text) -> None:
+        """Load the cached features of intents and actions if they were persisted.
+
+        Args:
+            path: The directory the features were persisted to.
+        """
+        features_file = os.path.join(path, FEATURES_CACHE_FILE_NAME)
+        if os.path.isfile(features_file):
+            self._features_cache = io_utils.pickle_load(features_file)
+        else:
+            self._features_cache = {}
+
     # pytype: disable=bad-return-type
     def _state_features_for_attribute(
         self, sub_state: SubState, attribute: Text
@@ -182,6 +248,43 @@ class SingleStateFeaturizer:
 
         return output
 
+    @staticmethod
+    def _features_cache_key(
+        sub_state: SubState, sparse: bool
+    ) -> Optional[FeaturesCacheKey]:
+        # user texts are too diverse to be cached
+        if TEXT in sub_state:
+            return None
+
+        # entities are not featurized together with the rest of the sub state
+        return (
+            frozenset(
+                (attribute, value)
+                for attribute, value in sub_state.items()
+                if attribute != ENTITIES
+            ),
+            sparse,
+        )
+
+    def _features_for_sub_state(
+        self,
+        sub_state: SubState,
+        interpreter: NaturalLanguageInterpreter,
+        sparse: bool = False,
+    ) -> Dict[Text, List["Features"]]:
+        key = self._features_cache_key(sub_state, sparse)
+        if key is None:
+            return self._extract_state_features(sub_state, interpreter, sparse)
+
+        features = self._features_cache.get(key)
+        if features is None:
+            features = self._extract_state_features(sub_state, interpreter, sparse)
+            self._features_cache[key] = features
+
+        # `Features` are never modified, hence they can be shared, but the
+        # containers might be
+        return {attribute: list(values) for attribute, values in features.items()}
+
     def encode_state(
         self, state: State, interpreter: NaturalLanguageInterpreter
     ) -> Dict[Text, List["Features"]]:
@@ -198,13 +301,13 @@ class SingleStateFeaturizer:
         for state_type, sub_state in state.items():
             if state_type == PREVIOUS_ACTION:
                 state_features.update(
-                    self._extract_state_features(sub_state, interpreter, sparse=True)
+                    self._features_for_sub_state(sub_state, interpreter, sparse=True)
                 )
             # featurize user only if it is "real" user input,
             # i.e. input from a turn after action_listen
             if state_type == USER and is_prev_action_listen_in_state(state):
                 state_features.update(
-                    self._extract_state_features(sub_state, interpreter, sparse=True)
+                    self._features_for_sub_state(sub_state, interpreter, sparse=True)
                 )
                 if sub_state.get(ENTITIES):
                     state_features[ENTITIES] = self._create_features(
@@ -218,15 +321,18 @@ class SingleStateFeaturizer:
 
         return state_features
 
+    def _action_as_sub_state(self, action: Text) -> SubState:
+        if action in self.action_texts:
+            return {ACTION_TEXT: action}
+
+        return {ACTION_NAME: action}
+
     def _encode_action(
         self, action: Text, interpreter: NaturalLanguageInterpreter
     ) -> Dict[Text, List["Features"]]:
-        if action in self.action_texts:
-            action_as_sub_state = {ACTION_TEXT: action}
-        else:
-            action_as_sub_state = {ACTION_NAME: action}
-
-        return self._extract_state_features(action_as_sub_state, interpreter)
+        return self._features_for_sub_state(
+            self._action_as_sub_state(action), interpreter
+        )
 
     def encode_all_actions(
         self, domain: Domain, interpreter: NaturalLanguageInterpreter
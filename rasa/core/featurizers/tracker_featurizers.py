@@ -4,14 +4,18 @@ import os
 
 from rasa.shared.nlu.constants import TEXT
 from tqdm import tqdm
-from typing import Tuple, List, Optional, Dict, Text
+from typing import Any, Tuple, List, Optional, Dict, Text
 import numpy as np
 
 import rasa.utils.io as io_utils
 import rasa.utils.common as common_utils
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
+from rasa.core.featurizers.training_states import (
+    Examples,
+    TrackerStates,
+    TrainingStates,
+)
 from rasa.core.domain import Domain, State
-from rasa.core.events import ActionExecuted
 from rasa.core.trackers import DialogueStateTracker
 from rasa.core.interpreter import NaturalLanguageInterpreter
 from rasa.core.constants import USER
@@ -60,6 +64,19 @@ class TrackerFeaturizer:
         """
         return tracker.past_states(domain)
 
+    @staticmethod
+    def _training_states_for(
+        domain: Domain, training_states: Optional[TrainingStates]
+    ) -> TrainingStates:
+        if training_states is None or training_states.domain is not domain:
+            return TrainingStates(domain)
+
+        return training_states
+
+    def _featurizer_key(self) -> Tuple[Any, ...]:
+        """Everything apart from the trackers which the training examples depend on."""
+        return (type(self).__name__,)
+
     def _featurize_states(
         self,
         trackers_as_states: List[List[State]],
@@ -87,20 +104,50 @@ class TrackerFeaturizer:
             ]
         )
 
+    def _create_examples(
+        self,
+        trackers: List[DialogueStateTracker],
+        trackers_states: List[TrackerStates],
+    ) -> Examples:
+        """Create training examples from the states and actions of the trackers.
+
+        Args:
+            trackers: The trackers to transform
+            trackers_states: The states and actions of each tracker
+
+        Returns:
+            A tuple of list of frozen states and list of actions.
+        """
+        raise NotImplementedError(
+            "Featurizer must have the capacity to encode trackers to feature vectors"
+        )
+
     def training_states_and_actions(
-        self, trackers: List[DialogueStateTracker], domain: Domain
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        training_states: Optional[TrainingStates] = None,
     ) -> Tuple[List[List[State]], List[List[Text]]]:
         """Transforms list of trackers to lists of states and actions.
 
         Args:
             trackers: The trackers to transform
             domain: The domain
+            training_states: States of the training trackers which are shared
+                between the policies of an ensemble.
 
         Returns:
             A tuple of list of states and list of actions.
         """
-        raise NotImplementedError(
-            "Featurizer must have the capacity to encode trackers to feature vectors"
+        logger.debug(
+            "Creating states and action examples from "
+            "collected trackers (by {}({}))..."
+            "".format(type(self).__name__, type(self.state_featurizer).__name__)
+        )
+        training_states = self._training_states_for(domain, training_states)
+
+        return training_states.examples(
+            trackers, self._featurizer_key(), self._create_examples
         )
 
     def featurize_trackers(
@@ -108,6 +155,7 @@ class TrackerFeaturizer:
         trackers: List[DialogueStateTracker],
         domain: Domain,
         interpreter: NaturalLanguageInterpreter,
+        training_states: Optional[TrainingStates] = None,
     ) -> Tuple[List[List[Dict[Text, List["Features"]]]], np.ndarray]:
         """Featurize the training trackers.
 
@@ -115,6 +163,8 @@ class TrackerFeaturizer:
             trackers: list of training trackers
             domain: the domain
             interpreter: the interpreter
+            training_states: states of the training trackers which are shared
+                between the policies of an ensemble
 
         Returns:
             - a dictionary of state types (INTENT, TEXT, ACTION_NAME, ACTION_TEXT,
@@ -131,10 +181,10 @@ class TrackerFeaturizer:
                 f"to get numerical features for trackers."
             )
 
-        self.state_featurizer.prepare_from_domain(domain)
+        self.state_featurizer.prepare_from_domain(domain, interpreter)
 
         trackers_as_states, trackers_as_actions = self.training_states_and_actions(
-            trackers, domain
+            trackers, domain, training_states
         )
 
         tracker_state_features = self._featurize_states(trackers_as_states, interpreter)
@@ -190,6 +240,8 @@ class TrackerFeaturizer:
 
         # noinspection PyTypeChecker
         io_utils.write_text_file(str(jsonpickle.encode(self)), featurizer_file)
+        if self.state_featurizer is not None:
+            self.state_featurizer.persist_features(path)
 
     @staticmethod
     def load(path: Text) -> Optional["TrackerFeaturizer"]:
@@ -203,7 +255,10 @@ class TrackerFeaturizer:
         """
         featurizer_file = os.path.join(path, "featurizer.json")
         if os.path.isfile(featurizer_file):
-            return jsonpickle.decode(io_utils.read_file(featurizer_file))
+            featurizer = jsonpickle.decode(io_utils.read_file(featurizer_file))
+            if featurizer.state_featurizer is not None:
+                featurizer.state_featurizer.load_features(path)
+            return featurizer
 
         logger.error(
             f"Couldn't load featurizer for policy. "
@@ -219,47 +274,43 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
     Training data is padded up to the length of the longest dialogue with -1.
     """
 
-    def training_states_and_actions(
-        self, trackers: List[DialogueStateTracker], domain: Domain
-    ) -> Tuple[List[List[State]], List[List[Text]]]:
-        """Transforms list of trackers to lists of states and actions.
+    def _create_examples(
+        self,
+        trackers: List[DialogueStateTracker],
+        trackers_states: List[TrackerStates],
+    ) -> Examples:
+        """Create one training example per tracker.
 
         Training data is padded up to the length of the longest dialogue with -1.
 
         Args:
             trackers: The trackers to transform
-            domain: The domain
+            trackers_states: The states and actions of each tracker
 
         Returns:
-            A tuple of list of states and list of actions.
+            A tuple of list of frozen states and list of actions.
         """
 
         trackers_as_states = []
         trackers_as_actions = []
 
-        logger.debug(
-            "Creating states and action examples from "
-            "collected trackers (by {}({}))..."
-            "".format(type(self).__name__, type(self.state_featurizer).__name__)
-        )
         pbar = tqdm(
-            trackers,
+            list(zip(trackers, trackers_states)),
             desc="Processed trackers",
             disable=common_utils.is_logging_disabled(),
         )
-        for tracker in pbar:
-            states = self._create_states(tracker, domain)
+        for tracker, tracker_states in pbar:
+            states = tracker_states.states
 
             delete_first_state = False
             actions = []
-            for event in tracker.applied_events():
-                if not isinstance(event, ActionExecuted):
-                    continue
-
-                if not event.unpredictable:
+            for action, predictable in zip(
+                tracker_states.actions, tracker_states.predictable
+            ):
+                if predictable:
                     # only actions which can be
                     # predicted at a stories start
-                    actions.append(event.action_name or event.action_text)
+                    actions.append(action)
                 else:
                     # unpredictable actions can be
                     # only the first in the story
@@ -343,30 +394,22 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
 
         return states[-slice_length:]
 
-    @staticmethod
-    def _hash_example(
-        states: List[State], action: Text, tracker: DialogueStateTracker
-    ) -> int:
-        """Hash states for efficient deduplication."""
-        frozen_states = tuple(
-            s if s is None else tracker.freeze_current_state(s) for s in states
-        )
-        frozen_actions = (action,)
-        return hash((frozen_states, frozen_actions))
+    def _featurizer_key(self) -> Tuple[Any, ...]:
+        return (type(self).__name__, self.max_history, self.remove_duplicates)
 
-    def training_states_and_actions(
-        self, trackers: List[DialogueStateTracker], domain: Domain
-    ) -> Tuple[List[List[State]], List[List[Text]]]:
-        """Transforms list of trackers to lists of states and actions.
-
-        Training data is padded up to the length of the longest dialogue with -1.
+    def _create_examples(
+        self,
+        trackers: List[DialogueStateTracker],
+        trackers_states: List[TrackerStates],
+    ) -> Examples:
+        """Create a training example for every predictable action of the trackers.
 
         Args:
             trackers: The trackers to transform
-            domain: The domain
+            trackers_states: The states and actions of each tracker
 
         Returns:
-            A tuple of list of states and list of actions.
+            A tuple of list of frozen states and list of actions.
         """
 
         trackers_as_states = []
@@ -376,49 +419,40 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         # we only need to keep one.
         hashed_examples = set()
 
-        logger.debug(
-            "Creating states and action examples from "
-            "collected trackers (by {}({}))..."
-            "".format(type(self).__name__, type(self.state_featurizer).__name__)
-        )
         pbar = tqdm(
-            trackers,
+            trackers_states,
             desc="Processed trackers",
             disable=common_utils.is_logging_disabled(),
         )
-        for tracker in pbar:
-            states = self._create_states(tracker, domain)
+        for tracker_states in pbar:
+            states = tracker_states.states
 
             states_length_for_action = 0
-            for event in tracker.applied_events():
-                if not isinstance(event, ActionExecuted):
-                    continue
-
+            for action, predictable in zip(
+                tracker_states.actions, tracker_states.predictable
+            ):
                 states_length_for_action += 1
 
                 # use only actions which can be predicted at a stories start
-                if event.unpredictable:
+                if not predictable:
                     continue
 
                 sliced_states = self.slice_state_history(
                     states[:states_length_for_action], self.max_history
                 )
                 if self.remove_duplicates:
-                    hashed = self._hash_example(
-                        sliced_states, event.action_name or event.action_text, tracker
-                    )
+                    # states are frozen already and can be hashed directly
+                    hashed = hash((sliced_states, (action,)))
 
                     # only continue with tracker_states that created a
                     # hashed_featurization we haven't observed
                     if hashed not in hashed_examples:
                         hashed_examples.add(hashed)
                         trackers_as_states.append(sliced_states)
-                        trackers_as_actions.append(
-                            [event.action_name or event.action_text]
-                        )
+                        trackers_as_actions.append([action])
                 else:
                     trackers_as_states.append(sliced_states)
-                    trackers_as_actions.append([event.action_name or event.action_text])
+                    trackers_as_actions.append([action])
 
                 pbar.set_postfix({"# actions": "{:d}".format(len(trackers_as_actions))})
 
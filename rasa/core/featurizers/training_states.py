@@ -0,0 +1,206 @@
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Text, Tuple
+
+import rasa
+from rasa.constants import DEFAULT_MAX_CACHE_SIZE_IN_MB
+from rasa.core.domain import Domain, State
+from rasa.core.events import ActionExecuted
+from rasa.core.trackers import DialogueStateTracker, FrozenState
+from rasa.utils.io import DiskCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+TRAINING_STATES_SUBDIRECTORY = "core_training_states"
+
+# states of training examples and the actions which are predicted from them
+Examples = Tuple[List[Tuple[FrozenState, ...]], List[List[Text]]]
+
+
+def _tracker_key(tracker: DialogueStateTracker) -> Text:
+    """Return a key which changes whenever the history of `tracker` changes."""
+
+    events = []
+    for event in tracker.events:
+        event_as_dict = event.as_dict()
+        # stories are timestamped whenever they are read
+        event_as_dict.pop("timestamp", None)
+        events.append(event_as_dict)
+
+    return cache_key(events)
+
+
+def unfreeze_states(frozen_states: Tuple[FrozenState, ...]) -> List[State]:
+    """Turn frozen states back into states which can be modified."""
+
+    return [
+        {key: dict(value) for key, value in dict(frozen_state).items()}
+        for frozen_state in frozen_states
+    ]
+
+
+class TrackerStates(NamedTuple):
+    """States and actions of the history of a training tracker."""
+
+    # state before each executed action
+    states: Tuple[FrozenState, ...]
+    # name or text of each executed action
+    actions: Tuple[Text, ...]
+    # whether each action can be predicted, i.e. it's not the first action of a
+    # story which starts with a checkpoint
+    predictable: Tuple[bool, ...]
+
+
+class TrainingStates:
+    """Computes the states and actions of training trackers once per training.
+
+    All policies of an ensemble are trained on the same trackers. Instead of
+    creating the states and actions of each tracker again for every policy, they
+    are created once and shared. Tracker featurizers can additionally share the
+    training examples they created from the states if their configuration is the
+    same, e.g. if two policies use the same `max_history`.
+
+    The states and actions of each tracker are keyed by the events of the tracker.
+    If a cache directory is given, they are stored per domain after the training,
+    so that the next training with the same domain only has to create the states
+    of changed stories.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        cache_dir: Optional[Text] = None,
+        max_size_in_mb: float = DEFAULT_MAX_CACHE_SIZE_IN_MB,
+    ) -> None:
+        self.domain = domain
+        self.disk_cache = (
+            DiskCache(cache_dir, TRAINING_STATES_SUBDIRECTORY, max_size_in_mb)
+            if cache_dir
+            else None
+        )
+
+        self._cache_key = cache_key([rasa.__version__, domain.fingerprint])
+        self._tracker_states: Dict[Text, TrackerStates] = self._load()
+        self._used_tracker_keys = set()
+        self._has_new_tracker_states = False
+        # trackers are referenced as well so that their ids can't be reused
+        self._keys_by_tracker_id: Dict[int, Tuple[DialogueStateTracker, Text]] = {}
+        self._examples: Dict[Any, Examples] = {}
+
+    @classmethod
+    def from_environment(cls, domain: Domain) -> "TrainingStates":
+        """Create the training states configured by environment variables.
+
+        Setting the maximum cache size to 0 keeps the training states in memory only.
+        """
+        disk_cache = DiskCache.from_environment(TRAINING_STATES_SUBDIRECTORY)
+        if disk_cache is None:
+            return cls(domain)
+
+        return cls(domain, str(disk_cache.cache_dir), disk_cache.max_size_in_mb)
+
+    def _key_for(self, tracker: DialogueStateTracker) -> Text:
+        tracker_and_key = self._keys_by_tracker_id.get(id(tracker))
+        if tracker_and_key is None:
+            tracker_and_key = (tracker, _tracker_key(tracker))
+            self._keys_by_tracker_id[id(tracker)] = tracker_and_key
+
+        return tracker_and_key[1]
+
+    @staticmethod
+    def _create_tracker_states(
+        tracker: DialogueStateTracker, domain: Domain
+    ) -> TrackerStates:
+        states = tuple(
+            tracker.freeze_current_state(state) for state in tracker.past_states(domain)
+        )
+        executed_actions = [
+            event
+            for event in tracker.applied_events()
+            if isinstance(event, ActionExecuted)
+        ]
+
+        return TrackerStates(
+            states,
+            tuple(event.action_name or event.action_text for event in executed_actions),
+            tuple(not event.unpredictable for event in executed_actions),
+        )
+
+    def for_tracker(self, tracker: DialogueStateTracker) -> TrackerStates:
+        """Return the states and actions of a training tracker.
+
+        Args:
+            tracker: A training tracker.
+
+        Returns:
+            The states before each action of the tracker and the actions.
+        """
+        key = self._key_for(tracker)
+        self._used_tracker_keys.add(key)
+
+        tracker_states = self._tracker_states.get(key)
+        if tracker_states is None:
+            tracker_states = self._create_tracker_states(tracker, self.domain)
+            self._tracker_states[key] = tracker_states
+            self._has_new_tracker_states = True
+
+        return tracker_states
+
+    def examples(
+        self,
+        trackers: List[DialogueStateTracker],
+        featurizer_key: Any,
+        create_examples: Callable[
+            [List[DialogueStateTracker], List[TrackerStates]], Examples
+        ],
+    ) -> Tuple[List[List[State]], List[List[Text]]]:
+        """Return the training examples which a tracker featurizer creates.
+
+        Args:
+            trackers: The training trackers.
+            featurizer_key: Everything the examples depend on apart from the
+                trackers, e.g. the type and configuration of the featurizer.
+            create_examples: Creates the frozen states and actions of the
+                training examples from the trackers and their states and actions.
+
+        Returns:
+            The states and actions of the training examples.
+        """
+        key = (featurizer_key, tuple(self._key_for(tracker) for tracker in trackers))
+        examples = self._examples.get(key)
+        if examples is None:
+            examples = create_examples(
+                trackers, [self.for_tracker(tracker) for tracker in trackers]
+            )
+            self._examples[key] = examples
+
+        frozen_states, actions = examples
+
+        # callers might modify the examples
+        return (
+            [unfreeze_states(states) for states in frozen_states],
+            [list(example_actions) for example_actions in actions],
+        )
+
+    def _load(self) -> Dict[Text, TrackerStates]:
+        if not self.disk_cache:
+            return {}
+
+        return self.disk_cache.load(self._cache_key) or {}
+
+    def persist(self) -> None:
+        """Store the states of the trackers which were used in this training.
+
+        States of trackers which weren't used (e.g. of deleted stories) are dropped.
+        """
+        if not self.disk_cache or not (
+            self._has_new_tracker_states
+            or len(self._used_tracker_keys) < len(self._tracker_states)
+        ):
+            return
+
+        tracker_states = {
+            key: states
+            for key, states in self._tracker_states.items()
+            if key in self._used_tracker_keys
+        }
+        self.disk_cache.save(self._cache_key, tracker_states)
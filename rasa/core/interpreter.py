@@ -1,13 +1,16 @@
+import asyncio
+from asyncio import AbstractEventLoop, Future, TimerHandle
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from json import JSONDecodeError
 
-import aiohttp
 
 import json
 import logging
 import re
 
 import os
-from typing import Text, List, Dict, Any, Union, Optional, Tuple
+from typing import Text, List, Dict, Any, Union, Optional, Tuple, Callable
 
 from rasa.constants import DOCS_URL_STORIES
 from rasa.core import constants
@@ -35,14 +38,27 @@ class NaturalLanguageInterpreter:
 
     @staticmethod
     def create(
-        obj: Union["NaturalLanguageInterpreter", EndpointConfig, Text, None]
+        obj: Union["NaturalLanguageInterpreter", EndpointConfig, Text, None],
+        inference_config: Optional[EndpointConfig] = None,
     ) -> "NaturalLanguageInterpreter":
-        """Factory to create an natural language interpreter."""
+        """Factory to create an natural language interpreter.
+
+        Args:
+            obj: An interpreter, the path to a NLU model or the endpoint configuration
+                of an interpreter.
+            inference_config: Configuration of the `InferenceScheduler` which is
+                used if a local NLU model is loaded.
+
+        Returns:
+            The interpreter.
+        """
 
         if isinstance(obj, NaturalLanguageInterpreter):
             return obj
         elif isinstance(obj, str) and os.path.exists(obj):
-            return RasaNLUInterpreter(model_directory=obj)
+            return RasaNLUInterpreter(
+                model_directory=obj, inference_config=inference_config
+            )
         elif isinstance(obj, str) and not os.path.exists(obj):
             # user passed in a string, but file does not exist
             logger.warning(
@@ -55,6 +71,10 @@ class NaturalLanguageInterpreter:
     def featurize_message(self, message: Message) -> Optional[Message]:
         pass
 
+    def close(self) -> None:
+        """Release the resources of the interpreter once it is no longer used."""
+        pass
+
 
 class RegexInterpreter(NaturalLanguageInterpreter):
     @staticmethod
@@ -232,17 +252,17 @@ class RasaNLUHttpInterpreter(NaturalLanguageInterpreter):
 
         # noinspection PyBroadException
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=params) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    else:
-                        response_text = await resp.text()
-                        logger.error(
-                            f"Failed to parse text '{text}' using rasa NLU over "
-                            f"http. Error: {response_text}"
-                        )
-                        return None
+            session = self.endpoint_config.pooled_session()
+            async with session.post(url, json=params) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+                else:
+                    response_text = await resp.text()
+                    logger.error(
+                        f"Failed to parse text '{text}' using rasa NLU over "
+                        f"http. Error: {response_text}"
+                    )
+                    return None
         except Exception:  # skipcq: PYL-W0703
             # need to catch all possible exceptions when doing http requests
             # (timeouts, value errors, parser errors, ...)
@@ -250,16 +270,200 @@ class RasaNLUHttpInterpreter(NaturalLanguageInterpreter):
             return None
 
 
+class InferenceScheduler:
+    """Runs NLU inference in a thread pool instead of the event loop.
+
+    Messages which are parsed concurrently are collected into batches. A batch is
+    handed to a worker thread as soon as it reached `max_batch_size` messages or
+    its first message waited for `max_wait_time_in_ms`. While all workers are busy,
+    new messages are collected into the next batch.
+    """
+
+    def __init__(
+        self,
+        parse_batch: Callable[[List[Text]], List[Union[Dict[Text, Any], Exception]]],
+        max_batch_size: int = constants.DEFAULT_NLU_INFERENCE_MAX_BATCH_SIZE,
+        max_wait_time_in_ms: float = constants.DEFAULT_NLU_INFERENCE_MAX_WAIT_TIME_IN_MS,
+        workers: int = constants.DEFAULT_NLU_INFERENCE_WORKERS,
+    ) -> None:
+        """Create the scheduler.
+
+        Args:
+            parse_batch: Function which parses a batch of messages in a worker thread.
+                It returns the parse result or the raised exception per message.
+            max_batch_size: Maximum number of messages which are parsed together.
+            max_wait_time_in_ms: Maximum time a message waits for further messages
+                before its batch is parsed.
+            workers: Number of threads which parse batches.
+        """
+        self._parse_batch = parse_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_time_in_seconds = max(0.0, max_wait_time_in_ms / 1000)
+        self.workers = max(1, workers)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="nlu_inference"
+        )
+        self._pending: List[Tuple[Text, Future]] = []
+        self._flush_handle: Optional[TimerHandle] = None
+        self._running_batches = 0
+        self._loop: Optional[AbstractEventLoop] = None
+        self._closed = False
+
+    @classmethod
+    def from_endpoint_config(
+        cls,
+        parse_batch: Callable[[List[Text]], List[Union[Dict[Text, Any], Exception]]],
+        endpoint_config: Optional[EndpointConfig],
+    ) -> "InferenceScheduler":
+        """Create the scheduler from the `nlu_inference` section of `endpoints.yml`.
+
+        Args:
+            parse_batch: Function which parses a batch of messages in a worker thread.
+            endpoint_config: The configuration of the scheduler.
+
+        Returns:
+            The scheduler.
+        """
+        kwargs = endpoint_config.kwargs if endpoint_config else {}
+
+        return cls(
+            parse_batch,
+            max_batch_size=int(
+                kwargs.get(
+                    "max_batch_size", constants.DEFAULT_NLU_INFERENCE_MAX_BATCH_SIZE
+                )
+            ),
+            max_wait_time_in_ms=float(
+                kwargs.get(
+                    "max_wait_time_in_ms",
+                    constants.DEFAULT_NLU_INFERENCE_MAX_WAIT_TIME_IN_MS,
+                )
+            ),
+            workers=int(kwargs.get("workers", constants.DEFAULT_NLU_INFERENCE_WORKERS)),
+        )
+
+    async def parse(self, text: Text) -> Dict[Text, Any]:
+        """Parse a message together with concurrently parsed messages.
+
+        Args:
+            text: The message.
+
+        Returns:
+            The parse result.
+        """
+        loop = asyncio.get_event_loop()
+
+        if self._closed:
+            # interpreters which were replaced can still be in use by messages
+            # which were received before the replacement
+            results = await loop.run_in_executor(None, self._parse_batch, [text])
+            if isinstance(results[0], Exception):
+                raise results[0]
+            return results[0]
+
+        if loop is not self._loop:
+            self._reset(loop)
+
+        result = loop.create_future()
+        self._pending.append((text, result))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(loop)
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.max_wait_time_in_seconds, self._flush, loop
+            )
+
+        return await result
+
+    def _reset(self, loop: AbstractEventLoop) -> None:
+        # the timer, the pending messages and the running batches of a previous
+        # event loop are never handled once the loop is replaced
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = []
+        self._running_batches = 0
+        self._loop = loop
+
+    def _flush(self, loop: AbstractEventLoop, all_pending: bool = False) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # batches which can't be parsed right away keep collecting messages until
+        # one of the running batches is finished
+        while self._pending and (
+            all_pending or self._running_batches < self.workers
+        ):
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+
+            self._running_batches += 1
+            texts = [text for text, _ in batch]
+            parsed = loop.run_in_executor(self._executor, self._parse_batch, texts)
+            parsed.add_done_callback(partial(self._set_results, loop, batch))
+
+    def _set_results(
+        self, loop: AbstractEventLoop, batch: List[Tuple[Text, Future]], parsed: Future,
+    ) -> None:
+        if loop is not self._loop:
+            return
+
+        self._running_batches -= 1
+
+        if parsed.exception() is not None:
+            results = [parsed.exception()] * len(batch)
+        else:
+            results = parsed.result()
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # the caller stopped waiting for the result
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        if self._pending and self._flush_handle is None and not self._closed:
+            self._flush(loop)
+
+    def close(self) -> None:
+        """Stop the worker threads once all scheduled messages were parsed.
+
+        Messages which are parsed after the scheduler was closed are parsed
+        one by one in the default executor of the event loop.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._pending and self._loop is not None and not self._loop.is_closed():
+            self._flush(self._loop, all_pending=True)
+        elif self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        self._executor.shutdown(wait=False)
+
+
 class RasaNLUInterpreter(NaturalLanguageInterpreter):
     def __init__(
         self,
         model_directory: Text,
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        inference_config: Optional[EndpointConfig] = None,
     ):
         self.model_directory = model_directory
         self.lazy_init = lazy_init
         self.config_file = config_file
+        self.inference_config = inference_config
+        self.inference_scheduler = InferenceScheduler.from_endpoint_config(
+            self._parse_batch, inference_config
+        )
 
         if not lazy_init:
             self._load_interpreter()
@@ -274,14 +478,44 @@ class RasaNLUInterpreter(NaturalLanguageInterpreter):
     ) -> Dict[Text, Any]:
         """Parse a text message.
 
+        The message is parsed in a worker thread so that the event loop is not
+        blocked. Concurrently received messages are parsed in batches.
+
         Return a default value if the parsing of the text failed."""
 
         if self.lazy_init and self.interpreter is None:
             self._load_interpreter()
 
-        result = self.interpreter.parse(text)
+        return await self.inference_scheduler.parse(text)
 
-        return result
+    def _parse_batch(
+        self, texts: List[Text]
+    ) -> List[Union[Dict[Text, Any], Exception]]:
+        # noinspection PyBroadException
+        try:
+            return self.interpreter.parse_batch(texts)
+        except Exception:  # skipcq: PYL-W0703
+            if len(texts) == 1:
+                raise
+            logger.debug(
+                "Failed to parse a batch of messages. Parsing them one by one "
+                "to find the message which can't be parsed."
+            )
+
+        results = []
+        for text in texts:
+            # a message which can't be parsed must not fail the rest of the batch
+            # noinspection PyBroadException
+            try:
+                results.append(self.interpreter.parse(text))
+            except Exception as e:  # skipcq: PYL-W0703
+                results.append(e)
+
+        return results
+
+    def close(self) -> None:
+        """Stop the threads which parse messages for this interpreter."""
+        self.inference_scheduler.close()
 
     def featurize_message(self, message: Message) -> Optional[Message]:
         """Featurize message using a trained NLU pipeline.
@@ -2,15 +2,33 @@ import asyncio
 import json
 import logging
 import os
+import threading
+import typing
+from collections import defaultdict
 
 from async_generator import asynccontextmanager
-from typing import Text, Union, Optional, AsyncGenerator
+from typing import (
+    Text,
+    Union,
+    Optional,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    TypeVar,
+    Any,
+)
 
 import rasa.shared.utils.common
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
 from rasa.core.lock import TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
+if typing.TYPE_CHECKING:
+    from redis import StrictRedis
+    from redis.client import Pipeline
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +39,11 @@ def _get_lock_lifetime() -> int:
 LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
+# Redis channel on which released conversation locks are announced
+LOCK_RELEASED_CHANNEL = "rasa_lock_released"
+
+T = TypeVar("T")
+
 
 # noinspection PyUnresolvedReferences
 class LockError(Exception):
@@ -91,7 +114,7 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
+        Try acquiring lock with a wait time of at most `wait_time_in_seconds` seconds
         between attempts. Raise a `LockError` if lock has expired.
         """
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
@@ -125,14 +148,27 @@ class LockStore:
                 f"Retrying..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
+            # wait for the lock to be released and update lock
+            await self._wait_for_lock_release(
+                conversation_id, ticket, wait_time_in_seconds
+            )
             self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
+    ) -> None:
+        """Wait until `ticket` might be served or `wait_time_in_seconds` passed.
+
+        Lock stores which are able to notify waiting tickets about released locks
+        override this to return as soon as the lock was released.
+        """
+
+        await asyncio.sleep(wait_time_in_seconds)
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
 
@@ -188,8 +224,78 @@ class LockStore:
             logger.debug(f"Could not delete lock for conversation '{conversation_id}'.")
 
 
+class _LockReleaseListener:
+    """Subscribes to released locks and wakes up the tickets waiting for them.
+
+    Messages are received in a background thread. Waiting tickets are woken up
+    within the event loop they are waiting in.
+    """
+
+    def __init__(self, red: "StrictRedis", channel: Text) -> None:
+        self._waiters: Dict[
+            Text, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+        ] = defaultdict(list)
+        self._waiters_lock = threading.Lock()
+
+        self._pubsub = red.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{channel: self._on_lock_released})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=DEFAULT_SOCKET_TIMEOUT_IN_SECONDS / 2, daemon=True
+        )
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        self._thread.stop()
+
+    def register(self, conversation_id: Text) -> asyncio.Future:
+        """Return a future which is resolved once `conversation_id` is released."""
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        with self._waiters_lock:
+            self._waiters[conversation_id].append((loop, future))
+
+        return future
+
+    def unregister(self, conversation_id: Text, future: asyncio.Future) -> None:
+        with self._waiters_lock:
+            waiters = self._waiters.get(conversation_id)
+            if not waiters:
+                return
+
+            waiters[:] = [(loop, f) for loop, f in waiters if f is not future]
+            if not waiters:
+                del self._waiters[conversation_id]
+
+    def _on_lock_released(self, message: Dict[Text, Any]) -> None:
+        conversation_id = message["data"].decode()
+        with self._waiters_lock:
+            waiters = self._waiters.pop(conversation_id, [])
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future)
+            except RuntimeError:
+                # the event loop of the waiting ticket was closed in the meantime
+                pass
+
+
+def _resolve_future(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
 class RedisLockStore(LockStore):
-    """Redis store for ticket locks."""
+    """Redis store for ticket locks.
+
+    Locks are modified within optimistic Redis transactions, so tickets are
+    issued and served in order across multiple Rasa servers. Released locks are
+    published on a Redis channel to wake up waiting tickets immediately.
+    """
+
+    _lock_release_listener: Optional[_LockReleaseListener] = None
 
     def __init__(
         self,
@@ -235,7 +341,161 @@ class RedisLockStore(LockStore):
         self._log_deletion(conversation_id, deletion_successful)
 
     def save_lock(self, lock: TicketLock) -> None:
-        self.red.set(lock.conversation_id, lock.dumps())
+        self._save_lock(self.red, lock)
+
+    @staticmethod
+    def _save_lock(red: Union["StrictRedis", "Pipeline"], lock: TicketLock) -> None:
+        red.set(lock.conversation_id, lock.dumps())
+
+        # let Redis remove abandoned locks once their last ticket expired
+        if lock.tickets:
+            expires = max(ticket.expires for ticket in lock.tickets)
+            red.pexpireat(lock.conversation_id, int(expires * 1000))
+
+    def _modify_lock(
+        self,
+        conversation_id: Text,
+        modify: Callable[[TicketLock], T],
+        create_if_missing: bool = False,
+        notify_release: bool = False,
+        delete_if_unused: bool = False,
+    ) -> Optional[T]:
+        """Atomically fetch, modify and save the lock for `conversation_id`.
+
+        The lock is watched while it is modified. In case another Rasa server
+        changes it in the meantime, the modification is retried.
+
+        Args:
+            conversation_id: ID of the conversation whose lock is modified.
+            modify: Function which modifies the lock and returns the result.
+            create_if_missing: If `True`, a new lock is created in case there is none.
+            notify_release: If `True`, waiting tickets are notified that the lock
+                was released.
+            delete_if_unused: If `True`, the lock is deleted in case no one is waiting
+                for it anymore.
+
+        Returns:
+            The result of `modify` or `None` if there was no lock to modify.
+        """
+
+        def transaction(pipe: "Pipeline") -> Optional[Tuple[T, bool]]:
+            if create_if_missing:
+                lock = self.get_or_create_lock(conversation_id)
+            else:
+                lock = self.get_lock(conversation_id)
+
+            if not lock:
+                return None
+
+            result = modify(lock)
+
+            pipe.multi()
+            deleted = delete_if_unused and not lock.is_someone_waiting()
+            if deleted:
+                pipe.delete(conversation_id)
+            else:
+                self._save_lock(pipe, lock)
+
+            if notify_release:
+                pipe.publish(LOCK_RELEASED_CHANNEL, conversation_id)
+
+            return result, deleted
+
+        outcome = self.red.transaction(
+            transaction, conversation_id, value_from_callable=True
+        )
+        if outcome is None:
+            return None
+
+        result, deleted = outcome
+        if delete_if_unused:
+            self._log_deletion(conversation_id, deleted)
+
+        return result
+
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
+        try:
+            return self._modify_lock(
+                conversation_id,
+                lambda lock: lock.issue_ticket(lock_lifetime),
+                create_if_missing=True,
+            )
+        except Exception as e:
+            raise LockError(f"Error while acquiring lock. Error:\n{e}")
+
+    def update_lock(self, conversation_id: Text) -> None:
+        self._modify_lock(conversation_id, TicketLock.remove_expired_tickets)
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        self._modify_lock(
+            conversation_id,
+            lambda lock: lock.remove_ticket_for(ticket_number),
+            notify_release=True,
+        )
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        self._modify_lock(
+            conversation_id,
+            lambda lock: lock.remove_ticket_for(ticket_number),
+            notify_release=True,
+            delete_if_unused=True,
+        )
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
+    ) -> None:
+        listener = self._get_lock_release_listener()
+        if not listener:
+            await super()._wait_for_lock_release(
+                conversation_id, ticket, wait_time_in_seconds
+            )
+            return
+
+        # register before checking the lock so that no release is missed
+        released = listener.register(conversation_id)
+        try:
+            lock = self.get_lock(conversation_id)
+            if lock and lock.is_locked(ticket):
+                await asyncio.wait_for(released, wait_time_in_seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            listener.unregister(conversation_id, released)
+
+    def _get_lock_release_listener(self) -> Optional[_LockReleaseListener]:
+        """Return the running listener for released locks and start it if needed.
+
+        Returns `None` if the listener can't be started. Waiting tickets then
+        poll the lock instead.
+        """
+        import redis
+
+        listener = self._lock_release_listener
+        if listener and listener.is_running():
+            return listener
+
+        try:
+            self._lock_release_listener = _LockReleaseListener(
+                self.red, LOCK_RELEASED_CHANNEL
+            )
+        except redis.exceptions.RedisError as e:
+            logger.warning(
+                f"Failed to subscribe to released locks. Waiting tickets will poll "
+                f"their lock instead. Error: {e}"
+            )
+            self._lock_release_listener = None
+
+        return self._lock_release_listener
+
+    def close(self) -> None:
+        """Stop listening for released locks."""
+
+        if self._lock_release_listener:
+            self._lock_release_listener.stop()
+            self._lock_release_listener = None
 
 
 class InMemoryLockStore(LockStore):
@@ -243,6 +503,9 @@ class InMemoryLockStore(LockStore):
 
     def __init__(self) -> None:
         self.conversation_locks = {}
+        self._lock_release_conditions: Dict[
+            Text, Tuple[asyncio.AbstractEventLoop, asyncio.Condition]
+        ] = {}
         super().__init__()
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
@@ -250,6 +513,7 @@ class InMemoryLockStore(LockStore):
 
     def delete_lock(self, conversation_id: Text) -> None:
         deleted_lock = self.conversation_locks.pop(conversation_id, None)
+        self._lock_release_conditions.pop(conversation_id, None)
         self._log_deletion(
             conversation_id, deletion_successful=deleted_lock is not None
         )
@@ -257,6 +521,50 @@ class InMemoryLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.conversation_locks[lock.conversation_id] = lock
 
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        super().finish_serving(conversation_id, ticket_number)
+        self._notify_lock_release(conversation_id)
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
+    ) -> None:
+        def is_released() -> bool:
+            lock = self.get_lock(conversation_id)
+            return not lock or not lock.is_locked(ticket)
+
+        condition = self._lock_release_condition(conversation_id)
+        async with condition:
+            try:
+                await asyncio.wait_for(
+                    condition.wait_for(is_released), wait_time_in_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def _lock_release_condition(self, conversation_id: Text) -> asyncio.Condition:
+        loop = asyncio.get_event_loop()
+        loop_and_condition = self._lock_release_conditions.get(conversation_id)
+
+        # conditions are bound to the event loop they were created in
+        if not loop_and_condition or loop_and_condition[0] is not loop:
+            loop_and_condition = (loop, asyncio.Condition())
+            self._lock_release_conditions[conversation_id] = loop_and_condition
+
+        return loop_and_condition[1]
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        loop_and_condition = self._lock_release_conditions.get(conversation_id)
+        if not loop_and_condition or loop_and_condition[0].is_closed():
+            return
+
+        loop, condition = loop_and_condition
+        loop.create_task(self._notify_all(condition))
+
+    @staticmethod
+    async def _notify_all(condition: asyncio.Condition) -> None:
+        async with condition:
+            condition.notify_all()
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
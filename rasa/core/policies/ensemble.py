@@ -29,6 +29,7 @@ from rasa.core.domain import Domain, InvalidDomain
 from rasa.core.events import SlotSet, ActionExecuted, ActionExecutionRejected, Event
 from rasa.core.exceptions import UnsupportedDialogueModelError
 from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
+from rasa.core.featurizers.training_states import TrainingStates
 from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.policies.policy import Policy, SupportedData
 from rasa.core.policies.fallback import FallbackPolicy
@@ -190,19 +191,34 @@ class PolicyEnsemble:
         training_trackers: List[DialogueStateTracker],
         domain: Domain,
         interpreter: NaturalLanguageInterpreter,
+        training_states: Optional[TrainingStates] = None,
         **kwargs: Any,
     ) -> None:
+        """Train all policies of the ensemble.
+
+        The states of the training trackers are created once and shared by all
+        policies. Pass `training_states` to reuse them between trainings.
+        """
         if training_trackers:
             self._emit_rule_policy_warning(training_trackers)
 
+            if training_states is None:
+                training_states = TrainingStates(domain)
+
             for policy in self.policies:
                 trackers_to_train = SupportedData.trackers_for_policy(
                     policy, training_trackers
                 )
                 policy.train(
-                    trackers_to_train, domain, interpreter=interpreter, **kwargs
+                    trackers_to_train,
+                    domain,
+                    interpreter=interpreter,
+                    training_states=training_states,
+                    **kwargs,
                 )
 
+            training_states.persist()
+
             training_events = self._training_events_from_trackers(training_trackers)
             self.action_fingerprints = self._create_action_fingerprints(training_events)
         else:
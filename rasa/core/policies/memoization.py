@@ -5,7 +5,7 @@ import json
 import logging
 import os
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import Optional, Any, Dict, List, Text, Tuple, Union
 
 import rasa.shared.utils.io
 import rasa.utils.io
@@ -19,7 +19,7 @@ from rasa.core.featurizers.tracker_featurizers import (
 )
 from rasa.core.interpreter import NaturalLanguageInterpreter
 from rasa.core.policies.policy import Policy
-from rasa.core.trackers import DialogueStateTracker
+from rasa.core.trackers import DialogueStateTracker, FrozenState
 from rasa.core.training.generator import TrackerWithCachedStates
 from rasa.utils.common import is_logging_disabled
 from rasa.core.constants import MEMOIZATION_POLICY_PRIORITY
@@ -30,6 +30,13 @@ logger = logging.getLogger(__name__)
 MAX_HISTORY_NOT_SET = -1
 OLD_DEFAULT_MAX_HISTORY = 5
 
+# keys of the persisted lookup
+LOOKUP_STATES_KEY = "states"
+LOOKUP_KEY = "lookup"
+
+# the memorized states of one training example
+FeatureKey = Tuple[FrozenState, ...]
+
 
 class MemoizationPolicy(Policy):
     """The policy that remembers exact examples of
@@ -104,12 +111,18 @@ class MemoizationPolicy(Policy):
 
         self.max_history = self.featurizer.max_history
         self.lookup = lookup if lookup is not None else {}
+        # lookups of models trained with older versions use (compressed) json
+        # strings as keys
+        self._has_legacy_lookup = isinstance(next(iter(self.lookup), None), str)
+        # interned frozen states so that equal states of different
+        # feature keys share the same object
+        self._frozen_states: Dict[FrozenState, FrozenState] = {}
 
     def _create_lookup_from_states(
         self,
         trackers_as_states: List[List[State]],
         trackers_as_actions: List[List[Text]],
-    ) -> Dict[Text, Text]:
+    ) -> Dict[FeatureKey, Text]:
         """Creates lookup dictionary from the tracker represented as states.
 
         Args:
@@ -141,7 +154,7 @@ class MemoizationPolicy(Policy):
             action = actions[0]
 
             feature_key = self._create_feature_key(states)
-            if not feature_key:
+            if feature_key is None:
                 continue
 
             if feature_key not in ambiguous_feature_keys:
@@ -157,9 +170,27 @@ class MemoizationPolicy(Policy):
 
         return lookup
 
-    def _create_feature_key(self, states: List[State]) -> Text:
-        from rasa.utils import io
+    @staticmethod
+    def _freeze_state(state: State) -> FrozenState:
+        return frozenset(
+            (
+                state_type,
+                frozenset(sub_state.items())
+                if isinstance(sub_state, dict)
+                else sub_state,
+            )
+            for state_type, sub_state in state.items()
+        )
+
+    def _intern_state(self, state: State) -> FrozenState:
+        frozen_state = self._freeze_state(state)
+        return self._frozen_states.setdefault(frozen_state, frozen_state)
 
+    def _create_feature_key(self, states: List[State]) -> FeatureKey:
+        return tuple(self._intern_state(state) for state in states)
+
+    def _create_legacy_feature_key(self, states: List[State]) -> Text:
+        """Creates the feature key used by models trained with older versions."""
         # we sort keys to make sure that the same states
         # represented as dictionaries have the same json strings
         # quotes are removed for aesthetic reasons
@@ -174,6 +205,13 @@ class MemoizationPolicy(Policy):
         else:
             return feature_str
 
+    def _feature_key_for_recall(self, states: List[State]) -> Union[FeatureKey, Text]:
+        if self._has_legacy_lookup:
+            return self._create_legacy_feature_key(states)
+
+        # states which are not part of the lookup don't need to be interned
+        return tuple(self._freeze_state(state) for state in states)
+
     def train(
         self,
         training_trackers: List[TrackerWithCachedStates],
@@ -190,14 +228,17 @@ class MemoizationPolicy(Policy):
         (
             trackers_as_states,
             trackers_as_actions,
-        ) = self.featurizer.training_states_and_actions(training_trackers, domain)
+        ) = self.featurizer.training_states_and_actions(
+            training_trackers, domain, kwargs.get("training_states")
+        )
+        self._has_legacy_lookup = False
         self.lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
         logger.debug(f"Memorized {len(self.lookup)} unique examples.")
 
     def _recall_states(self, states: List[State]) -> Optional[Text]:
-        return self.lookup.get(self._create_feature_key(states))
+        return self.lookup.get(self._feature_key_for_recall(states))
 
     def recall(
         self, states: List[State], tracker: DialogueStateTracker, domain: Domain
@@ -249,11 +290,67 @@ class MemoizationPolicy(Policy):
         data = {
             "priority": self.priority,
             "max_history": self.max_history,
-            "lookup": self.lookup,
+            **self._lookup_as_json(),
         }
         rasa.utils.io.create_directory_for_file(memorized_file)
         rasa.utils.io.dump_obj_as_json_to_file(memorized_file, data)
 
+    def _lookup_as_json(self) -> Dict[Text, Any]:
+        """Converts the lookup to a json serializable format.
+
+        Every unique state is stored only once. The feature keys of the lookup
+        refer to the states by their index.
+        """
+        if self._has_legacy_lookup:
+            return {LOOKUP_KEY: self.lookup}
+
+        state_indices: Dict[FrozenState, int] = {}
+        lookup = [
+            [
+                [
+                    state_indices.setdefault(frozen_state, len(state_indices))
+                    for frozen_state in feature_key
+                ],
+                action,
+            ]
+            for feature_key, action in self.lookup.items()
+        ]
+        states = [
+            {
+                state_type: dict(sorted(sub_state))
+                for state_type, sub_state in sorted(frozen_state)
+            }
+            for frozen_state in state_indices.keys()
+        ]
+
+        return {LOOKUP_STATES_KEY: states, LOOKUP_KEY: lookup}
+
+    @classmethod
+    def _lookup_from_json(cls, data: Dict[Text, Any]) -> Dict:
+        """Restores a lookup which was persisted using `_lookup_as_json`."""
+        if LOOKUP_STATES_KEY not in data:
+            # lookups of older models are persisted as they are
+            return data[LOOKUP_KEY]
+
+        # json dumps and loads tuples as lists, so we need to convert them back
+        frozen_states = [
+            cls._freeze_state(
+                {
+                    state_type: {
+                        key: tuple(value) if isinstance(value, list) else value
+                        for key, value in sub_state.items()
+                    }
+                    for state_type, sub_state in state.items()
+                }
+            )
+            for state in data[LOOKUP_STATES_KEY]
+        ]
+
+        return {
+            tuple(frozen_states[index] for index in state_indices): action
+            for state_indices, action in data[LOOKUP_KEY]
+        }
+
     @classmethod
     def load(cls, path: Text) -> "MemoizationPolicy":
 
@@ -262,7 +359,9 @@ class MemoizationPolicy(Policy):
         if os.path.isfile(memorized_file):
             data = json.loads(rasa.shared.utils.io.read_file(memorized_file))
             return cls(
-                featurizer=featurizer, priority=data["priority"], lookup=data["lookup"]
+                featurizer=featurizer,
+                priority=data["priority"],
+                lookup=cls._lookup_from_json(data),
             )
         else:
             logger.info(
@@ -148,7 +148,10 @@ class Policy:
         """
 
         state_features, label_ids = self.featurizer.featurize_trackers(
-            training_trackers, domain, interpreter
+            training_trackers,
+            domain,
+            interpreter,
+            training_states=kwargs.get("training_states"),
         )
 
         max_training_samples = kwargs.get("max_training_samples")
@@ -201,6 +204,33 @@ class Policy:
 
         raise NotImplementedError("Policy must have the capacity to predict.")
 
+    def predict_action_probabilities_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[List[float]]:
+        """Predicts the next action the bot should take for several trackers.
+
+        By default the predictions are made tracker by tracker. Policies which can
+        predict on several trackers more efficiently at once should override this.
+
+        Args:
+            trackers: the :class:`rasa.core.trackers.DialogueStateTracker` s
+            domain: the :class:`rasa.core.domain.Domain`
+            interpreter: Interpreter which may be used by the policies to create
+                additional features.
+
+        Returns:
+             the list of probabilities for the next actions for each tracker
+        """
+
+        return [
+            self.predict_action_probabilities(tracker, domain, interpreter, **kwargs)
+            for tracker in trackers
+        ]
+
     def persist(self, path: Text) -> None:
         """Persists the policy to a storage.
 
@@ -1,5 +1,6 @@
+import itertools
 import logging
-from typing import List, Dict, Text, Optional, Any, Set, TYPE_CHECKING
+from typing import List, Dict, Text, Optional, Any, Set, Tuple, Iterable, TYPE_CHECKING
 
 import json
 
@@ -7,7 +8,7 @@ from rasa.core.events import FormValidation
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
 from rasa.core.domain import Domain, InvalidDomain, State
 from rasa.core.interpreter import NaturalLanguageInterpreter
-from rasa.core.policies.memoization import MemoizationPolicy
+from rasa.core.policies.memoization import MemoizationPolicy, LOOKUP_KEY
 from rasa.core.policies.policy import SupportedData
 from rasa.core.trackers import (
     DialogueStateTracker,
@@ -22,7 +23,10 @@ from rasa.core.constants import (
     USER_INTENT_SESSION_START,
     SHOULD_NOT_BE_SET,
     PREVIOUS_ACTION,
+    ACTIVE_LOOP,
+    LOOP_NAME,
     LOOP_REJECTED,
+    USER,
 )
 from rasa.core.actions.action import (
     ACTION_LISTEN_NAME,
@@ -33,7 +37,7 @@ from rasa.core.actions.action import (
     ACTION_DEFAULT_FALLBACK_NAME,
 )
 from rasa.nlu.constants import INTENT_NAME_KEY
-from rasa.shared.nlu.constants import ACTION_NAME
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT
 
 if TYPE_CHECKING:
     from rasa.core.policies.ensemble import PolicyEnsemble  # pytype: disable=pyi-error
@@ -52,6 +56,13 @@ RULES_FOR_LOOP_UNHAPPY_PATH = "rules_for_loop_unhappy_path"
 DO_NOT_VALIDATE_LOOP = "do_not_validate_loop"
 DO_NOT_PREDICT_LOOP_ACTION = "do_not_predict_loop_action"
 
+# features of the last rule turn which are used to find candidate rules
+INDEXED_RULE_FEATURES = [
+    (USER, INTENT),
+    (PREVIOUS_ACTION, ACTION_NAME),
+    (ACTIVE_LOOP, LOOP_NAME),
+]
+
 
 class RulePolicy(MemoizationPolicy):
     """Policy which handles all the rules"""
@@ -102,6 +113,9 @@ class RulePolicy(MemoizationPolicy):
             featurizer=featurizer, priority=priority, max_history=None, lookup=lookup
         )
 
+        self._rule_indices: Dict[Text, RuleIndex] = {}
+        self._index_rules()
+
     @classmethod
     def validate_against_domain(
         cls, ensemble: Optional["PolicyEnsemble"], domain: Optional[Domain]
@@ -145,6 +159,10 @@ class RulePolicy(MemoizationPolicy):
         # represented as dictionaries have the same json strings
         return json.dumps(new_states, sort_keys=True)
 
+    def _lookup_as_json(self) -> Dict[Text, Any]:
+        # rule keys are json strings which are parsed by the `RuleIndex`
+        return {LOOKUP_KEY: self.lookup}
+
     @staticmethod
     def _states_for_unhappy_loop_predictions(states: List[State]) -> List[State]:
         """Modifies the states to create feature keys for loop unhappy path conditions.
@@ -243,7 +261,9 @@ class RulePolicy(MemoizationPolicy):
         (
             rule_trackers_as_states,
             rule_trackers_as_actions,
-        ) = self.featurizer.training_states_and_actions(rule_trackers, domain)
+        ) = self.featurizer.training_states_and_actions(
+            rule_trackers, domain, kwargs.get("training_states")
+        )
 
         rules_lookup = self._create_lookup_from_states(
             rule_trackers_as_states, rule_trackers_as_actions
@@ -254,7 +274,9 @@ class RulePolicy(MemoizationPolicy):
         (
             story_trackers_as_states,
             story_trackers_as_actions,
-        ) = self.featurizer.training_states_and_actions(story_trackers, domain)
+        ) = self.featurizer.training_states_and_actions(
+            story_trackers, domain, kwargs.get("training_states")
+        )
 
         # use all trackers to find negative rules in unhappy paths
         trackers_as_states = rule_trackers_as_states + story_trackers_as_states
@@ -270,73 +292,16 @@ class RulePolicy(MemoizationPolicy):
         # TODO use story_trackers and rule_trackers
         #  to check that stories don't contradict rules
 
-        logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
-
-    @staticmethod
-    def _does_rule_match_state(rule_state: State, conversation_state: State) -> bool:
-        for state_type, rule_sub_state in rule_state.items():
-            conversation_sub_state = conversation_state.get(state_type, {})
-            for key, value in rule_sub_state.items():
-                if isinstance(value, list):
-                    # json dumps and loads tuples as lists,
-                    # so we need to convert them back
-                    value = tuple(value)
+        self._index_rules()
 
-                if (
-                    # value should be set, therefore
-                    # check whether it is the same as in the state
-                    value
-                    and value != SHOULD_NOT_BE_SET
-                    and conversation_sub_state.get(key) != value
-                ) or (
-                    # value shouldn't be set, therefore
-                    # it should be None or non existent in the state
-                    value == SHOULD_NOT_BE_SET
-                    and conversation_sub_state.get(key)
-                ):
-                    return False
-
-        return True
-
-    @staticmethod
-    def _rule_key_to_state(rule_key: Text) -> List[State]:
-        return json.loads(rule_key)
-
-    def _is_rule_applicable(
-        self, rule_key: Text, turn_index: int, conversation_state: State
-    ) -> bool:
-        """Check if rule is satisfied with current state at turn."""
-
-        # turn_index goes back in time
-        reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
-
-        return bool(
-            # rule is shorter than current turn index
-            turn_index >= len(reversed_rule_states)
-            # current rule and state turns are empty
-            or (not reversed_rule_states[turn_index] and not conversation_state)
-            # check that current rule turn features are present in current state turn
-            or (
-                reversed_rule_states[turn_index]
-                and conversation_state
-                and self._does_rule_match_state(
-                    reversed_rule_states[turn_index], conversation_state
-                )
-            )
-        )
+        logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
-                )
-            )
-        return possible_keys
+    def _index_rules(self) -> None:
+        """Parses the rules of the lookup once so that they can be matched quickly."""
+        self._rule_indices = {
+            lookup_key: RuleIndex(self.lookup.get(lookup_key, {}))
+            for lookup_key in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]
+        }
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -394,7 +359,8 @@ class RulePolicy(MemoizationPolicy):
 
         logger.debug(f"Current tracker state: {states}")
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_index = self._rule_indices[RULES]
+        rule_keys = rule_index.possible_keys(states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -407,9 +373,9 @@ class RulePolicy(MemoizationPolicy):
         active_loop_name = tracker.active_loop_name
         if active_loop_name:
             # find rules for unhappy path of the loop
-            loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
-            )
+            loop_unhappy_keys = self._rule_indices[
+                RULES_FOR_LOOP_UNHAPPY_PATH
+            ].possible_keys(states)
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
                 self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH].get(key)
@@ -422,7 +388,7 @@ class RulePolicy(MemoizationPolicy):
             # Hence, we have to take care of that.
             predicted_listen_from_general_rule = (
                 predicted_action_name == ACTION_LISTEN_NAME
-                and not get_active_loop_name(self._rule_key_to_state(best_rule_key)[-1])
+                and not get_active_loop_name(rule_index.rule_states(best_rule_key)[-1])
             )
             if predicted_listen_from_general_rule:
                 if DO_NOT_PREDICT_LOOP_ACTION not in unhappy_path_conditions:
@@ -489,3 +455,153 @@ class RulePolicy(MemoizationPolicy):
                 domain.index_for_action(self._fallback_action_name)
             ] = self._core_fallback_threshold
         return result
+
+
+class RuleIndex:
+    """Parsed rules which are indexed by the features of their last turn.
+
+    Every rule key is parsed only once. Rules are indexed by the intent, the previous
+    action and the active loop of their last turn, so that only rules which can
+    match the current conversation state have to be checked against the
+    conversation.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        """Create the index.
+
+        Args:
+            lookup: Rule lookup which maps rule keys to actions.
+        """
+        # rule key -> parsed rule states in reversed order
+        self._reversed_rule_states: Dict[Text, List[State]] = {}
+        # features of the last rule turn -> rule keys
+        self._index: Dict[Tuple[Optional[Text], ...], List[Text]] = {}
+        self._rules_with_empty_last_turn: List[Text] = []
+
+        for rule_key in lookup.keys():
+            self._add_rule(rule_key)
+
+    @staticmethod
+    def _rule_key_to_states(rule_key: Text) -> List[State]:
+        # json dumps and loads tuples as lists, so we need to convert them back
+        return [
+            {
+                state_type: {
+                    key: tuple(value) if isinstance(value, list) else value
+                    for key, value in sub_state.items()
+                }
+                for state_type, sub_state in state.items()
+            }
+            for state in json.loads(rule_key)
+        ]
+
+    @staticmethod
+    def _indexed_rule_features(rule_state: State) -> Tuple[Optional[Text], ...]:
+        features = []
+        for state_type, key in INDEXED_RULE_FEATURES:
+            value = rule_state.get(state_type, {}).get(key)
+            # rules which don't require a specific value match any value
+            features.append(value if value and value != SHOULD_NOT_BE_SET else None)
+
+        return tuple(features)
+
+    def _add_rule(self, rule_key: Text) -> None:
+        reversed_rule_states = list(reversed(self._rule_key_to_states(rule_key)))
+        self._reversed_rule_states[rule_key] = reversed_rule_states
+
+        last_turn = reversed_rule_states[0] if reversed_rule_states else {}
+        if not last_turn:
+            self._rules_with_empty_last_turn.append(rule_key)
+            return
+
+        features = self._indexed_rule_features(last_turn)
+        self._index.setdefault(features, []).append(rule_key)
+
+    def rule_states(self, rule_key: Text) -> List[State]:
+        """Returns the parsed states of a rule.
+
+        Args:
+            rule_key: The key of the rule in the lookup.
+
+        Returns:
+            The states of the rule.
+        """
+        return list(reversed(self._reversed_rule_states[rule_key]))
+
+    def _candidate_rules(self, conversation_state: State) -> Iterable[Text]:
+        if not conversation_state:
+            return self._rules_with_empty_last_turn
+
+        feature_options = []
+        for state_type, key in INDEXED_RULE_FEATURES:
+            value = conversation_state.get(state_type, {}).get(key)
+            # rules which don't require the feature are candidates as well
+            feature_options.append((value, None) if value else (None,))
+
+        return itertools.chain.from_iterable(
+            self._index.get(features, [])
+            for features in itertools.product(*feature_options)
+        )
+
+    @staticmethod
+    def _does_rule_match_state(rule_state: State, conversation_state: State) -> bool:
+        for state_type, rule_sub_state in rule_state.items():
+            conversation_sub_state = conversation_state.get(state_type, {})
+            for key, value in rule_sub_state.items():
+                if (
+                    # value should be set, therefore
+                    # check whether it is the same as in the state
+                    value
+                    and value != SHOULD_NOT_BE_SET
+                    and conversation_sub_state.get(key) != value
+                ) or (
+                    # value shouldn't be set, therefore
+                    # it should be None or non existent in the state
+                    value == SHOULD_NOT_BE_SET
+                    and conversation_sub_state.get(key)
+                ):
+                    return False
+
+        return True
+
+    def _is_rule_applicable(
+        self, rule_key: Text, reversed_conversation_states: List[State]
+    ) -> bool:
+        """Check if rule is satisfied with all turns of the conversation."""
+
+        # turns which go beyond the rule or the conversation are not checked
+        for rule_state, conversation_state in zip(
+            self._reversed_rule_states[rule_key], reversed_conversation_states
+        ):
+            if not rule_state and not conversation_state:
+                # current rule and state turns are empty
+                continue
+
+            if (
+                not rule_state
+                or not conversation_state
+                or not self._does_rule_match_state(rule_state, conversation_state)
+            ):
+                return False
+
+        return True
+
+    def possible_keys(self, states: List[State]) -> Set[Text]:
+        """Finds the rules which match a conversation.
+
+        Args:
+            states: The states of the conversation.
+
+        Returns:
+            The keys of the rules which are applicable to the conversation.
+        """
+        if not states:
+            return set(self._reversed_rule_states.keys())
+
+        reversed_states = list(reversed(states))
+
+        return {
+            rule_key
+            for rule_key in self._candidate_rules(reversed_states[0])
+            if self._is_rule_applicable(rule_key, reversed_states)
+        }
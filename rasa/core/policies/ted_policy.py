@@ -368,25 +368,52 @@ class TEDPolicy(Policy):
         Return the list of probabilities for the next actions.
         """
 
+        return self.predict_action_probabilities_batch(
+            [tracker], domain, interpreter, **kwargs
+        )[0]
+
+    def predict_action_probabilities_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[List[float]]:
+        """Predict the next action for all trackers with a single call of the model.
+        Return the list of probabilities for the next actions for each tracker.
+        """
+
         if self.model is None:
-            return self._default_predictions(domain)
+            return [self._default_predictions(domain) for _ in trackers]
 
-        # create model data from tracker
+        # create model data from trackers
         tracker_state_features = self.featurizer.create_state_features(
-            [tracker], domain, interpreter
+            trackers, domain, interpreter
         )
         model_data = self._create_model_data(tracker_state_features)
 
         output = self.model.predict(model_data)
 
-        confidence = output["action_scores"].numpy()
-        # remove batch dimension and take the last prediction in the sequence
-        confidence = confidence[0, -1, :]
+        scores = output["action_scores"].numpy()
+        dialogue_lengths = model_data.get(DIALOGUE, LENGTH)[0]
+
+        confidences = []
+        for idx, dialogue_length in enumerate(dialogue_lengths):
+            if self.model.max_history_tracker_featurizer_used:
+                # the model only predicts for the last turn of the dialogue
+                confidence = scores[idx, -1, :]
+            else:
+                # take the last prediction of the (padded) dialogue
+                confidence = scores[idx, dialogue_length - 1, :]
+
+            if self.config[LOSS_TYPE] == SOFTMAX and self.config[RANKING_LENGTH] > 0:
+                confidence = train_utils.normalize(
+                    confidence, self.config[RANKING_LENGTH]
+                )
 
-        if self.config[LOSS_TYPE] == SOFTMAX and self.config[RANKING_LENGTH] > 0:
-            confidence = train_utils.normalize(confidence, self.config[RANKING_LENGTH])
+            confidences.append(confidence.tolist())
 
-        return confidence.tolist()
+        return confidences
 
     def persist(self, path: Text) -> None:
         """Persists the policy to a storage."""
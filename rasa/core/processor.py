@@ -2,7 +2,7 @@ import logging
 import os
 import time
 from types import LambdaType
-from typing import Any, Dict, List, Optional, Text, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 
 import numpy as np
 
@@ -20,7 +20,12 @@ from rasa.core.channels.channel import (
     OutputChannel,
     UserMessage,
 )
-from rasa.core.constants import USER_INTENT_RESTART, UTTER_PREFIX, REQUESTED_SLOT
+from rasa.core.constants import (
+    ACTION_NAME_SENDER_ID_CONNECTOR_STR,
+    REQUESTED_SLOT,
+    USER_INTENT_RESTART,
+    UTTER_PREFIX,
+)
 from rasa.core.domain import Domain
 from rasa.core.events import (
     ActionExecuted,
@@ -36,6 +41,11 @@ from rasa.core.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
 from rasa.core.nlg import NaturalLanguageGenerator
 from rasa.core.policies.ensemble import PolicyEnsemble
+from rasa.core.reminder_store import (
+    InMemoryReminderStore,
+    ReminderStore,
+    ScheduledReminder,
+)
 from rasa.core.tracker_store import TrackerStore
 from rasa.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.nlu.constants import INTENT_NAME_KEY
@@ -58,6 +68,7 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         message_preprocessor: Optional[LambdaType] = None,
         on_circuit_break: Optional[LambdaType] = None,
+        reminder_store: Optional[ReminderStore] = None,
     ):
         self.interpreter = interpreter
         self.nlg = generator
@@ -68,6 +79,7 @@ class MessageProcessor:
         self.message_preprocessor = message_preprocessor
         self.on_circuit_break = on_circuit_break
         self.action_endpoint = action_endpoint
+        self.reminder_store = reminder_store or InMemoryReminderStore()
 
     async def handle_message(
         self, message: UserMessage
@@ -81,7 +93,7 @@ class MessageProcessor:
 
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker_async(tracker)
             rasa.shared.utils.io.raise_warning(
                 "No policy ensemble or domain set. Skipping action prediction "
                 "and execution.",
@@ -92,7 +104,7 @@ class MessageProcessor:
         await self._predict_and_execute_next_action(message.output_channel, tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker_async(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -121,7 +133,7 @@ class MessageProcessor:
 
         probabilities, policy = self._get_next_action_probabilities(tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker_async(tracker)
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names, probabilities)
@@ -183,7 +195,7 @@ class MessageProcessor:
               Tracker for `sender_id` if available, `None` otherwise.
         """
 
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker_async(sender_id)
         if not tracker:
             return None
 
@@ -211,6 +223,27 @@ class MessageProcessor:
             conversation_id, append_action_listen=False
         )
 
+    async def get_tracker_async(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Asynchronous version of `get_tracker`.
+
+        Blocking tracker stores are run in a thread pool, so that retrieving the
+        tracker doesn't block the event loop.
+
+        Args:
+            conversation_id: The ID of the conversation for which the history should be
+                retrieved.
+
+        Returns:
+            Tracker for the conversation. Creates an empty tracker in case it's a new
+            conversation.
+        """
+        conversation_id = conversation_id or UserMessage.DEFAULT_SENDER_ID
+        return await self.tracker_store.get_or_create_tracker_async(
+            conversation_id, append_action_listen=False
+        )
+
     async def log_message(
         self, message: UserMessage, should_save_tracker: bool = True
     ) -> Optional[DialogueStateTracker]:
@@ -232,7 +265,7 @@ class MessageProcessor:
 
             if should_save_tracker:
                 # save tracker state to continue conversation from this state
-                self._save_tracker(tracker)
+                await self._save_tracker_async(tracker)
         else:
             logger.warning(
                 f"Failed to retrieve or create tracker for conversation ID "
@@ -260,7 +293,7 @@ class MessageProcessor:
             )
 
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker_async(tracker)
         else:
             logger.warning(
                 f"Failed to retrieve or create tracker for conversation ID "
@@ -394,7 +427,7 @@ class MessageProcessor:
         )
         await self._predict_and_execute_next_action(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker_async(tracker)
 
     @staticmethod
     def _log_slots(tracker) -> None:
@@ -598,6 +631,10 @@ class MessageProcessor:
 
             await output_channel.send_response(tracker.sender_id, e.message())
 
+    @staticmethod
+    def _reminder_job_id(sender_id: Text, name: Text) -> Text:
+        return f"{name}{ACTION_NAME_SENDER_ID_CONNECTOR_STR}{sender_id}"
+
     async def _schedule_reminders(
         self,
         events: List[Event],
@@ -605,40 +642,99 @@ class MessageProcessor:
         output_channel: OutputChannel,
         nlg: NaturalLanguageGenerator,
     ) -> None:
-        """Uses the scheduler to time a job to trigger the passed reminder.
+        """Stores reminders and uses the scheduler to trigger them when they are due.
 
-        Reminders with the same `id` property will overwrite one another
+        Reminders with the same `name` property will overwrite one another
         (i.e. only one of them will eventually run)."""
 
         for e in events:
             if not isinstance(e, ReminderScheduled):
                 continue
 
+            await self.reminder_store.save_async(
+                ScheduledReminder(
+                    tracker.sender_id, e, tracker.get_latest_input_channel()
+                )
+            )
+
             (await jobs.scheduler()).add_job(
-                self.handle_reminder,
+                self._handle_scheduled_reminder,
                 "date",
                 run_date=e.trigger_date_time,
-                args=[e, tracker.sender_id, output_channel, nlg],
-                id=e.name,
+                args=[tracker.sender_id, e.name, output_channel, nlg],
+                id=self._reminder_job_id(tracker.sender_id, e.name),
                 replace_existing=True,
                 name=e.scheduled_job_name(tracker.sender_id),
             )
 
-    @staticmethod
+    async def _handle_scheduled_reminder(
+        self,
+        sender_id: Text,
+        name: Text,
+        output_channel: OutputChannel,
+        nlg: NaturalLanguageGenerator,
+    ) -> None:
+        """Trigger a reminder unless it was cancelled or claimed by another server."""
+
+        reminder = await self.reminder_store.claim_async(sender_id, name)
+        if reminder is None:
+            return
+
+        await self._handle_claimed_reminder(reminder, output_channel, nlg)
+
+    async def _handle_claimed_reminder(
+        self,
+        reminder: ScheduledReminder,
+        output_channel: OutputChannel,
+        nlg: NaturalLanguageGenerator,
+    ) -> None:
+        try:
+            await self.handle_reminder(
+                reminder.reminder, reminder.sender_id, output_channel, nlg
+            )
+        finally:
+            await self.reminder_store.complete_async(reminder)
+
+    async def handle_due_reminders(
+        self, output_channel_for: Callable[[Optional[Text]], OutputChannel]
+    ) -> None:
+        """Trigger the due reminders which weren't claimed by any Rasa server yet.
+
+        This picks up reminders which were scheduled by other Rasa servers or before
+        a restart.
+
+        Args:
+            output_channel_for: Returns the output channel for the name of the
+                input channel which the user used most recently.
+        """
+
+        for reminder in await self.reminder_store.claim_due_reminders_async():
+            try:
+                await self._handle_claimed_reminder(
+                    reminder, output_channel_for(reminder.input_channel), self.nlg
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to trigger reminder '{reminder.name}' of conversation "
+                    f"'{reminder.sender_id}': {e}"
+                )
+
     async def _cancel_reminders(
-        events: List[Event], tracker: DialogueStateTracker
+        self, events: List[Event], tracker: DialogueStateTracker
     ) -> None:
         """Cancel reminders that match the `ReminderCancelled` event."""
 
         # All Reminders specified by ReminderCancelled events will be cancelled
         for event in events:
             if isinstance(event, ReminderCancelled):
+                cancelled_reminders = await self.reminder_store.cancel_async(
+                    tracker.sender_id, event
+                )
                 scheduler = await jobs.scheduler()
-                for scheduled_job in scheduler.get_jobs():
-                    if event.cancels_job_with_name(
-                        scheduled_job.name, tracker.sender_id
-                    ):
-                        scheduler.remove_job(scheduled_job.id)
+                for reminder in cancelled_reminders:
+                    job_id = self._reminder_job_id(tracker.sender_id, reminder.name)
+                    if scheduler.get_job(job_id):
+                        scheduler.remove_job(job_id)
 
     async def _run_action(
         self,
@@ -780,6 +876,9 @@ class MessageProcessor:
     def _save_tracker(self, tracker: DialogueStateTracker) -> None:
         self.tracker_store.save(tracker)
 
+    async def _save_tracker_async(self, tracker: DialogueStateTracker) -> None:
+        await self.tracker_store.save_async(tracker)
+
     def _prob_array_for_action(
         self, action_name: Text
     ) -> Tuple[Optional[List[float]], None]:
@@ -0,0 +1,773 @@
+import asyncio
+import contextlib
+import functools
+import heapq
+import itertools
+import json
+import logging
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Text, Tuple, Union
+
+import sqlalchemy as sa
+
+import rasa.shared.utils.common
+from rasa.core.constants import (
+    DEFAULT_REMINDER_BATCH_SIZE,
+    DEFAULT_REMINDER_LEASE_LIFETIME,
+    DEFAULT_REMINDER_POLLING_INTERVAL,
+    DEFAULT_REMINDER_STORE_THREAD_POOL_SIZE,
+)
+from rasa.core.events import Event, ReminderCancelled, ReminderScheduled
+from rasa.core.lock_store import DEFAULT_SOCKET_TIMEOUT_IN_SECONDS
+from rasa.core.tracker_store import (
+    SQLTrackerStore,
+    _create_sequence,
+    create_engine_kwargs,
+)
+from rasa.utils.endpoints import EndpointConfig
+
+if typing.TYPE_CHECKING:
+    from redis.client import Pipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REDIS_REMINDER_STORE_KEY_PREFIX = "rasa_reminders"
+
+
+class ScheduledReminder:
+    """A reminder which was scheduled in a conversation."""
+
+    def __init__(
+        self,
+        sender_id: Text,
+        reminder: ReminderScheduled,
+        input_channel: Optional[Text] = None,
+    ) -> None:
+        """Create a scheduled reminder.
+
+        Args:
+            sender_id: The ID of the conversation.
+            reminder: The event which scheduled the reminder.
+            input_channel: Name of the input channel the user used most recently.
+                Used to send the bot's responses if the reminder is triggered by
+                another Rasa server.
+        """
+        self.sender_id = sender_id
+        self.reminder = reminder
+        self.input_channel = input_channel
+
+    @property
+    def name(self) -> Text:
+        return self.reminder.name
+
+    @property
+    def trigger_timestamp(self) -> float:
+        return self.reminder.trigger_date_time.timestamp()
+
+    def as_dict(self) -> Dict[Text, Any]:
+        return {
+            "sender_id": self.sender_id,
+            "reminder": self.reminder.as_dict(),
+            "input_channel": self.input_channel,
+        }
+
+    def dumps(self) -> Text:
+        return json.dumps(self.as_dict(), sort_keys=True)
+
+    @classmethod
+    def from_dict(cls, data: Dict[Text, Any]) -> "ScheduledReminder":
+        return cls(
+            data["sender_id"],
+            Event.from_parameters(data["reminder"]),
+            data.get("input_channel"),
+        )
+
+    @classmethod
+    def loads(cls, serialised: Union[Text, bytes]) -> "ScheduledReminder":
+        return cls.from_dict(json.loads(serialised))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ScheduledReminder):
+            return False
+
+        return self.dumps() == other.dumps()
+
+    def __repr__(self) -> Text:
+        return f"ScheduledReminder({self.sender_id}, {self.reminder})"
+
+
+class ReminderStore:
+    """Stores the reminders of all conversations until they are triggered.
+
+    Reminders are indexed by the time they are due, so that due reminders can be
+    found without looking at all scheduled reminders. A reminder is identified by
+    its conversation and its name. Scheduling a reminder with the name of an
+    existing reminder replaces the existing one.
+
+    Rasa servers claim due reminders before triggering them. A claim is a lease
+    which expires after `lease_lifetime` seconds. Until then the reminder can't
+    be claimed by another server. If the server fails to trigger the reminder in
+    time, the reminder is triggered by the next server which claims it.
+    """
+
+    # persistent stores keep reminders across restarts and share them between Rasa
+    # servers, which requires Rasa servers to regularly poll for due reminders
+    is_persistent = False
+
+    def __init__(
+        self,
+        lease_lifetime: float = DEFAULT_REMINDER_LEASE_LIFETIME,
+        polling_interval: float = DEFAULT_REMINDER_POLLING_INTERVAL,
+    ) -> None:
+        self.lease_lifetime = lease_lifetime
+        self.polling_interval = polling_interval
+
+    @staticmethod
+    def create(obj: Union["ReminderStore", EndpointConfig, None]) -> "ReminderStore":
+        """Factory to create a reminder store."""
+
+        if isinstance(obj, ReminderStore):
+            return obj
+        else:
+            return _create_from_endpoint_config(obj)
+
+    def save(self, reminder: ScheduledReminder) -> None:
+        """Store `reminder` and replace any reminder with the same name."""
+
+        raise NotImplementedError
+
+    def cancel(
+        self, sender_id: Text, cancellation: ReminderCancelled
+    ) -> List[ScheduledReminder]:
+        """Remove the reminders of a conversation which match `cancellation`.
+
+        Returns:
+            The cancelled reminders.
+        """
+
+        raise NotImplementedError
+
+    def claim(self, sender_id: Text, name: Text) -> Optional[ScheduledReminder]:
+        """Claim the reminder with `name` if it is due and not claimed already.
+
+        Returns:
+            The reminder or `None` if it can't be claimed.
+        """
+
+        raise NotImplementedError
+
+    def claim_due_reminders(
+        self, limit: int = DEFAULT_REMINDER_BATCH_SIZE
+    ) -> List[ScheduledReminder]:
+        """Claim at most `limit` due reminders which aren't claimed already."""
+
+        raise NotImplementedError
+
+    def complete(self, reminder: ScheduledReminder) -> None:
+        """Remove a triggered reminder unless it was scheduled again meanwhile."""
+
+        raise NotImplementedError
+
+    @property
+    def has_blocking_io(self) -> bool:
+        """Whether the methods of the reminder store block while waiting for IO.
+
+        The asynchronous methods (e.g. `claim_async`) run the blocking methods in a
+        thread pool, so that they don't block the event loop. Reminder stores which
+        don't wait for IO should override this.
+        """
+        return True
+
+    async def save_async(self, reminder: ScheduledReminder) -> None:
+        """Asynchronous version of `save`."""
+        await self._run_blocking(self.save, reminder)
+
+    async def cancel_async(
+        self, sender_id: Text, cancellation: ReminderCancelled
+    ) -> List[ScheduledReminder]:
+        """Asynchronous version of `cancel`."""
+        return await self._run_blocking(self.cancel, sender_id, cancellation)
+
+    async def claim_async(
+        self, sender_id: Text, name: Text
+    ) -> Optional[ScheduledReminder]:
+        """Asynchronous version of `claim`."""
+        return await self._run_blocking(self.claim, sender_id, name)
+
+    async def claim_due_reminders_async(
+        self, limit: int = DEFAULT_REMINDER_BATCH_SIZE
+    ) -> List[ScheduledReminder]:
+        """Asynchronous version of `claim_due_reminders`."""
+        return await self._run_blocking(self.claim_due_reminders, limit)
+
+    async def complete_async(self, reminder: ScheduledReminder) -> None:
+        """Asynchronous version of `complete`."""
+        await self._run_blocking(self.complete, reminder)
+
+    async def _run_blocking(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking method of the reminder store in its thread pool."""
+        if not self.has_blocking_io:
+            return func(*args)
+
+        # not created in `__init__` as custom reminder stores might not call it
+        if getattr(self, "_thread_pool", None) is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=DEFAULT_REMINDER_STORE_THREAD_POOL_SIZE,
+                thread_name_prefix="reminder_store",
+            )
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._thread_pool, functools.partial(func, *args)
+        )
+
+    def close(self) -> None:
+        """Stop the thread pool of the asynchronous methods.
+
+        Scheduled calls are still finished. Calling an asynchronous method later
+        starts a new thread pool.
+        """
+        thread_pool = getattr(self, "_thread_pool", None)
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
+
+class _InMemoryEntry:
+    def __init__(self, reminder: ScheduledReminder) -> None:
+        self.reminder = reminder
+        self.due_timestamp = reminder.trigger_timestamp
+
+
+class InMemoryReminderStore(ReminderStore):
+    """Stores reminders in memory of the Rasa server.
+
+    Reminders are lost when the server stops and can only be triggered by the
+    server which scheduled them.
+    """
+
+    def __init__(
+        self,
+        lease_lifetime: float = DEFAULT_REMINDER_LEASE_LIFETIME,
+        polling_interval: float = DEFAULT_REMINDER_POLLING_INTERVAL,
+    ) -> None:
+        self.reminders: Dict[Text, Dict[Text, _InMemoryEntry]] = {}
+        # heap of `(due timestamp, insertion counter, entry)`; entries which were
+        # removed or changed their due time are skipped when popped
+        self._due: List[Tuple[float, int, _InMemoryEntry]] = []
+        self._counter = itertools.count()
+        super().__init__(lease_lifetime, polling_interval)
+
+    @property
+    def has_blocking_io(self) -> bool:
+        # the reminders are only accessed from the event loop and don't need locks
+        return False
+
+    def _push(self, entry: _InMemoryEntry) -> None:
+        heapq.heappush(self._due, (entry.due_timestamp, next(self._counter), entry))
+
+    def _is_current(self, entry: _InMemoryEntry, due_timestamp: float) -> bool:
+        reminder = entry.reminder
+        return (
+            self.reminders.get(reminder.sender_id, {}).get(reminder.name) is entry
+            and entry.due_timestamp == due_timestamp
+        )
+
+    def save(self, reminder: ScheduledReminder) -> None:
+        entry = _InMemoryEntry(reminder)
+        self.reminders.setdefault(reminder.sender_id, {})[reminder.name] = entry
+        self._push(entry)
+
+    def _remove(self, sender_id: Text, name: Text) -> None:
+        reminders = self.reminders.get(sender_id, {})
+        reminders.pop(name, None)
+        if not reminders:
+            self.reminders.pop(sender_id, None)
+
+    def cancel(
+        self, sender_id: Text, cancellation: ReminderCancelled
+    ) -> List[ScheduledReminder]:
+        cancelled = [
+            entry.reminder
+            for entry in self.reminders.get(sender_id, {}).values()
+            if cancellation.cancels_reminder(entry.reminder.reminder)
+        ]
+        for reminder in cancelled:
+            self._remove(sender_id, reminder.name)
+
+        return cancelled
+
+    def _lease(self, entry: _InMemoryEntry) -> ScheduledReminder:
+        entry.due_timestamp = time.time() + self.lease_lifetime
+        self._push(entry)
+        return entry.reminder
+
+    def claim(self, sender_id: Text, name: Text) -> Optional[ScheduledReminder]:
+        entry = self.reminders.get(sender_id, {}).get(name)
+        if entry is None or entry.due_timestamp > time.time():
+            return None
+
+        return self._lease(entry)
+
+    def claim_due_reminders(
+        self, limit: int = DEFAULT_REMINDER_BATCH_SIZE
+    ) -> List[ScheduledReminder]:
+        now = time.time()
+        due_entries = []
+        while self._due and self._due[0][0] <= now and len(due_entries) < limit:
+            due_timestamp, _, entry = heapq.heappop(self._due)
+            if self._is_current(entry, due_timestamp):
+                due_entries.append(entry)
+
+        return [self._lease(entry) for entry in due_entries]
+
+    def complete(self, reminder: ScheduledReminder) -> None:
+        entry = self.reminders.get(reminder.sender_id, {}).get(reminder.name)
+        if entry is not None and entry.reminder is reminder:
+            self._remove(reminder.sender_id, reminder.name)
+
+
+class RedisReminderStore(ReminderStore):
+    """Stores reminders in Redis.
+
+    Due times are kept in a sorted set, and the reminders of each conversation in
+    a set, so that due reminders and the reminders of a conversation can be found
+    without looking at all reminders. Claims are keys which expire after the lease
+    lifetime.
+    """
+
+    is_persistent = True
+
+    def __init__(
+        self,
+        host: Text = "localhost",
+        port: int = 6379,
+        db: int = 1,
+        password: Optional[Text] = None,
+        use_ssl: bool = False,
+        socket_timeout: float = DEFAULT_SOCKET_TIMEOUT_IN_SECONDS,
+        key_prefix: Text = DEFAULT_REDIS_REMINDER_STORE_KEY_PREFIX,
+        lease_lifetime: float = DEFAULT_REMINDER_LEASE_LIFETIME,
+        polling_interval: float = DEFAULT_REMINDER_POLLING_INTERVAL,
+    ) -> None:
+        """Create a reminder store which uses Redis for persistence.
+
+        Args:
+            host: The host of the redis server.
+            port: The port of the redis server.
+            db: The name of the database within Redis which should be used by Rasa
+                Open Source.
+            password: The password which should be used for authentication with the
+                Redis database.
+            use_ssl: `True` if SSL should be used for the connection to Redis.
+            socket_timeout: Timeout in seconds after which an exception will be raised
+                in case Redis doesn't respond within `socket_timeout` seconds.
+            key_prefix: Prefix of all keys the reminder store uses.
+            lease_lifetime: Seconds until the claim of a reminder expires.
+            polling_interval: Seconds between checks for due reminders.
+        """
+        import redis
+
+        self.red = redis.StrictRedis(
+            host=host,
+            port=int(port),
+            db=int(db),
+            password=password,
+            ssl=use_ssl,
+            socket_timeout=socket_timeout,
+        )
+        self.key_prefix = key_prefix
+        super().__init__(lease_lifetime, polling_interval)
+
+    @property
+    def _due_key(self) -> Text:
+        return f"{self.key_prefix}:due"
+
+    @property
+    def _reminders_key(self) -> Text:
+        return f"{self.key_prefix}:reminders"
+
+    def _conversation_key(self, sender_id: Text) -> Text:
+        return f"{self.key_prefix}:conversation:{sender_id}"
+
+    def _lease_key(self, reminder_key: Text) -> Text:
+        return f"{self.key_prefix}:lease:{reminder_key}"
+
+    @staticmethod
+    def _reminder_key(sender_id: Text, name: Text) -> Text:
+        return json.dumps([sender_id, name])
+
+    def save(self, reminder: ScheduledReminder) -> None:
+        reminder_key = self._reminder_key(reminder.sender_id, reminder.name)
+
+        pipeline = self.red.pipeline()
+        pipeline.hset(self._reminders_key, reminder_key, reminder.dumps())
+        pipeline.zadd(self._due_key, {reminder_key: reminder.trigger_timestamp})
+        pipeline.sadd(self._conversation_key(reminder.sender_id), reminder_key)
+        pipeline.delete(self._lease_key(reminder_key))
+        pipeline.execute()
+
+    def _remove(
+        self, reminder_key: Text, sender_id: Text, serialised_reminder: Optional[bytes]
+    ) -> bool:
+        """Remove a reminder unless it changed.
+
+        Args:
+            reminder_key: Key of the reminder.
+            sender_id: The ID of the conversation.
+            serialised_reminder: The reminder as it was loaded, or `None` to
+                remove it regardless of changes.
+
+        Returns:
+            `True` if the reminder was removed.
+        """
+
+        def remove(pipeline: "Pipeline") -> bool:
+            if serialised_reminder is not None and (
+                pipeline.hget(self._reminders_key, reminder_key) != serialised_reminder
+            ):
+                return False
+
+            pipeline.multi()
+            pipeline.hdel(self._reminders_key, reminder_key)
+            pipeline.zrem(self._due_key, reminder_key)
+            pipeline.srem(self._conversation_key(sender_id), reminder_key)
+            pipeline.delete(self._lease_key(reminder_key))
+            return True
+
+        return self.red.transaction(
+            remove, self._reminders_key, value_from_callable=True
+        )
+
+    def cancel(
+        self, sender_id: Text, cancellation: ReminderCancelled
+    ) -> List[ScheduledReminder]:
+        if cancellation.name:
+            reminder_keys = [self._reminder_key(sender_id, cancellation.name)]
+        else:
+            reminder_keys = [
+                reminder_key.decode()
+                for reminder_key in self.red.smembers(self._conversation_key(sender_id))
+            ]
+
+        if not reminder_keys:
+            return []
+
+        cancelled = []
+        serialised_reminders = self.red.hmget(self._reminders_key, reminder_keys)
+        for reminder_key, serialised_reminder in zip(
+            reminder_keys, serialised_reminders
+        ):
+            if serialised_reminder is None:
+                continue
+
+            reminder = ScheduledReminder.loads(serialised_reminder)
+            if cancellation.cancels_reminder(reminder.reminder):
+                self._remove(reminder_key, sender_id, None)
+                cancelled.append(reminder)
+
+        return cancelled
+
+    def _claim(self, reminder_key: Text, now: float) -> Optional[ScheduledReminder]:
+        due_timestamp = self.red.zscore(self._due_key, reminder_key)
+        if due_timestamp is None or due_timestamp > now:
+            return None
+
+        # only one Rasa server can create the lease
+        if not self.red.set(
+            self._lease_key(reminder_key),
+            1,
+            nx=True,
+            px=int(self.lease_lifetime * 1000),
+        ):
+            return None
+
+        serialised_reminder = self.red.hget(self._reminders_key, reminder_key)
+        if serialised_reminder is None:
+            return None
+
+        # move the reminder back in the queue so that other servers only look at it
+        # again once the lease expired
+        self.red.zadd(self._due_key, {reminder_key: now + self.lease_lifetime}, xx=True)
+
+        return ScheduledReminder.loads(serialised_reminder)
+
+    def claim(self, sender_id: Text, name: Text) -> Optional[ScheduledReminder]:
+        return self._claim(self._reminder_key(sender_id, name), time.time())
+
+    def claim_due_reminders(
+        self, limit: int = DEFAULT_REMINDER_BATCH_SIZE
+    ) -> List[ScheduledReminder]:
+        now = time.time()
+        reminder_keys = self.red.zrangebyscore(
+            self._due_key, "-inf", now, start=0, num=limit
+        )
+
+        claimed = [
+            self._claim(reminder_key.decode(), now) for reminder_key in reminder_keys
+        ]
+        return [reminder for reminder in claimed if reminder is not None]
+
+    def complete(self, reminder: ScheduledReminder) -> None:
+        self._remove(
+            self._reminder_key(reminder.sender_id, reminder.name),
+            reminder.sender_id,
+            reminder.dumps().encode(),
+        )
+
+
+class SQLReminderStore(ReminderStore):
+    """Stores reminders in an SQL database.
+
+    The reminders table is indexed by due time and by conversation, name and
+    intent. Reminders are claimed with a conditional update of their due time,
+    which only succeeds for one Rasa server.
+    """
+
+    is_persistent = True
+
+    from sqlalchemy.ext.declarative import declarative_base
+
+    Base = declarative_base()
+
+    class SQLReminder(Base):
+        """Represents a reminder in the SQL reminder store."""
+
+        __tablename__ = "reminders"
+        __table_args__ = (
+            sa.UniqueConstraint(
+                "sender_id", "name", name="reminders_sender_id_name_uniq"
+            ),
+            sa.Index("reminders_sender_id_intent_idx", "sender_id", "intent"),
+        )
+
+        # `create_sequence` is needed to create a sequence for databases that
+        # don't autoincrement Integer primary keys (e.g. Oracle)
+        id = sa.Column(sa.Integer, _create_sequence(__tablename__), primary_key=True)
+        sender_id = sa.Column(sa.String(255), nullable=False)
+        name = sa.Column(sa.String(255), nullable=False)
+        intent = sa.Column(sa.String(255))
+        # trigger time of the reminder, or the time the current claim expires
+        due_timestamp = sa.Column(sa.Float, nullable=False, index=True)
+        data = sa.Column(sa.Text, nullable=False)
+
+    def __init__(
+        self,
+        dialect: Text = "sqlite",
+        host: Optional[Text] = None,
+        port: Optional[int] = None,
+        db: Text = "rasa.db",
+        username: Text = None,
+        password: Text = None,
+        query: Optional[Dict] = None,
+        lease_lifetime: float = DEFAULT_REMINDER_LEASE_LIFETIME,
+        polling_interval: float = DEFAULT_REMINDER_POLLING_INTERVAL,
+    ) -> None:
+        """Create a reminder store which uses an SQL database for persistence.
+
+        Args:
+            dialect: SQL database type.
+            host: Database network host.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when connecting to the database.
+            password: Password for database user.
+            query: Dictionary of options to be passed to the dialect and/or the
+                DBAPI upon connect.
+            lease_lifetime: Seconds until the claim of a reminder expires.
+            polling_interval: Seconds between checks for due reminders.
+        """
+        import sqlalchemy.exc
+
+        engine_url = SQLTrackerStore.get_db_url(
+            dialect, host, port, db, username, password, query=query
+        )
+        self.engine = sa.engine.create_engine(
+            engine_url, **create_engine_kwargs(engine_url)
+        )
+
+        try:
+            self.Base.metadata.create_all(self.engine)
+        except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.ProgrammingError) as e:
+            # Several Rasa services started in parallel may attempt to
+            # create tables at the same time. That is okay so long as
+            # the first services finishes the table creation.
+            logger.error(f"Could not create tables: {e}")
+
+        self.sessionmaker = sa.orm.session.sessionmaker(bind=self.engine)
+
+        super().__init__(lease_lifetime, polling_interval)
+
+    @contextlib.contextmanager
+    def session_scope(self) -> Iterator[sa.orm.Session]:
+        """Provide a transactional scope around a series of operations."""
+        session = self.sessionmaker()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def save(self, reminder: ScheduledReminder) -> None:
+        import sqlalchemy.exc
+
+        try:
+            self._save(reminder)
+        except sqlalchemy.exc.IntegrityError:
+            # another Rasa server inserted a reminder with the same name meanwhile
+            self._save(reminder)
+
+    def _save(self, reminder: ScheduledReminder) -> None:
+        with self.session_scope() as session:
+            values = {
+                "intent": reminder.reminder.intent,
+                "due_timestamp": reminder.trigger_timestamp,
+                "data": reminder.dumps(),
+            }
+            updated = (
+                session.query(self.SQLReminder)
+                .filter(
+                    self.SQLReminder.sender_id == reminder.sender_id,
+                    self.SQLReminder.name == reminder.name,
+                )
+                .update(values, synchronize_session=False)
+            )
+            if not updated:
+                session.add(
+                    self.SQLReminder(
+                        sender_id=reminder.sender_id, name=reminder.name, **values
+                    )
+                )
+
+    def cancel(
+        self, sender_id: Text, cancellation: ReminderCancelled
+    ) -> List[ScheduledReminder]:
+        with self.session_scope() as session:
+            query = session.query(self.SQLReminder).filter(
+                self.SQLReminder.sender_id == sender_id
+            )
+            if cancellation.name:
+                query = query.filter(self.SQLReminder.name == cancellation.name)
+            if cancellation.intent:
+                query = query.filter(self.SQLReminder.intent == cancellation.intent)
+
+            cancelled = []
+            for row in query.all():
+                reminder = ScheduledReminder.loads(row.data)
+                if cancellation.cancels_reminder(reminder.reminder):
+                    session.delete(row)
+                    cancelled.append(reminder)
+
+            return cancelled
+
+    def _claim(
+        self, session: sa.orm.Session, row: "SQLReminderStore.SQLReminder", now: float
+    ) -> Optional[ScheduledReminder]:
+        # the update only succeeds if no other Rasa server claimed the reminder
+        # since it was loaded
+        claimed = (
+            session.query(self.SQLReminder)
+            .filter(
+                self.SQLReminder.id == row.id,
+                self.SQLReminder.due_timestamp == row.due_timestamp,
+            )
+            .update(
+                {"due_timestamp": now + self.lease_lifetime}, synchronize_session=False,
+            )
+        )
+        if not claimed:
+            return None
+
+        return ScheduledReminder.loads(row.data)
+
+    def claim(self, sender_id: Text, name: Text) -> Optional[ScheduledReminder]:
+        now = time.time()
+        with self.session_scope() as session:
+            row = (
+                session.query(self.SQLReminder)
+                .filter(
+                    self.SQLReminder.sender_id == sender_id,
+                    self.SQLReminder.name == name,
+                    self.SQLReminder.due_timestamp <= now,
+                )
+                .first()
+            )
+            if row is None:
+                return None
+
+            return self._claim(session, row, now)
+
+    def claim_due_reminders(
+        self, limit: int = DEFAULT_REMINDER_BATCH_SIZE
+    ) -> List[ScheduledReminder]:
+        now = time.time()
+        with self.session_scope() as session:
+            rows = (
+                session.query(self.SQLReminder)
+                .filter(self.SQLReminder.due_timestamp <= now)
+                .order_by(self.SQLReminder.due_timestamp)
+                .limit(limit)
+                .all()
+            )
+
+            claimed = [self._claim(session, row, now) for row in rows]
+            return [reminder for reminder in claimed if reminder is not None]
+
+    def complete(self, reminder: ScheduledReminder) -> None:
+        with self.session_scope() as session:
+            session.query(self.SQLReminder).filter(
+                self.SQLReminder.sender_id == reminder.sender_id,
+                self.SQLReminder.name == reminder.name,
+                self.SQLReminder.data == reminder.dumps(),
+            ).delete(synchronize_session=False)
+
+
+def _create_from_endpoint_config(
+    endpoint_config: Optional[EndpointConfig] = None,
+) -> ReminderStore:
+    """Given an endpoint configuration, create a proper `ReminderStore` object."""
+
+    if (
+        endpoint_config is None
+        or endpoint_config.type is None
+        or endpoint_config.type == "in_memory"
+    ):
+        # this is the default type if no reminder store type is set
+        reminder_store = InMemoryReminderStore()
+    elif endpoint_config.type == "redis":
+        reminder_store = RedisReminderStore(
+            host=endpoint_config.url, **endpoint_config.kwargs
+        )
+    elif endpoint_config.type.lower() == "sql":
+        reminder_store = SQLReminderStore(
+            host=endpoint_config.url, **endpoint_config.kwargs
+        )
+    else:
+        reminder_store = _load_from_module_name_in_endpoint_config(endpoint_config)
+
+    logger.debug(f"Connected to reminder store '{reminder_store.__class__.__name__}'.")
+
+    return reminder_store
+
+
+def _load_from_module_name_in_endpoint_config(
+    endpoint_config: EndpointConfig,
+) -> ReminderStore:
+    """Retrieve a `ReminderStore` based on its class name."""
+
+    try:
+        reminder_store_class = rasa.shared.utils.common.class_from_module_path(
+            endpoint_config.type
+        )
+        return reminder_store_class(endpoint_config=endpoint_config)
+    except (AttributeError, ImportError) as e:
+        raise Exception(
+            f"Could not find a class based on the module path "
+            f"'{endpoint_config.type}'. Failed to create a `ReminderStore` "
+            f"instance. Error: {e}"
+        )
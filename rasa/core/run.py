@@ -10,16 +10,22 @@ import rasa.core.utils
 import rasa.shared.utils.common
 import rasa.utils
 import rasa.utils.common
+import rasa.utils.endpoints
 import rasa.utils.io
 from rasa import model, server
 from rasa.constants import ENV_SANIC_BACKLOG
-from rasa.core import agent, channels, constants
+from rasa.core import agent, channels, constants, jobs
 from rasa.core.agent import Agent
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.channels import console
-from rasa.core.channels.channel import InputChannel
+from rasa.core.channels.channel import (
+    CollectingOutputChannel,
+    InputChannel,
+    OutputChannel,
+)
 from rasa.core.interpreter import NaturalLanguageInterpreter
 from rasa.core.lock_store import LockStore
+from rasa.core.reminder_store import ReminderStore
 from rasa.core.tracker_store import TrackerStore
 from rasa.core.utils import AvailableEndpoints
 import rasa.shared.utils.io
@@ -201,6 +207,7 @@ def serve_application(
         partial(load_agent_on_start, model_path, endpoints, remote_storage),
         "before_server_start",
     )
+    app.register_listener(open_pooled_sessions, "before_server_start")
 
     # noinspection PyUnresolvedReferences
     async def clear_model_files(_app: Sanic, _loop: Text) -> None:
@@ -208,6 +215,7 @@ def serve_application(
             shutil.rmtree(_app.agent.model_directory)
 
     app.register_listener(clear_model_files, "after_server_stop")
+    app.register_listener(close_resources, "after_server_stop")
 
     rasa.utils.common.update_sanic_log_level(log_file)
 
@@ -222,6 +230,53 @@ def serve_application(
     )
 
 
+# noinspection PyUnusedLocal
+async def open_pooled_sessions(app: Sanic, loop: AbstractEventLoop) -> None:
+    """Create the long-lived HTTP sessions of the agent's endpoints.
+
+    The sessions are bound to the event loop of the server. Creating them
+    before the server starts means that the first requests of the users
+    don't have to create them.
+
+    Used to be scheduled on server start
+    (hence the `app` and `loop` arguments)."""
+
+    agent = getattr(app, "agent", None)
+    if not agent:
+        return
+
+    endpoints = [
+        agent.action_endpoint,
+        agent.model_server,
+        getattr(agent.nlg, "nlg_endpoint", None),
+        getattr(agent.interpreter, "endpoint_config", None),
+    ]
+    for endpoint in endpoints:
+        if isinstance(endpoint, rasa.utils.endpoints.EndpointConfig) and endpoint.url:
+            endpoint.pooled_session()
+
+
+# noinspection PyUnusedLocal
+async def close_resources(app: Sanic, loop: AbstractEventLoop) -> None:
+    """Close the connection pools of the HTTP endpoints, the event broker and the
+    threads of the NLU interpreter, the tracker store and the reminder store.
+
+    Used to be scheduled on server stop
+    (hence the `app` and `loop` arguments)."""
+
+    await rasa.utils.endpoints.close_pooled_sessions()
+
+    agent = getattr(app, "agent", None)
+    if agent and agent.interpreter:
+        agent.interpreter.close()
+    if agent and agent.tracker_store:
+        agent.tracker_store.close()
+    if agent and agent.reminder_store:
+        agent.reminder_store.close()
+    if agent and agent.tracker_store and agent.tracker_store.event_broker:
+        agent.tracker_store.event_broker.close()
+
+
 # noinspection PyUnusedLocal
 async def load_agent_on_start(
     model_path: Text,
@@ -239,7 +294,9 @@ async def load_agent_on_start(
     try:
         with model.get_model(model_path) as unpacked_model:
             _, nlu_model = model.get_model_subdirectories(unpacked_model)
-            _interpreter = NaturalLanguageInterpreter.create(endpoints.nlu or nlu_model)
+            _interpreter = NaturalLanguageInterpreter.create(
+                endpoints.nlu or nlu_model, endpoints.nlu_inference
+            )
     except Exception:
         logger.debug(f"Could not load interpreter from '{model_path}'.")
         _interpreter = None
@@ -247,6 +304,7 @@ async def load_agent_on_start(
     _broker = EventBroker.create(endpoints.event_broker)
     _tracker_store = TrackerStore.create(endpoints.tracker_store, event_broker=_broker)
     _lock_store = LockStore.create(endpoints.lock_store)
+    _reminder_store = ReminderStore.create(endpoints.reminder_store)
 
     model_server = endpoints.model if endpoints and endpoints.model else None
 
@@ -259,6 +317,7 @@ async def load_agent_on_start(
             generator=endpoints.nlg,
             tracker_store=_tracker_store,
             lock_store=_lock_store,
+            reminder_store=_reminder_store,
             action_endpoint=endpoints.action,
         )
     except Exception as e:
@@ -276,15 +335,60 @@ async def load_agent_on_start(
             interpreter=_interpreter,
             generator=endpoints.nlg,
             tracker_store=_tracker_store,
+            reminder_store=_reminder_store,
             action_endpoint=endpoints.action,
             model_server=model_server,
             remote_storage=remote_storage,
         )
 
+    await _schedule_reminder_polling(app, _reminder_store)
+
     logger.info("Rasa server is up and running.")
     return app.agent
 
 
+async def _schedule_reminder_polling(app: Sanic, reminder_store: ReminderStore) -> None:
+    """Regularly trigger the due reminders of persistent reminder stores."""
+
+    if not reminder_store.is_persistent:
+        # reminders of other stores are triggered by the server which scheduled them
+        return
+
+    (await jobs.scheduler()).add_job(
+        _handle_due_reminders,
+        "interval",
+        seconds=reminder_store.polling_interval,
+        args=[app],
+        id="handle-due-reminders",
+        replace_existing=True,
+    )
+
+
+async def _handle_due_reminders(app: Sanic) -> None:
+    # the agent might be replaced while the server is running
+    if app.agent:
+        await app.agent.handle_due_reminders(
+            partial(_output_channel_for_input_channel, app)
+        )
+
+
+def _output_channel_for_input_channel(
+    app: Sanic, input_channel: Optional[Text]
+) -> OutputChannel:
+    """Returns the `OutputChannel` of the input channel with name `input_channel`.
+
+    Falls back to a `CollectingOutputChannel` if the input channel isn't
+    registered or doesn't provide an output channel.
+    """
+    for channel in getattr(app, "input_channels", None) or []:
+        if channel.name() == input_channel:
+            output_channel = channel.get_output_channel()
+            if output_channel:
+                return output_channel
+
+    return CollectingOutputChannel()
+
+
 if __name__ == "__main__":
     raise RuntimeError(
         "Calling `rasa.core.run` directly is no longer supported. "
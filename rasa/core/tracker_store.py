@@ -1,13 +1,18 @@
+import asyncio
 import contextlib
+import functools
 import itertools
 import json
 import logging
 import os
 import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from time import sleep
 from typing import (
+    Any,
     Callable,
     Dict,
     Iterable,
@@ -29,6 +34,8 @@ from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
     POSTGRESQL_MAX_OVERFLOW,
     POSTGRESQL_POOL_SIZE,
+    TRACKER_STORE_THREAD_POOL_SIZE,
+    DEFAULT_TRACKER_STORE_THREAD_POOL_SIZE,
 )
 from rasa.core.conversation import Dialogue
 from rasa.core.domain import Domain
@@ -54,6 +61,16 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# key of the stored number of events since the latest `SessionStarted` event
+SESSION_EVENT_COUNT_KEY = "number_of_session_events"
+
+# events which `save` streamed in a thread of the thread pool of a tracker store;
+# `save_async` publishes them on the event loop once they are saved
+_deferred_event_bodies = threading.local()
+
+# prefix of all keys under which `RedisTrackerStore` stores conversations
+DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "rasa_tracker"
+
 
 class TrackerStore:
     """Class to hold all of the TrackerStore classes"""
@@ -159,12 +176,25 @@ class TrackerStore:
         raise NotImplementedError()
 
     def stream_events(self, tracker: DialogueStateTracker) -> None:
-        """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
-        events = tracker.events
-        for event in list(itertools.islice(events, offset, len(events))):
+        """Streams the events which weren't saved yet to a message broker."""
+        events = tracker.unpersisted_events()
+        if events is None:
+            # the tracker doesn't know which of its events are saved, count them
+            offset = self.number_of_existing_events(tracker.sender_id)
+            events = list(itertools.islice(tracker.events, offset, len(tracker.events)))
+
+        bodies = []
+        for event in events:
             body = {"sender_id": tracker.sender_id}
             body.update(event.as_dict())
+            bodies.append(body)
+
+        deferred_bodies = getattr(_deferred_event_bodies, "bodies", None)
+        if deferred_bodies is not None:
+            deferred_bodies.extend(bodies)
+            return
+
+        for body in bodies:
             self.event_broker.publish(body)
 
     def number_of_existing_events(self, sender_id: Text) -> int:
@@ -176,6 +206,102 @@ class TrackerStore:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
 
+    @property
+    def has_blocking_io(self) -> bool:
+        """Whether `retrieve`, `save` and `keys` block while waiting for IO.
+
+        The asynchronous methods (e.g. `retrieve_async`) run the blocking methods
+        in a thread pool, so that they don't block the event loop. Tracker stores
+        which don't wait for IO or use asynchronous drivers should override this
+        or the asynchronous methods.
+        """
+        return True
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Asynchronous version of `retrieve`."""
+        return await self._run_blocking(self.retrieve, sender_id)
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Asynchronous version of `save`.
+
+        Event brokers aren't thread-safe. The new events are therefore published
+        on the event loop once `save` stored them in a thread of the thread pool.
+        """
+        if not self.has_blocking_io:
+            self.save(tracker)
+            return
+
+        bodies = await self._run_blocking(self._save_with_deferred_streaming, tracker)
+        for body in bodies:
+            self.event_broker.publish(body)
+
+    def _save_with_deferred_streaming(
+        self, tracker: DialogueStateTracker
+    ) -> List[Dict[Text, Any]]:
+        """Save the tracker and return the events instead of streaming them."""
+        _deferred_event_bodies.bodies = []
+        try:
+            self.save(tracker)
+            return _deferred_event_bodies.bodies
+        finally:
+            _deferred_event_bodies.bodies = None
+
+    async def keys_async(self) -> Iterable[Text]:
+        """Asynchronous version of `keys`."""
+        return await self._run_blocking(self.keys)
+
+    async def get_or_create_tracker_async(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> "DialogueStateTracker":
+        """Asynchronous version of `get_or_create_tracker`."""
+        tracker = await self.retrieve_async(sender_id)
+        self.max_event_history = max_event_history
+        if tracker is None:
+            tracker = self.init_tracker(sender_id)
+
+            if append_action_listen:
+                tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+            await self.save_async(tracker)
+
+        return tracker
+
+    async def _run_blocking(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking method of the tracker store in its thread pool."""
+        if not self.has_blocking_io:
+            return func(*args)
+
+        # not created in `__init__` as custom tracker stores might not call it
+        if getattr(self, "_thread_pool", None) is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=int(
+                    os.environ.get(
+                        TRACKER_STORE_THREAD_POOL_SIZE,
+                        DEFAULT_TRACKER_STORE_THREAD_POOL_SIZE,
+                    )
+                ),
+                thread_name_prefix="tracker_store",
+            )
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._thread_pool, functools.partial(func, *args)
+        )
+
+    def close(self) -> None:
+        """Stop the thread pool of the asynchronous methods.
+
+        Scheduled calls are still finished. Calling an asynchronous method later
+        starts a new thread pool.
+        """
+        thread_pool = getattr(self, "_thread_pool", None)
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
     @staticmethod
     def serialise_tracker(tracker: DialogueStateTracker) -> Text:
         """Serializes the tracker, returns representation of the tracker."""
@@ -232,6 +358,7 @@ class InMemoryTrackerStore(TrackerStore):
             self.stream_events(tracker)
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        tracker.mark_events_as_persisted()
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """
@@ -243,7 +370,10 @@ class InMemoryTrackerStore(TrackerStore):
         """
         if sender_id in self.store:
             logger.debug(f"Recreating tracker for id '{sender_id}'")
-            return self.deserialise_tracker(sender_id, self.store[sender_id])
+            tracker = self.deserialise_tracker(sender_id, self.store[sender_id])
+            if tracker:
+                tracker.mark_events_as_persisted()
+            return tracker
         else:
             logger.debug(f"Creating a new tracker for id '{sender_id}'.")
             return None
@@ -252,6 +382,10 @@ class InMemoryTrackerStore(TrackerStore):
         """Returns sender_ids of the Tracker Store in memory"""
         return self.store.keys()
 
+    @property
+    def has_blocking_io(self) -> bool:
+        return False
+
 
 class RedisTrackerStore(TrackerStore):
     """Stores conversation history in Redis"""
@@ -266,6 +400,7 @@ class RedisTrackerStore(TrackerStore):
         event_broker: Optional[EventBroker] = None,
         record_exp: Optional[float] = None,
         use_ssl: bool = False,
+        key_prefix: Text = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
     ):
         import redis
 
@@ -273,18 +408,162 @@ class RedisTrackerStore(TrackerStore):
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        self.key_prefix = key_prefix
         super().__init__(domain, event_broker)
 
+    @property
+    def _events_key_prefix(self) -> Text:
+        return f"{self.key_prefix}:events:"
+
+    def _events_key(self, sender_id: Text) -> Text:
+        return f"{self._events_key_prefix}{sender_id}"
+
+    def _session_events_key(self, sender_id: Text) -> Text:
+        return f"{self.key_prefix}:session_events:{sender_id}"
+
+    @property
+    def _conversations_key(self) -> Text:
+        return f"{self.key_prefix}:conversations"
+
+    @property
+    def _serialised_trackers_indexed_key(self) -> Text:
+        return f"{self.key_prefix}:serialised_trackers_indexed"
+
+    def _retrieved_events_key(self, sender_id: Text) -> Text:
+        if self.load_events_from_previous_conversation_sessions:
+            return self._events_key(sender_id)
+        return self._session_events_key(sender_id)
+
     def save(self, tracker, timeout=None):
-        """Saves the current conversation state"""
+        """Appends the new events of the conversation to the stored events."""
         if self.event_broker:
             self.stream_events(tracker)
 
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(tracker.sender_id, serialised_tracker, ex=timeout)
+        sender_id = tracker.sender_id
+        additional_events = tracker.unpersisted_events()
+        if additional_events is None:
+            number_of_stored_events = self._number_of_stored_events(sender_id)
+            additional_events = list(
+                itertools.islice(
+                    tracker.events, number_of_stored_events, len(tracker.events)
+                )
+            )
+
+        serialised_events = [json.dumps(event.as_dict()) for event in additional_events]
+        session_start_indices = [
+            idx
+            for idx, event in enumerate(additional_events)
+            if isinstance(event, SessionStarted)
+        ]
+
+        pipeline = self.red.pipeline()
+        if serialised_events:
+            pipeline.rpush(self._events_key(sender_id), *serialised_events)
+            pipeline.sadd(self._conversations_key, sender_id)
+        if session_start_indices:
+            # the latest session starts with the new events
+            pipeline.delete(self._session_events_key(sender_id))
+            serialised_events = serialised_events[max(session_start_indices) :]
+        if serialised_events:
+            pipeline.rpush(self._session_events_key(sender_id), *serialised_events)
+        if timeout:
+            pipeline.expire(self._events_key(sender_id), int(timeout))
+            pipeline.expire(self._session_events_key(sender_id), int(timeout))
+        pipeline.execute()
+
+        tracker.mark_events_as_persisted()
+
+    def _number_of_stored_events(self, sender_id: Text) -> int:
+        """Return the number of stored events which `retrieve` loads.
+
+        Migrates the conversation if it was stored by a previous version.
+
+        Args:
+            sender_id: The conversation ID.
+
+        Returns:
+            Number of stored events of the latest conversation session or of all
+            sessions if events from previous sessions are loaded.
+        """
+        number_of_events = self.red.llen(self._retrieved_events_key(sender_id))
+        if not number_of_events and self._migrate_serialised_tracker(sender_id):
+            number_of_events = self.red.llen(self._retrieved_events_key(sender_id))
+
+        return number_of_events
+
+    def _stored_serialised_tracker(self, key: Text) -> Optional[bytes]:
+        """Return the serialised tracker which a previous version stored under `key`.
+
+        Args:
+            key: The key, which is the conversation ID of the serialised tracker.
+
+        Returns:
+            The serialised tracker or `None` if `key` doesn't hold a serialised
+            tracker of this conversation ID.
+        """
+        if self.red.type(key) not in (b"string", "string"):
+            return None
+
+        serialised_tracker = self.red.get(key)
+        try:
+            stored = json.loads(serialised_tracker)
+        except (TypeError, ValueError):
+            return None
+
+        if not isinstance(stored, dict) or stored.get("name") != key:
+            return None
+
+        return serialised_tracker
+
+    def _migrate_serialised_tracker(self, sender_id: Text) -> bool:
+        """Convert a conversation stored as a single serialised tracker to lists.
+
+        Previous versions stored the whole serialised tracker under the conversation
+        ID. Its events are moved to the lists of events of the conversation.
+
+        Args:
+            sender_id: The conversation ID.
+
+        Returns:
+            `True` if a serialised tracker of this conversation was migrated.
+        """
+        serialised_tracker = self._stored_serialised_tracker(sender_id)
+        if serialised_tracker is None:
+            return False
+
+        tracker = self.deserialise_tracker(sender_id, serialised_tracker)
+        if tracker is None:
+            return False
+
+        events = [json.dumps(event.as_dict()) for event in tracker.events]
+        session_start_indices = [
+            idx
+            for idx, event in enumerate(tracker.events)
+            if isinstance(event, SessionStarted)
+        ]
+        session_events = events[max(session_start_indices, default=0) :]
+
+        logger.debug(
+            f"Migrating serialised tracker with sender_id '{sender_id}' to lists "
+            f"of events."
+        )
+        pipeline = self.red.pipeline()
+        pipeline.delete(self._events_key(sender_id))
+        pipeline.delete(self._session_events_key(sender_id))
+        if events:
+            pipeline.rpush(self._events_key(sender_id), *events)
+            pipeline.rpush(self._session_events_key(sender_id), *session_events)
+            pipeline.sadd(self._conversations_key, sender_id)
+        if self.record_exp:
+            pipeline.expire(self._events_key(sender_id), int(self.record_exp))
+            pipeline.expire(self._session_events_key(sender_id), int(self.record_exp))
+        pipeline.delete(sender_id)
+        pipeline.execute()
+
+        return True
 
     def retrieve(self, sender_id):
         """
@@ -294,15 +573,68 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             DialogueStateTracker
         """
-        stored = self.red.get(sender_id)
-        if stored is not None:
-            return self.deserialise_tracker(sender_id, stored)
-        else:
+        stored_events = self.red.lrange(self._retrieved_events_key(sender_id), 0, -1)
+        if not stored_events and self._migrate_serialised_tracker(sender_id):
+            stored_events = self.red.lrange(
+                self._retrieved_events_key(sender_id), 0, -1
+            )
+
+        if not stored_events:
             return None
 
+        tracker = DialogueStateTracker.from_dict(
+            sender_id,
+            [json.loads(event) for event in stored_events],
+            self.domain.slots,
+            self.max_event_history,
+        )
+        tracker.mark_events_as_persisted()
+        return tracker
+
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store"""
-        return self.red.keys()
+        self._index_serialised_trackers()
+
+        sender_ids = [
+            sender_id.decode() if isinstance(sender_id, bytes) else sender_id
+            for sender_id in self.red.smembers(self._conversations_key)
+        ]
+        if not self.record_exp or not sender_ids:
+            return sender_ids
+
+        # conversations expire, but the set of conversation IDs doesn't
+        pipeline = self.red.pipeline()
+        for sender_id in sender_ids:
+            pipeline.exists(self._events_key(sender_id), sender_id)
+        stored = pipeline.execute()
+
+        expired = {
+            sender_id for sender_id, exists in zip(sender_ids, stored) if not exists
+        }
+        if expired:
+            self.red.srem(self._conversations_key, *expired)
+
+        return [sender_id for sender_id in sender_ids if sender_id not in expired]
+
+    def _index_serialised_trackers(self) -> None:
+        """Add the conversations stored by a previous version to the conversation IDs.
+
+        Previous versions didn't keep a set of conversation IDs. Their serialised
+        trackers are found once by scanning the database.
+        """
+        if self.red.exists(self._serialised_trackers_indexed_key):
+            return
+
+        pipeline = self.red.pipeline()
+        for key in self.red.scan_iter():
+            key = key.decode() if isinstance(key, bytes) else key
+            if (
+                not key.startswith(f"{self.key_prefix}:")
+                and self._stored_serialised_tracker(key) is not None
+            ):
+                pipeline.sadd(self._conversations_key, key)
+        pipeline.set(self._serialised_trackers_indexed_key, 1)
+        pipeline.execute()
 
 
 class DynamoTrackerStore(TrackerStore):
@@ -330,9 +662,29 @@ class DynamoTrackerStore(TrackerStore):
         self.client = boto3.client("dynamodb", region_name=region)
         self.region = region
         self.table_name = table_name
-        self.db = self.get_or_create_table(table_name)
+        self._tables = threading.local()
+        self._tables.db = self.get_or_create_table(table_name)
         super().__init__(domain, event_broker)
 
+    @property
+    def db(self) -> "boto3.resources.factory.dynamodb.Table":
+        """The table for the calling thread.
+
+        boto3 resources aren't thread-safe, so every thread of the thread pool of
+        the tracker store uses its own resource.
+        """
+        table = getattr(self._tables, "db", None)
+        if table is None:
+            import boto3
+
+            dynamo = boto3.session.Session().resource(
+                "dynamodb", region_name=self.region
+            )
+            table = dynamo.Table(self.table_name)
+            self._tables.db = table
+
+        return table
+
     def get_or_create_table(
         self, table_name: Text
     ) -> "boto3.resources.factory.dynamodb.Table":
@@ -365,6 +717,7 @@ class DynamoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
         self.db.put_item(Item=self.serialise_tracker(tracker))
+        tracker.mark_events_as_persisted()
 
     def serialise_tracker(self, tracker: "DialogueStateTracker") -> Dict:
         """Serializes the tracker, returns object with decimal types"""
@@ -396,9 +749,11 @@ class DynamoTrackerStore(TrackerStore):
         # `float`s are stored as `Decimal` objects - we need to convert them back
         events_with_floats = core_utils.replace_decimals_with_floats(events)
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             sender_id, events_with_floats, self.domain.slots
         )
+        tracker.mark_events_as_persisted()
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the DynamoTrackerStore"""
@@ -468,19 +823,48 @@ class MongoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        state = self._current_tracker_state_without_events(tracker)
+        update = {"$set": state}
+
+        additional_events = tracker.unpersisted_events()
+        number_of_stored_session_events = None
+        if additional_events is None:
+            number_of_stored_session_events = self._number_of_stored_session_events(
+                tracker.sender_id
+            )
+            additional_events = list(
+                itertools.islice(
+                    tracker.events, number_of_stored_session_events, len(tracker.events)
+                )
+            )
 
+        # keep track of the number of events in the latest session, so that
+        # neither `save` nor `retrieve` have to load previous sessions
+        session_start_indices = [
+            idx
+            for idx, event in enumerate(additional_events)
+            if isinstance(event, SessionStarted)
+        ]
+        if session_start_indices:
+            state[SESSION_EVENT_COUNT_KEY] = len(additional_events) - max(
+                session_start_indices
+            )
+        elif number_of_stored_session_events is not None:
+            state[SESSION_EVENT_COUNT_KEY] = number_of_stored_session_events + len(
+                additional_events
+            )
+        else:
+            update["$inc"] = {SESSION_EVENT_COUNT_KEY: len(additional_events)}
+
+        update["$push"] = {
+            "events": {"$each": [e.as_dict() for e in additional_events]}
+        }
         self.conversations.update_one(
-            {"sender_id": tracker.sender_id},
-            {
-                "$set": self._current_tracker_state_without_events(tracker),
-                "$push": {
-                    "events": {"$each": [e.as_dict() for e in additional_events]}
-                },
-            },
-            upsert=True,
+            {"sender_id": tracker.sender_id}, update, upsert=True
         )
 
+        tracker.mark_events_as_persisted()
+
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
@@ -492,16 +876,40 @@ class MongoTrackerStore(TrackerStore):
 
         """
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+        unpersisted_events = tracker.unpersisted_events()
+        if unpersisted_events is not None:
+            return iter(unpersisted_events)
+
+        number_events_since_last_session = self._number_of_stored_session_events(
+            tracker.sender_id
         )
 
         return itertools.islice(
             tracker.events, number_events_since_last_session, len(tracker.events)
         )
 
+    def _number_of_stored_session_events(self, sender_id: Text) -> int:
+        """Return the number of stored events since the latest `SessionStarted` event.
+
+        Args:
+            sender_id: The conversation ID.
+
+        Returns:
+            Number of stored events of the latest conversation session.
+        """
+
+        stored = (
+            self.conversations.find_one({"sender_id": sender_id}, {"events": False})
+            or {}
+        )
+        if SESSION_EVENT_COUNT_KEY in stored or not stored:
+            return stored.get(SESSION_EVENT_COUNT_KEY, 0)
+
+        # conversations stored by previous versions don't have the event count
+        stored = self.conversations.find_one({"sender_id": sender_id}) or {}
+        all_events = self._events_from_serialized_tracker(stored)
+        return len(self._events_since_last_session_start(all_events))
+
     @staticmethod
     def _events_from_serialized_tracker(serialised: Dict) -> List[Dict]:
         return serialised.get("events", [])
@@ -535,7 +943,11 @@ class MongoTrackerStore(TrackerStore):
         Returns:
             `DialogueStateTracker`
         """
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        # load the conversation without its events first to find out how many events
+        # the latest conversation session has
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, {"events": False}
+        )
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
@@ -545,21 +957,40 @@ class MongoTrackerStore(TrackerStore):
             stored = self.conversations.find_one_and_update(
                 {"sender_id": int(sender_id)},
                 {"$set": {"sender_id": str(sender_id)}},
+                projection={"events": False},
                 return_document=ReturnDocument.AFTER,
             )
 
         if not stored:
             return
 
-        events = self._events_from_serialized_tracker(stored)
-        if not self.load_events_from_previous_conversation_sessions:
-            events = self._events_since_last_session_start(events)
-
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        number_of_session_events = stored.get(SESSION_EVENT_COUNT_KEY)
+        if (
+            number_of_session_events is not None
+            and not self.load_events_from_previous_conversation_sessions
+        ):
+            stored = self.conversations.find_one(
+                {"sender_id": sender_id},
+                {"events": {"$slice": -number_of_session_events}},
+            )
+            events = self._events_from_serialized_tracker(stored)
+        else:
+            stored = self.conversations.find_one({"sender_id": sender_id})
+            events = self._events_from_serialized_tracker(stored)
+            if not self.load_events_from_previous_conversation_sessions:
+                events = self._events_since_last_session_start(events)
+
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        if number_of_session_events is not None:
+            # `save` can only increment the event count of up-to-date conversations
+            tracker.mark_events_as_persisted()
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store"""
-        return [c["sender_id"] for c in self.conversations.find()]
+        return [
+            c["sender_id"] for c in self.conversations.find({}, {"sender_id": True})
+        ]
 
 
 def _create_sequence(table_name: Text) -> "Sequence":
@@ -666,6 +1097,10 @@ class SQLTrackerStore(TrackerStore):
         """Represents an event in the SQL Tracker Store"""
 
         __tablename__ = "events"
+        __table_args__ = (
+            # speeds up the retrieval of the events of a conversation in order
+            sa.Index("events_sender_id_timestamp_idx", "sender_id", "timestamp"),
+        )
 
         # `create_sequence` is needed to create a sequence for databases that
         # don't autoincrement Integer primary keys (e.g. Oracle)
@@ -838,6 +1273,15 @@ class SQLTrackerStore(TrackerStore):
         finally:
             session.close()
 
+    @property
+    def has_blocking_io(self) -> bool:
+        # every thread has its own in-memory SQLite database
+        url = self.engine.url
+        return not (
+            url.drivername.startswith("sqlite")
+            and url.database in (None, "", ":memory:")
+        )
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the SQLTrackerStore"""
         with self.session_scope() as session:
@@ -855,9 +1299,11 @@ class SQLTrackerStore(TrackerStore):
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
+                tracker = DialogueStateTracker.from_dict(
                     sender_id, events, self.domain.slots
                 )
+                tracker.mark_events_as_persisted()
+                return tracker
             else:
                 logger.debug(
                     f"Can't retrieve tracker matching "
@@ -911,27 +1357,29 @@ class SQLTrackerStore(TrackerStore):
             # only store recent events
             events = self._additional_events(session, tracker)
 
+            rows = []
             for event in events:
                 data = event.as_dict()
                 intent = (
                     data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
                 )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
+                rows.append(
+                    {
+                        "sender_id": tracker.sender_id,
+                        "type_name": event.type_name,
+                        "timestamp": data.get("timestamp"),
+                        "intent_name": intent,
+                        "action_name": data.get("name"),
+                        "data": json.dumps(data),
+                    }
                 )
+
+            if rows:
+                session.bulk_insert_mappings(self.SQLEvent, rows)
             session.commit()
 
+        tracker.mark_events_as_persisted()
+
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
     def _additional_events(
@@ -939,6 +1387,11 @@ class SQLTrackerStore(TrackerStore):
     ) -> Iterator:
         """Return events from the tracker which aren't currently stored."""
 
+        unpersisted_events = tracker.unpersisted_events()
+        if unpersisted_events is not None:
+            return iter(unpersisted_events)
+
+        # the tracker doesn't know which of its events are stored, count them
         number_of_events_since_last_session = self._event_query(
             session, tracker.sender_id
         ).count()
@@ -1009,6 +1462,13 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return None
 
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        try:
+            return await self._tracker_store.retrieve_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
     def keys(self) -> Iterable[Text]:
         try:
             return self._tracker_store.keys()
@@ -1016,12 +1476,49 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return []
 
+    async def keys_async(self) -> Iterable[Text]:
+        try:
+            return await self._tracker_store.keys_async()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
     def save(self, tracker: DialogueStateTracker) -> None:
         try:
             self._tracker_store.save(tracker)
         except Exception as e:
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
+            self._forget_persisted_events(tracker)
+        else:
+            self._mark_saved_tracker(tracker)
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        try:
+            await self._tracker_store.save_async(tracker)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_async(tracker)
+            self._forget_persisted_events(tracker)
+        else:
+            self._mark_saved_tracker(tracker)
+
+    def close(self) -> None:
+        self._tracker_store.close()
+        if self._fallback_tracker_store:
+            self._fallback_tracker_store.close()
+        super().close()
+
+    @staticmethod
+    def _mark_saved_tracker(tracker: DialogueStateTracker) -> None:
+        if isinstance(tracker, DialogueStateTracker):
+            tracker.mark_events_as_persisted()
+
+    @staticmethod
+    def _forget_persisted_events(tracker: DialogueStateTracker) -> None:
+        # the primary tracker store might have persisted any of the events
+        if isinstance(tracker, DialogueStateTracker):
+            tracker.forget_persisted_events()
 
 
 def _create_from_endpoint_config(
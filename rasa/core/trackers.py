@@ -180,6 +180,13 @@ class DialogueStateTracker:
         self.latest_bot_utterance = None
         self._reset()
         self.active_loop: Dict[Text, Union[Text, bool, Dict, None]] = {}
+        # states of the tracker history which are extended incrementally with
+        # newly applied events (see `past_states`)
+        self._past_states_cache: Optional[_PastStatesCache] = None
+        # whether the events up to `_latest_persisted_event` are known to be
+        # persisted in a tracker store (see `mark_events_as_persisted`)
+        self._has_persisted_events_marker = False
+        self._latest_persisted_event: Optional[Event] = None
 
     ###
     # Public tracker interface
@@ -237,13 +244,23 @@ class DialogueStateTracker:
     def past_states(self, domain: Domain) -> List[State]:
         """Generate the past states of this tracker based on the history.
 
+        The states are cached on the tracker and only the events which were applied
+        since the last call are replayed. This means that all policies of an
+        ensemble share the states which were created for the first policy.
+
         Args:
             domain: a :class:`rasa.core.domain.Domain`
 
         Returns:
             a list of states
         """
-        return domain.states_for_tracker_history(self)
+        if (
+            self._past_states_cache is None
+            or self._past_states_cache.domain is not domain
+        ):
+            self._past_states_cache = _PastStatesCache(self, domain)
+
+        return self._past_states_cache.past_states(self)
 
     def change_loop_to(self, loop_name: Text) -> None:
         """Set the currently active loop.
@@ -362,6 +379,44 @@ class DialogueStateTracker:
         """Return a list of events after the most recent restart."""
         return list(self.events)[self.idx_after_latest_restart() :]
 
+    def mark_events_as_persisted(self) -> None:
+        """Remember that all current events are persisted in a tracker store.
+
+        Tracker stores call this after retrieving or saving the tracker, so that
+        they can find the events which need to be saved next without querying
+        their storage (see `unpersisted_events`).
+        """
+        self._has_persisted_events_marker = True
+        self._latest_persisted_event = self.events[-1] if self.events else None
+
+    def forget_persisted_events(self) -> None:
+        """Forget which events are persisted, e.g. after a tracker store failed."""
+        self._has_persisted_events_marker = False
+        self._latest_persisted_event = None
+
+    def unpersisted_events(self) -> Optional[List[Event]]:
+        """Return the events which were added since `mark_events_as_persisted`.
+
+        Returns:
+            The new events or `None` if it is unknown which events are persisted,
+            e.g. because the tracker was never marked or its events were replaced.
+        """
+        if not self._has_persisted_events_marker:
+            return None
+
+        if self._latest_persisted_event is None:
+            return list(self.events)
+
+        new_events = []
+        for event in reversed(self.events):
+            if event is self._latest_persisted_event:
+                new_events.reverse()
+                return new_events
+            new_events.append(event)
+
+        # the latest persisted event isn't part of the tracker anymore
+        return None
+
     def init_copy(self) -> "DialogueStateTracker":
         """Creates a new state tracker with the same initial values."""
         from rasa.core.channels.channel import UserMessage
@@ -751,6 +806,92 @@ class DialogueStateTracker:
         )
 
 
+class _PastStatesCache:
+    """Append-only cache of the states of a tracker's history.
+
+    Replays the applied events of a tracker on a shadow tracker and stores the
+    state before each `ActionExecuted` event. Subsequent calls only replay the
+    events which were applied in the meantime. If the cached events are no longer
+    a prefix of the applied events (e.g. after a `Restarted`, `ActionReverted`,
+    `UserUtteranceReverted` event or a loop undo), the cache is rebuilt.
+    """
+
+    def __init__(self, tracker: DialogueStateTracker, domain: Domain) -> None:
+        self.domain = domain
+        self._reset(tracker)
+
+    def _reset(self, tracker: DialogueStateTracker) -> None:
+        self._shadow_tracker = tracker.init_copy()
+        self._applied_events: List[Event] = []
+        self._states: List[State] = []
+        self._current_state: State = self._active_state()
+        # number of events and last event of the tracker when the cache was updated
+        self._events_fingerprint: Tuple[int, Optional[Event]] = (0, None)
+
+    def _active_state(self) -> State:
+        state = self.domain.get_active_states(self._shadow_tracker)
+        # copy the sub states since they might be mutated by the shadow tracker
+        # or the caller
+        return _copy_state(state)
+
+    @staticmethod
+    def _fingerprint(tracker: DialogueStateTracker) -> Tuple[int, Optional[Event]]:
+        latest_event = tracker.events[-1] if tracker.events else None
+        return len(tracker.events), latest_event
+
+    def _is_up_to_date(self, tracker: DialogueStateTracker) -> bool:
+        number_of_events, latest_event = self._fingerprint(tracker)
+        cached_number_of_events, cached_latest_event = self._events_fingerprint
+        return (
+            number_of_events == cached_number_of_events
+            and latest_event is cached_latest_event
+        )
+
+    def _is_extended_by(self, applied_events: List[Event]) -> bool:
+        if len(applied_events) < len(self._applied_events):
+            return False
+
+        return all(
+            cached is applied
+            for cached, applied in zip(self._applied_events, applied_events)
+        )
+
+    def _update(self, tracker: DialogueStateTracker) -> None:
+        applied_events = tracker.applied_events()
+        if not self._is_extended_by(applied_events):
+            self._reset(tracker)
+
+        new_events = applied_events[len(self._applied_events) :]
+        for event in new_events:
+            if isinstance(event, ActionExecuted):
+                self._states.append(self._current_state)
+
+            self._shadow_tracker.update(event)
+            self._current_state = self._active_state()
+
+        self._applied_events = applied_events
+        self._events_fingerprint = self._fingerprint(tracker)
+
+    def past_states(self, tracker: DialogueStateTracker) -> List[State]:
+        """Returns the states for each state of the tracker's history.
+
+        Args:
+            tracker: The tracker the cache belongs to.
+
+        Returns:
+            The states before each applied `ActionExecuted` event and the current
+            state of the tracker.
+        """
+        if not self._is_up_to_date(tracker):
+            self._update(tracker)
+
+        return [_copy_state(state) for state in self._states + [self._current_state]]
+
+
+def _copy_state(state: State) -> State:
+    return {key: dict(sub_state) for key, sub_state in state.items()}
+
+
 def get_active_loop_name(state: State) -> Optional[Text]:
     """Get the name of current active loop.
 
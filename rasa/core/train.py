@@ -32,6 +32,7 @@ async def train(
 ):
     from rasa.core.agent import Agent
     from rasa.core import config, utils
+    from rasa.core.featurizers.training_states import TrainingStates
     from rasa.core.utils import AvailableEndpoints
 
     if not endpoints:
@@ -58,12 +59,17 @@ async def train(
             "augmentation_factor",
             "remove_duplicates",
             "debug_plots",
+            "generation_workers",
         },
     )
     training_data = await agent.load_data(
         training_resource, exclusion_percentage=exclusion_percentage, **data_load_args
     )
-    agent.train(training_data, **additional_arguments)
+    agent.train(
+        training_data,
+        training_states=TrainingStates.from_environment(agent.domain),
+        **additional_arguments,
+    )
     agent.persist(output_path)
 
     return agent
@@ -53,6 +53,7 @@ async def load_data(
     use_story_concatenation: bool = True,
     debug_plots: bool = False,
     exclusion_percentage: Optional[int] = None,
+    generation_workers: int = 1,
 ) -> List["DialogueStateTracker"]:
     """
     Load training data from a resource.
@@ -73,6 +74,8 @@ async def load_data(
             generate debug plots during loading
         exclusion_percentage:
             how much data to exclude
+        generation_workers:
+            number of processes which generate and augment the trackers
 
     Returns:
         list of loaded trackers
@@ -99,6 +102,7 @@ async def load_data(
             tracker_limit,
             use_story_concatenation,
             debug_plots,
+            num_workers=generation_workers,
         )
         return g.generate()
     else:
@@ -1,6 +1,8 @@
 from collections import defaultdict, namedtuple, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 
 import copy
+import hashlib
 import logging
 import random
 from tqdm import tqdm
@@ -33,6 +35,13 @@ import rasa.shared.utils.io
 
 logger = logging.getLogger(__name__)
 
+# parameters of the polynomial rolling hash over the states of a tracker
+STATES_HASH_MODULUS = (1 << 61) - 1
+STATES_HASH_BASE = 1_000_003
+
+# steps with fewer trackers per worker are processed in the main process
+MIN_TRACKERS_PER_WORKER = 50
+
 ExtractorConfig = namedtuple(
     "ExtractorConfig",
     "remove_duplicates "
@@ -41,10 +50,24 @@ ExtractorConfig = namedtuple(
     "max_number_of_augmented_trackers "
     "tracker_limit "
     "use_story_concatenation "
-    "rand",
+    "rand "
+    "num_workers",
 )
 
 
+def _hash_state(frozen_state: FrozenState) -> int:
+    """Hash a state independently of the process which hashes it.
+
+    The built-in `hash` of strings differs between processes, so it can't be used
+    to compare states of trackers which were created in different worker processes.
+    """
+    canonical_state = repr(
+        sorted((key, sorted(sub_state)) for key, sub_state in frozen_state)
+    )
+    digest = hashlib.blake2b(canonical_state.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % STATES_HASH_MODULUS
+
+
 class TrackerWithCachedStates(DialogueStateTracker):
     """A tracker wrapper that caches the state creation of the tracker."""
 
@@ -61,6 +84,8 @@ class TrackerWithCachedStates(DialogueStateTracker):
             sender_id, slots, max_event_history, is_rule_tracker=is_rule_tracker
         )
         self._states_for_hashing = None
+        # `_prefix_hashes[i]` is the rolling hash of the first `i` states
+        self._prefix_hashes = None
         self.domain = domain
         # T/F property to filter augmented stories
         self.is_augmented = is_augmented
@@ -92,13 +117,48 @@ class TrackerWithCachedStates(DialogueStateTracker):
         # if don't have it cached, we use the domain to calculate the states
         # from the events
         if self._states_for_hashing is None:
-            states = super().past_states(domain)
-            self._states_for_hashing = deque(
-                self.freeze_current_state(s) for s in states
-            )
+            states = domain.states_for_tracker_history(self)
+            self._states_for_hashing = deque()
+            self._prefix_hashes = [0]
+            for state in states:
+                self._push_state(self.freeze_current_state(state))
 
         return self._states_for_hashing
 
+    def _push_state(self, frozen_state: FrozenState) -> None:
+        self._states_for_hashing.append(frozen_state)
+        self._prefix_hashes.append(
+            (self._prefix_hashes[-1] * STATES_HASH_BASE + _hash_state(frozen_state))
+            % STATES_HASH_MODULUS
+        )
+
+    def _pop_state(self) -> None:
+        self._states_for_hashing.pop()
+        self._prefix_hashes.pop()
+
+    def hash_of_past_states(
+        self, domain: Domain, last_num_states: Optional[int] = None
+    ) -> int:
+        """Return a rolling hash of the (last) states of the tracker.
+
+        Args:
+            domain: The domain of the tracker.
+            last_num_states: Only hash this number of the most recent states.
+
+        Returns:
+            A hash which is equal for trackers with equal states.
+        """
+        num_states = len(self.past_states_for_hashing(domain))
+        if not last_num_states or last_num_states >= num_states:
+            return self._prefix_hashes[num_states]
+
+        first = num_states - last_num_states
+        return (
+            self._prefix_hashes[num_states]
+            - self._prefix_hashes[first]
+            * pow(STATES_HASH_BASE, last_num_states, STATES_HASH_MODULUS)
+        ) % STATES_HASH_MODULUS
+
     @staticmethod
     def _unfreeze_states(frozen_states: Deque[FrozenState]) -> List[State]:
         return [
@@ -113,6 +173,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
     def clear_states(self) -> None:
         """Reset the states."""
         self._states_for_hashing = None
+        self._prefix_hashes = None
 
     def init_copy(self) -> "TrackerWithCachedStates":
         """Create a new state tracker with the same initial values."""
@@ -130,20 +191,25 @@ class TrackerWithCachedStates(DialogueStateTracker):
     ) -> "TrackerWithCachedStates":
         """Creates a duplicate of this tracker.
 
-        A new tracker will be created and all events
-        will be replayed."""
-
-        # This is an optimization, we could use the original copy, but
-        # the states would be lost and we would need to recalculate them
+        Instead of replaying all events, the copy shares the (immutable) events
+        and states with this tracker and only copies the containers and the
+        mutable state of the tracker."""
 
-        tracker = self.init_copy()
+        tracker = copy.copy(self)
         tracker.sender_id = sender_id
         tracker.sender_source = sender_source
 
-        for event in self.events:
-            tracker.update(event, skip_states=True)
+        tracker.events = copy.copy(self.events)
+        tracker.slots = type(self.slots)(
+            (name, copy.copy(slot)) for name, slot in self.slots.items()
+        )
+        tracker.active_loop = dict(self.active_loop)
+        tracker._past_states_cache = None
+        tracker._has_persisted_events_marker = False
+        tracker._latest_persisted_event = None
 
         tracker._states_for_hashing = copy.copy(self._states_for_hashing)
+        tracker._prefix_hashes = copy.copy(self._prefix_hashes)
 
         return tracker
 
@@ -152,8 +218,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
             self._states_for_hashing = self.past_states_for_hashing(self.domain)
         else:
             state = self.domain.get_active_states(self)
-            frozen_state = self.freeze_current_state(state)
-            self._states_for_hashing.append(frozen_state)
+            self._push_state(self.freeze_current_state(state))
 
     def update(self, event: Event, skip_states: bool = False) -> None:
         """Modify the state of the tracker according to an ``Event``. """
@@ -172,14 +237,14 @@ class TrackerWithCachedStates(DialogueStateTracker):
             if isinstance(event, ActionExecuted):
                 pass
             elif isinstance(event, ActionReverted):
-                self._states_for_hashing.pop()  # removes the state after the action
-                self._states_for_hashing.pop()  # removes the state used for the action
+                self._pop_state()  # removes the state after the action
+                self._pop_state()  # removes the state used for the action
             elif isinstance(event, UserUtteranceReverted):
                 self.clear_states()
             elif isinstance(event, Restarted):
                 self.clear_states()
             else:
-                self._states_for_hashing.pop()
+                self._pop_state()
 
             self._append_current_state()
 
@@ -190,6 +255,37 @@ TrackerLookupDict = Dict[Optional[Text], List[TrackerWithCachedStates]]
 TrackersTuple = Tuple[List[TrackerWithCachedStates], List[TrackerWithCachedStates]]
 
 
+def _apply_events(
+    events: List[Event],
+    incoming_trackers: List[TrackerWithCachedStates],
+    sender_ids: List[Text],
+    source_name: Text,
+) -> Tuple[List[TrackerWithCachedStates], List[List[TrackerWithCachedStates]]]:
+    """Applies the events of a story step to copies of the incoming trackers.
+
+    This runs in worker processes, hence it's a module level function.
+
+    Returns:
+        The trackers which processed all events and, for each event, the trackers
+        which ended before the event.
+    """
+    trackers = [
+        tracker.copy(sender_id, source_name)
+        for tracker, sender_id in zip(incoming_trackers, sender_ids)
+    ]
+
+    end_trackers_per_event = []
+    for event in events:
+        end_trackers = []
+        for tracker in trackers:
+            if isinstance(event, (ActionReverted, UserUtteranceReverted, Restarted)):
+                end_trackers.append(tracker.copy(tracker.sender_id))
+            tracker.update(event)
+        end_trackers_per_event.append(end_trackers)
+
+    return trackers, end_trackers_per_event
+
+
 class TrainingDataGenerator:
     def __init__(
         self,
@@ -201,13 +297,18 @@ class TrainingDataGenerator:
         tracker_limit: Optional[int] = None,
         use_story_concatenation: bool = True,
         debug_plots: bool = False,
+        num_workers: int = 1,
     ):
         """Given a set of story parts, generates all stories that are possible.
 
         The different story parts can end and start with checkpoints
         and this generator will match start and end checkpoints to
         connect complete stories. Afterwards, duplicate stories will be
-        removed and the data is augmented (if augmentation is enabled)."""
+        removed and the data is augmented (if augmentation is enabled).
+
+        If `num_workers` is greater than 1, the trackers which reach a story
+        step are split across a pool of processes to apply the events of the
+        step. The generated trackers don't depend on the number of workers."""
 
         self.story_graph = story_graph.with_cycles_removed()
         if debug_plots:
@@ -226,9 +327,12 @@ class TrainingDataGenerator:
             tracker_limit=tracker_limit,
             use_story_concatenation=use_story_concatenation,
             rand=random.Random(42),
+            num_workers=num_workers,
         )
         # hashed featurization of all finished trackers
         self.hashed_featurizations = set()
+        # created once a story step is reached by enough trackers
+        self._executor: Optional[Executor] = None
 
     @staticmethod
     def _phase_name(everything_reachable_is_reached, phase):
@@ -262,6 +366,16 @@ class TrainingDataGenerator:
 
     def _generate(
         self, story_steps: List[StoryStep], is_rule_data: bool = False
+    ) -> List[TrackerWithCachedStates]:
+        try:
+            return self._generate_trackers(story_steps, is_rule_data)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _generate_trackers(
+        self, story_steps: List[StoryStep], is_rule_data: bool = False
     ) -> List[TrackerWithCachedStates]:
         if not story_steps:
             logger.debug(f"No {'rules' if is_rule_data else 'story blocks'} found.")
@@ -586,51 +700,105 @@ class TrainingDataGenerator:
         data while processing the story step."""
 
         events = step.explicit_events(self.domain)
-
-        trackers = []
-        if events:  # small optimization
-
-            # need to copy the tracker as multiple story steps
-            # might start with the same checkpoint and all of them
-            # will use the same set of incoming trackers
-
-            for tracker in incoming_trackers:
-                # sender id is used to be able for a human to see where the
-                # messages and events for this tracker came from - to do this
-                # we concatenate the story block names of the blocks that
-                # contribute to the trackers events
-                if tracker.sender_id:
-                    if step.block_name not in tracker.sender_id.split(" > "):
-                        new_sender = tracker.sender_id + " > " + step.block_name
-                    else:
-                        new_sender = tracker.sender_id
+        if not events:  # small optimization
+            return [], []
+
+        if step.is_rule:
+            for event in events:
+                # The rules can specify that a form or a slot shouldn't be set,
+                # therefore we need to distinguish between not set
+                # and explicitly set to None
+                if isinstance(event, ActiveLoop) and event.name is None:
+                    event.name = SHOULD_NOT_BE_SET
+
+                if isinstance(event, SlotSet) and event.value is None:
+                    event.value = SHOULD_NOT_BE_SET
+
+        # need to copy the tracker as multiple story steps
+        # might start with the same checkpoint and all of them
+        # will use the same set of incoming trackers
+
+        sender_ids = []
+        for tracker in incoming_trackers:
+            # sender id is used to be able for a human to see where the
+            # messages and events for this tracker came from - to do this
+            # we concatenate the story block names of the blocks that
+            # contribute to the trackers events
+            if tracker.sender_id:
+                if step.block_name not in tracker.sender_id.split(" > "):
+                    new_sender = tracker.sender_id + " > " + step.block_name
                 else:
-                    new_sender = step.block_name
-                trackers.append(tracker.copy(new_sender, step.source_name))
+                    new_sender = tracker.sender_id
+            else:
+                new_sender = step.block_name
+            sender_ids.append(new_sender)
 
-        end_trackers = []
-        for event in events:
-            for tracker in trackers:
-                if isinstance(
-                    event, (ActionReverted, UserUtteranceReverted, Restarted)
-                ):
-                    end_trackers.append(tracker.copy(tracker.sender_id))
-                if step.is_rule:
-                    # The rules can specify that a form or a slot shouldn't be set,
-                    # therefore we need to distinguish between not set
-                    # and explicitly set to None
-                    if isinstance(event, ActiveLoop) and event.name is None:
-                        event.name = SHOULD_NOT_BE_SET
-
-                    if isinstance(event, SlotSet) and event.value is None:
-                        event.value = SHOULD_NOT_BE_SET
-
-                tracker.update(event)
+        num_shards = min(
+            self.config.num_workers, len(incoming_trackers) // MIN_TRACKERS_PER_WORKER
+        )
+        if num_shards <= 1:
+            trackers, end_trackers_per_event = _apply_events(
+                events, incoming_trackers, sender_ids, step.source_name
+            )
+        else:
+            trackers, end_trackers_per_event = self._apply_events_in_parallel(
+                events, incoming_trackers, sender_ids, step.source_name, num_shards
+            )
+
+        # keep the order in which the trackers are processed sequentially
+        end_trackers = [
+            tracker
+            for end_trackers_of_event in end_trackers_per_event
+            for tracker in end_trackers_of_event
+        ]
 
         # end trackers should be returned separately
         # to avoid using them for augmentation
         return trackers, end_trackers
 
+    def _apply_events_in_parallel(
+        self,
+        events: List[Event],
+        incoming_trackers: List[TrackerWithCachedStates],
+        sender_ids: List[Text],
+        source_name: Text,
+        num_shards: int,
+    ) -> Tuple[List[TrackerWithCachedStates], List[List[TrackerWithCachedStates]]]:
+        """Splits the trackers into contiguous shards which workers process."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.config.num_workers)
+
+        shard_size = -(-len(incoming_trackers) // num_shards)
+        futures = [
+            self._executor.submit(
+                _apply_events,
+                events,
+                incoming_trackers[start : start + shard_size],
+                sender_ids[start : start + shard_size],
+                source_name,
+            )
+            for start in range(0, len(incoming_trackers), shard_size)
+        ]
+
+        trackers = []
+        end_trackers_per_event = [[] for _ in events]
+        for future in futures:
+            shard_trackers, shard_end_trackers_per_event = future.result()
+            trackers.extend(shard_trackers)
+            for end_trackers, shard_end_trackers in zip(
+                end_trackers_per_event, shard_end_trackers_per_event
+            ):
+                end_trackers.extend(shard_end_trackers)
+
+        # the workers returned copies of the domain
+        for tracker in trackers:
+            tracker.domain = self.domain
+        for end_trackers in end_trackers_per_event:
+            for tracker in end_trackers:
+                tracker.domain = self.domain
+
+        return trackers, end_trackers_per_event
+
     def _remove_duplicate_trackers(
         self, trackers: List[TrackerWithCachedStates]
     ) -> TrackersTuple:
@@ -650,23 +818,22 @@ class TrainingDataGenerator:
         end_trackers = []  # for all steps
 
         for tracker in trackers:
-            states_for_hashing = tuple(tracker.past_states_for_hashing(self.domain))
-            hashed = hash(states_for_hashing)
+            hashed = tracker.hash_of_past_states(self.domain)
 
             # only continue with trackers that created a
             # hashed_featurization we haven't observed
             if hashed not in step_hashed_featurizations:
                 if self.config.unique_last_num_states:
-                    last_states = states_for_hashing[
-                        -self.config.unique_last_num_states :
-                    ]
-                    last_hashed = hash(last_states)
+                    last_hashed = tracker.hash_of_past_states(
+                        self.domain, self.config.unique_last_num_states
+                    )
 
                     if last_hashed not in step_hashed_featurizations:
                         step_hashed_featurizations.add(last_hashed)
                         unique_trackers.append(tracker)
                     elif (
-                        len(states_for_hashing) > len(last_states)
+                        len(tracker.past_states_for_hashing(self.domain))
+                        > self.config.unique_last_num_states
                         and hashed not in self.hashed_featurizations
                     ):
                         self.hashed_featurizations.add(hashed)
@@ -691,8 +858,10 @@ class TrainingDataGenerator:
         # otherwise featurization does a lot of unnecessary work
 
         for tracker in trackers:
-            states_for_hashing = tuple(tracker.past_states_for_hashing(self.domain))
-            hashed = hash(states_for_hashing + (tracker.is_rule_tracker,))
+            hashed = (
+                tracker.hash_of_past_states(self.domain),
+                tracker.is_rule_tracker,
+            )
 
             # only continue with trackers that created a
             # hashed_featurization we haven't observed
@@ -404,8 +404,24 @@ class AvailableEndpoints:
         )
         lock_store = read_endpoint_config(endpoint_file, endpoint_type="lock_store")
         event_broker = read_endpoint_config(endpoint_file, endpoint_type="event_broker")
+        nlu_inference = read_endpoint_config(
+            endpoint_file, endpoint_type="nlu_inference"
+        )
+        reminder_store = read_endpoint_config(
+            endpoint_file, endpoint_type="reminder_store"
+        )
 
-        return cls(nlg, nlu, action, model, tracker_store, lock_store, event_broker)
+        return cls(
+            nlg,
+            nlu,
+            action,
+            model,
+            tracker_store,
+            lock_store,
+            event_broker,
+            nlu_inference,
+            reminder_store,
+        )
 
     def __init__(
         self,
@@ -416,6 +432,8 @@ class AvailableEndpoints:
         tracker_store: Optional[EndpointConfig] = None,
         lock_store: Optional[EndpointConfig] = None,
         event_broker: Optional[EndpointConfig] = None,
+        nlu_inference: Optional[EndpointConfig] = None,
+        reminder_store: Optional[EndpointConfig] = None,
     ) -> None:
         self.model = model
         self.action = action
@@ -424,6 +442,8 @@ class AvailableEndpoints:
         self.tracker_store = tracker_store
         self.lock_store = lock_store
         self.event_broker = event_broker
+        self.nlu_inference = nlu_inference
+        self.reminder_store = reminder_store
 
 
 def read_endpoints_from_path(
@@ -6,6 +6,8 @@ import uuid
 from pathlib import Path
 from typing import Callable, Tuple, List, Text, Set, Union, Optional, Iterable
 
+import rasa.shared.data
+import rasa.shared.utils.io
 from rasa.shared.data import TRAINING_DATA_EXTENSIONS
 from rasa.shared.nlu.training_data import loading as nlu_loading
 
@@ -64,8 +66,7 @@ def get_core_nlu_directories(
         containing the NLU training files.
     """
 
-    story_files = get_data_files(paths, is_story_file)
-    nlu_data_files = get_data_files(paths, is_nlu_file)
+    story_files, nlu_data_files = get_core_nlu_files(paths)
 
     story_directory = _copy_files_to_new_dir(story_files)
     nlu_directory = _copy_files_to_new_dir(nlu_data_files)
@@ -73,6 +74,32 @@ def get_core_nlu_directories(
     return story_directory, nlu_directory
 
 
+def get_core_nlu_files(
+    paths: Optional[Union[Text, List[Text]]],
+) -> Tuple[List[Text], List[Text]]:
+    """Recursively collects and classifies all training files in a single pass.
+
+    The yaml files are parsed concurrently up front, so that checking their type
+    and reading them later on doesn't parse them again.
+
+    Args:
+        paths: List of paths to training files or folders containing them.
+
+    Returns:
+        Paths of Core training files and paths of NLU training files.
+    """
+    data_files = get_data_files(paths, lambda _: True)
+
+    rasa.shared.utils.io.preload_yaml_files(
+        [f for f in data_files if rasa.shared.data.is_likely_yaml_file(f)]
+    )
+
+    story_files = [f for f in data_files if is_story_file(f)]
+    nlu_files = [f for f in data_files if is_nlu_file(f)]
+
+    return story_files, nlu_files
+
+
 def get_data_files(
     paths: Optional[Union[Text, List[Text]]], filter_predicate: Callable[[Text], bool]
 ) -> List[Text]:
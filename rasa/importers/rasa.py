@@ -26,8 +26,9 @@ class RasaFileImporter(TrainingDataImporter):
 
         self._domain_path = domain_path
 
-        self._nlu_files = data.get_data_files(training_data_paths, data.is_nlu_file)
-        self._story_files = data.get_data_files(training_data_paths, data.is_story_file)
+        self._story_files, self._nlu_files = data.get_core_nlu_files(
+            training_data_paths
+        )
 
         self.config = autoconfig.get_configuration(config_file, training_type)
 
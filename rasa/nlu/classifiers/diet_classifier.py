@@ -767,22 +767,41 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         )
 
     # process helpers
-    def _predict(self, message: Message) -> Optional[Dict[Text, tf.Tensor]]:
+    def _predict(self, message: Message) -> Optional[Dict[Text, np.ndarray]]:
+        return self._predict_batch([message])[0]
+
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, np.ndarray]]]:
+        """Predicts on all messages with a single call of the model.
+
+        Returns:
+            The predictions for each message. Every prediction keeps a batch
+            dimension of size 1.
+        """
         if self.model is None:
             logger.debug(
                 f"There is no trained model for '{self.__class__.__name__}': The "
                 f"component is either not trained or didn't receive enough training "
                 f"data."
             )
-            return None
+            return [None] * len(messages)
 
-        # create session data from message and convert it into a batch of 1
-        model_data = self._create_model_data([message], training=False)
+        # create session data from messages and convert it into one padded batch
+        model_data = self._create_model_data(messages, training=False)
 
-        return self.model.predict(model_data)
+        batch_out = {
+            name: prediction.numpy()
+            for name, prediction in self.model.predict(model_data).items()
+        }
+
+        return [
+            {name: prediction[idx : idx + 1] for name, prediction in batch_out.items()}
+            for idx in range(len(messages))
+        ]
 
     def _predict_label(
-        self, predict_out: Optional[Dict[Text, tf.Tensor]]
+        self, predict_out: Optional[Dict[Text, np.ndarray]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
         """Predicts the intent of the provided message."""
 
@@ -792,7 +811,7 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         if predict_out is None:
             return label, label_ranking
 
-        message_sim = predict_out["i_scores"].numpy()
+        message_sim = predict_out["i_scores"]
 
         message_sim = message_sim.flatten()  # sim is a matrix
 
@@ -839,18 +858,18 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         return label, label_ranking
 
     def _predict_entities(
-        self, predict_out: Optional[Dict[Text, tf.Tensor]], message: Message
+        self, predict_out: Optional[Dict[Text, np.ndarray]], message: Message
     ) -> List[Dict]:
         if predict_out is None:
             return []
 
-        predicted_tags, confidence_values = self._entity_label_to_tags(predict_out)
+        tokens = message.get(TOKENS_NAMES[TEXT], [])
+        predicted_tags, confidence_values = self._entity_label_to_tags(
+            predict_out, len(tokens)
+        )
 
         entities = self.convert_predictions_into_entities(
-            message.get(TEXT),
-            message.get(TOKENS_NAMES[TEXT], []),
-            predicted_tags,
-            confidence_values,
+            message.get(TEXT), tokens, predicted_tags, confidence_values,
         )
 
         entities = self.add_extractor_name(entities)
@@ -859,16 +878,17 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         return entities
 
     def _entity_label_to_tags(
-        self, predict_out: Dict[Text, Any]
+        self, predict_out: Dict[Text, Any], num_tokens: int
     ) -> Tuple[Dict[Text, List[Text]], Dict[Text, List[float]]]:
         predicted_tags = {}
         confidence_values = {}
 
         for tag_spec in self._entity_tag_specs:
-            predictions = predict_out[f"e_{tag_spec.tag_name}_ids"].numpy()
-            confidences = predict_out[f"e_{tag_spec.tag_name}_scores"].numpy()
-            confidences = [float(c) for c in confidences[0]]
-            tags = [tag_spec.ids_to_tags[p] for p in predictions[0]]
+            # remove the padding which was added to fit the longest message of a batch
+            predictions = predict_out[f"e_{tag_spec.tag_name}_ids"][0][:num_tokens]
+            confidences = predict_out[f"e_{tag_spec.tag_name}_scores"][0][:num_tokens]
+            confidences = [float(c) for c in confidences]
+            tags = [tag_spec.ids_to_tags[p] for p in predictions]
 
             if self.component_config[BILOU_FLAG]:
                 tags = bilou_utils.ensure_consistent_bilou_tagging(tags)
@@ -881,18 +901,22 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
     def process(self, message: Message, **kwargs: Any) -> None:
         """Return the most likely label and its similarity to the input."""
 
-        out = self._predict(message)
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Predict the labels and entities of all messages in one batch."""
 
-        if self.component_config[INTENT_CLASSIFICATION]:
-            label, label_ranking = self._predict_label(out)
+        for message, out in zip(messages, self._predict_batch(messages)):
+            if self.component_config[INTENT_CLASSIFICATION]:
+                label, label_ranking = self._predict_label(out)
 
-            message.set(INTENT, label, add_to_output=True)
-            message.set("intent_ranking", label_ranking, add_to_output=True)
+                message.set(INTENT, label, add_to_output=True)
+                message.set("intent_ranking", label_ranking, add_to_output=True)
 
-        if self.component_config[ENTITY_RECOGNITION]:
-            entities = self._predict_entities(out, message)
+            if self.component_config[ENTITY_RECOGNITION]:
+                entities = self._predict_entities(out, message)
 
-            message.set(ENTITIES, entities, add_to_output=True)
+                message.set(ENTITIES, entities, add_to_output=True)
 
     def persist(self, file_name: Text, model_dir: Text) -> Dict[Text, Any]:
         """Persist this model into the passed directory.
@@ -1732,9 +1756,10 @@ class DIET(TransformerRasaModel):
             batch_in, self.predict_data_signature
         )
 
+        batch_dim = self._get_batch_dim(tf_batch_data)
         mask_sequence_text = self._get_mask_for(tf_batch_data, TEXT, SEQUENCE_LENGTH)
         sequence_lengths = self._get_sequence_lengths(
-            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim=1
+            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim
         )
 
         mask = self._compute_mask(sequence_lengths)
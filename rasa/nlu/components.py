@@ -375,6 +375,13 @@ class Component(metaclass=ComponentMetaclass):
     # This is an important feature for backwards compatibility of components.
     not_supported_language_list = None
 
+    # Defines whether the outputs `train` adds to each training example only depend
+    # on the component configuration and the example itself.
+    # The outputs of such components are cached, so that they only have to
+    # process new or changed training examples when the model is retrained.
+    # Default value is False, as most components fit their state on all examples.
+    cacheable_training_outputs = False
+
     def __init__(self, component_config: Optional[Dict[Text, Any]] = None) -> None:
 
         if not component_config:
@@ -527,6 +534,22 @@ class Component(metaclass=ComponentMetaclass):
 
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process a batch of incoming messages.
+
+        By default every message is processed on its own using
+        :meth:`rasa.nlu.components.Component.process`. Components which can
+        process several messages more efficiently at once should override this.
+
+        Args:
+            messages: The :class:`rasa.shared.nlu.training_data.message.Message` s
+                to process.
+
+        """
+
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persist this component to disk for future loading.
 
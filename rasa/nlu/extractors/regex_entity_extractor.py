@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text
 
 import rasa.shared.utils.io
@@ -45,6 +44,9 @@ class RegexEntityExtractor(EntityExtractor):
 
         self.case_sensitive = self.component_config["case_sensitive"]
         self.patterns = patterns or []
+        self._matchers = pattern_utils.compile_patterns(
+            self.patterns, self.case_sensitive
+        )
 
     def train(
         self,
@@ -58,6 +60,9 @@ class RegexEntityExtractor(EntityExtractor):
             use_regexes=self.component_config["use_regexes"],
             use_only_entities=True,
         )
+        self._matchers = pattern_utils.compile_patterns(
+            self.patterns, self.case_sensitive
+        )
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -82,25 +87,15 @@ class RegexEntityExtractor(EntityExtractor):
         """Extract entities of the given type from the given user message."""
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        text = message.get(TEXT)
+        for matcher in self._matchers:
+            for start_index, end_index in matcher.spans(text):
                 entities.append(
                     {
-                        ENTITY_ATTRIBUTE_TYPE: pattern["name"],
+                        ENTITY_ATTRIBUTE_TYPE: matcher.name,
                         ENTITY_ATTRIBUTE_START: start_index,
                         ENTITY_ATTRIBUTE_END: end_index,
-                        ENTITY_ATTRIBUTE_VALUE: message.get(TEXT)[
-                            start_index:end_index
-                        ],
+                        ENTITY_ATTRIBUTE_VALUE: text[start_index:end_index],
                     }
                 )
 
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, NoReturn, Optional, Text, Tuple, Type
 from tqdm import tqdm
 
 import rasa.shared.utils.io
-from rasa.nlu.tokenizers.convert_tokenizer import ConveRTTokenizer
+from rasa.nlu.tokenizers.convert_tokenizer import ConveRTTokenizer, TF_HUB_MODULE_URL
 from rasa.constants import DOCS_URL_COMPONENTS
 from rasa.nlu.tokenizers.tokenizer import Token
 from rasa.nlu.components import Component
@@ -17,12 +17,14 @@ from rasa.nlu.constants import (
     DENSE_FEATURIZABLE_ATTRIBUTES,
     FEATURIZER_CLASS_ALIAS,
     TOKENS_NAMES,
+    NUMBER_OF_SUB_TOKENS,
 )
 from rasa.shared.nlu.constants import TEXT, FEATURE_TYPE_SENTENCE, FEATURE_TYPE_SEQUENCE
 import numpy as np
 import tensorflow as tf
 
 import rasa.utils.train_utils as train_utils
+from rasa.nlu.utils.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,10 +45,14 @@ class ConveRTFeaturizer(DenseFeaturizer):
     def required_packages(cls) -> List[Text]:
         return ["tensorflow_text", "tensorflow_hub"]
 
+    cacheable_training_outputs = True
+
     def __init__(self, component_config: Optional[Dict[Text, Any]] = None) -> None:
 
         super(ConveRTFeaturizer, self).__init__(component_config)
 
+        self.embedding_cache = EmbeddingCache.from_environment(TF_HUB_MODULE_URL)
+
     def __get_signature(self, signature: Text, module: Any) -> NoReturn:
         """Retrieve a signature from a (hopefully loaded) TF model."""
 
@@ -59,6 +65,54 @@ class ConveRTFeaturizer(DenseFeaturizer):
         return module.signatures[signature]
 
     def _compute_features(
+        self,
+        batch_examples: List[Message],
+        module: Any,
+        attribute: Text = TEXT,
+        persist: bool = True,
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """Compute the sequence and sentence features of a batch of examples.
+
+        Only examples whose features aren't cached yet are fed to the model.
+
+        Args:
+            batch_examples: Examples to featurize.
+            module: The loaded ConveRT module.
+            attribute: Attribute of the examples which is featurized.
+            persist: Whether to persist the computed features in the cache on disk.
+
+        Returns:
+            Sequence and sentence features of each example.
+        """
+
+        def compute(indices: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+            sequence_features, sentence_features = self._compute_model_features(
+                [batch_examples[index] for index in indices], module, attribute
+            )
+            return sentence_features, sequence_features
+
+        sentence_features, sequence_features = self.embedding_cache.embeddings_for(
+            [
+                self._embedding_cache_key(example, attribute)
+                for example in batch_examples
+            ],
+            compute,
+            persist=persist,
+        )
+
+        return sequence_features, sentence_features
+
+    @staticmethod
+    def _embedding_cache_key(example: Message, attribute: Text) -> Any:
+        return [
+            example.get(attribute),
+            [
+                (token.text, token.start, token.end, token.get(NUMBER_OF_SUB_TOKENS))
+                for token in example.get(TOKENS_NAMES[attribute])
+            ],
+        ]
+
+    def _compute_model_features(
         self, batch_examples: List[Message], module: Any, attribute: Text = TEXT
     ) -> Tuple[np.ndarray, np.ndarray]:
 
@@ -218,7 +272,7 @@ class ConveRTFeaturizer(DenseFeaturizer):
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
             if message.get(attribute):
                 sequence_features, sentence_features = self._compute_features(
-                    [message], tf_hub_module, attribute=attribute
+                    [message], tf_hub_module, attribute=attribute, persist=False
                 )
 
                 self._set_features(
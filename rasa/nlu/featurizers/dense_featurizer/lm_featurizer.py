@@ -29,6 +29,8 @@ class LanguageModelFeaturizer(DenseFeaturizer):
     def required_components(cls) -> List[Type[Component]]:
         return [HFTransformersNLP, LanguageModelTokenizer]
 
+    cacheable_training_outputs = True
+
     def train(
         self,
         training_data: TrainingData,
@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text, Type, Tuple
 
 import numpy as np
@@ -54,6 +53,9 @@ class RegexFeaturizer(SparseFeaturizer):
 
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = self.component_config["case_sensitive"]
+        self._matchers = pattern_utils.compile_patterns(
+            self.known_patterns, self.case_sensitive
+        )
 
     def train(
         self,
@@ -67,6 +69,9 @@ class RegexFeaturizer(SparseFeaturizer):
             use_lookup_tables=self.component_config["use_lookup_tables"],
             use_regexes=self.component_config["use_regexes"],
         )
+        self._matchers = pattern_utils.compile_patterns(
+            self.known_patterns, self.case_sensitive
+        )
 
         for example in training_data.training_examples:
             for attribute in [TEXT, RESPONSE, ACTION_TEXT]:
@@ -118,32 +123,31 @@ class RegexFeaturizer(SparseFeaturizer):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
         sequence_length = len(tokens)
 
-        sequence_features = np.zeros([sequence_length, len(self.known_patterns)])
-        sentence_features = np.zeros([1, len(self.known_patterns)])
+        sequence_features = np.zeros([sequence_length, len(self._matchers)])
+        sentence_features = np.zeros([1, len(self._matchers)])
 
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
+        token_starts = np.array([token.start for token in tokens])
+        token_ends = np.array([token.end for token in tokens])
+        text = message.get(TEXT)
 
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
+        for pattern_index, matcher in enumerate(self._matchers):
+            sequence_features[:, pattern_index] = pattern_utils.tokens_matching_spans(
+                token_starts, token_ends, matcher.spans(text)
+            )
 
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
+        if attribute in [RESPONSE, TEXT]:
+            # sentence vector should contain all patterns
+            sentence_features[0] = np.any(sequence_features, axis=0)
 
-                t.set("pattern", patterns)
+        for token_index, t in enumerate(tokens):
+            patterns = t.get("pattern", default={})
+            for pattern_index, matcher in enumerate(self._matchers):
+                patterns[matcher.name] = bool(
+                    sequence_features[token_index][pattern_index]
+                )
+            t.set("pattern", patterns)
 
         return (
             scipy.sparse.coo_matrix(sequence_features),
@@ -19,6 +19,7 @@ from rasa.nlu.extractors.extractor import EntityExtractor  # pytype: disable=pyi
 from rasa.nlu.constants import PREDICTED_CONFIDENCE_KEY, INTENT_NAME_KEY
 
 from rasa.nlu.persistor import Persistor
+from rasa.nlu.training_cache import TrainingCache
 from rasa.shared.nlu.constants import TEXT, ENTITIES, INTENT
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
@@ -127,7 +128,8 @@ class Trainer:
     """Trainer will load the data and train all components.
 
     Requires a pipeline specification and configuration to use for
-    the training.
+    the training. If a `training_cache` is passed, the cacheable components at
+    the beginning of the pipeline only process new or changed training examples.
     """
 
     def __init__(
@@ -135,10 +137,12 @@ class Trainer:
         cfg: RasaNLUModelConfig,
         component_builder: Optional[ComponentBuilder] = None,
         skip_validation: bool = False,
+        training_cache: Optional[TrainingCache] = None,
     ):
 
         self.config = cfg
         self.skip_validation = skip_validation
+        self.training_cache = training_cache
         self.training_data = None  # type: Optional[TrainingData]
 
         if component_builder is None:
@@ -195,13 +199,24 @@ class Trainer:
         # data gets modified internally during the training - hence the copy
         working_data: TrainingData = copy.deepcopy(data)
 
+        cached_training = None
+        if self.training_cache:
+            cached_training = self.training_cache.for_training_data(working_data)
+
         for i, component in enumerate(self.pipeline):
             if isinstance(component, (EntityExtractor, IntentClassifier)):
                 working_data = working_data.without_empty_e2e_examples()
 
             logger.info(f"Starting to train component {component.name}")
             component.prepare_partial_processing(self.pipeline[:i], context)
-            updates = component.train(working_data, self.config, **context)
+            if cached_training and cached_training.can_train(component):
+                updates = cached_training.train(
+                    component, working_data, self.config, **context
+                )
+            else:
+                # outputs of later components depend on this component's outputs
+                cached_training = None
+                updates = component.train(working_data, self.config, **context)
             logger.info("Finished training component.")
             if updates:
                 context.update(updates)
@@ -399,6 +414,52 @@ class Interpreter:
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
 
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse several input texts at once and return the pipeline results.
+
+        Every component processes all messages together, which lets components
+        like the `DIETClassifier` run a single padded batch through their model.
+
+        Args:
+            texts: The input texts.
+            time: The time the messages were received.
+            only_output_properties: If `True` only output properties are returned.
+
+        Returns:
+            The pipeline result for each text in the same order as `texts`.
+        """
+
+        messages = []
+        for text in texts:
+            data = self.default_output_attributes()
+            data[TEXT] = text
+            messages.append(Message(data=data, time=time))
+
+        # Not all components are able to handle empty strings (see `parse`)
+        non_empty_messages = [message for message in messages if message.get(TEXT)]
+
+        if non_empty_messages:
+            for component in self.pipeline:
+                component.process_batch(non_empty_messages, **self.context)
+
+        outputs = []
+        for message in messages:
+            output = self.default_output_attributes()
+            if message.get(TEXT):
+                output.update(
+                    message.as_dict(only_output_properties=only_output_properties)
+                )
+            else:
+                output["text"] = ""
+            outputs.append(output)
+
+        return outputs
+
     def featurize_message(self, message: Message) -> Message:
         """
         Tokenize and featurize the input message
@@ -362,7 +362,17 @@ class ResponseSelector(DIETClassifier):
     def process(self, message: Message, **kwargs: Any) -> None:
         """Return the most likely response, the associated intent_response_key and its similarity to the input."""
 
-        out = self._predict(message)
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Select the most likely responses for all messages in one batch."""
+
+        for message, out in zip(messages, self._predict_batch(messages)):
+            self._set_selected_response(message, out)
+
+    def _set_selected_response(
+        self, message: Message, out: Optional[Dict[Text, np.ndarray]]
+    ) -> None:
         top_label, label_ranking = self._predict_label(out)
 
         # Get the exact intent_response_key and the associated
@@ -692,7 +702,7 @@ class DIET2DIET(DIET):
 
         sequence_mask_text = super()._get_mask_for(tf_batch_data, TEXT, SEQUENCE_LENGTH)
         sequence_lengths_text = self._get_sequence_lengths(
-            tf_batch_data, TEXT, SEQUENCE_LENGTH, batch_dim=1
+            tf_batch_data, TEXT, SEQUENCE_LENGTH, self._get_batch_dim(tf_batch_data)
         )
         mask_text = self._compute_mask(sequence_lengths_text)
 
@@ -1,4 +1,6 @@
 import itertools
+import multiprocessing
+import multiprocessing.pool
 import os
 import logging
 import numpy as np
@@ -50,6 +52,7 @@ from rasa.model import get_model
 from rasa.nlu.components import ComponentBuilder
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.model import Interpreter, Trainer, TrainingData
+from rasa.nlu.training_cache import TrainingCache
 from rasa.nlu.components import Component
 from rasa.nlu.tokenizers.tokenizer import Token
 from rasa.utils.tensorflow.constants import ENTITY_RECOGNITION
@@ -66,6 +69,9 @@ CVEvaluationResult = namedtuple("Results", "train test")
 
 NO_ENTITY = "no_entity"
 
+# number of test examples which are parsed together
+PREDICTION_BATCH_SIZE = 64
+
 IntentEvaluationResult = namedtuple(
     "IntentEvaluationResult", "intent_target intent_prediction message confidence"
 )
@@ -83,6 +89,22 @@ IntentMetrics = Dict[Text, List[float]]
 EntityMetrics = Dict[Text, Dict[Text, List[float]]]
 ResponseSelectionMetrics = Dict[Text, List[float]]
 
+ComputedMetrics = Tuple[
+    IntentMetrics,
+    EntityMetrics,
+    ResponseSelectionMetrics,
+    List[IntentEvaluationResult],
+    List[EntityEvaluationResult],
+    List[ResponseSelectionEvaluationResult],
+]
+
+# metrics of the model which was trained on one cross validation fold
+FoldEvaluation = namedtuple(
+    "FoldEvaluation",
+    "train_metrics test_metrics extractors "
+    "intent_classifier_present response_selector_present",
+)
+
 
 def log_evaluation_table(
     report: Text, precision: float, f1: float, accuracy: float
@@ -1303,9 +1325,20 @@ def get_eval_data(
 
     should_eval_entities = is_entity_extractor_present(interpreter)
 
-    for example in tqdm(test_data.training_examples):
-        result = interpreter.parse(example.get(TEXT), only_output_properties=False)
+    examples = test_data.training_examples
+    results = []
+    with tqdm(total=len(examples)) as progress_bar:
+        for start in range(0, len(examples), PREDICTION_BATCH_SIZE):
+            batch = examples[start : start + PREDICTION_BATCH_SIZE]
+            results.extend(
+                interpreter.parse_batch(
+                    [example.get(TEXT) for example in batch],
+                    only_output_properties=False,
+                )
+            )
+            progress_bar.update(len(batch))
 
+    for example, result in zip(examples, results):
         if should_eval_intents:
             intent_prediction = result.get(INTENT, {}) or {}
             intent_results.append(
@@ -1580,6 +1613,28 @@ def combine_result(
 
     Returns: intent, entity, and response selection metrics
     """
+    return _combine_computed_result(
+        intent_metrics,
+        entity_metrics,
+        response_selection_metrics,
+        compute_metrics(interpreter, data),
+        intent_results,
+        entity_results,
+        response_selection_results,
+    )
+
+
+def _combine_computed_result(
+    intent_metrics: IntentMetrics,
+    entity_metrics: EntityMetrics,
+    response_selection_metrics: ResponseSelectionMetrics,
+    computed_metrics: ComputedMetrics,
+    intent_results: Optional[List[IntentEvaluationResult]] = None,
+    entity_results: Optional[List[EntityEvaluationResult]] = None,
+    response_selection_results: Optional[
+        List[ResponseSelectionEvaluationResult]
+    ] = None,
+) -> Tuple[IntentMetrics, EntityMetrics, ResponseSelectionMetrics]:
     (
         intent_current_metrics,
         entity_current_metrics,
@@ -1587,7 +1642,7 @@ def combine_result(
         current_intent_results,
         current_entity_results,
         current_response_selection_results,
-    ) = compute_metrics(interpreter, data)
+    ) = computed_metrics
 
     if intent_results is not None:
         intent_results += current_intent_results
@@ -1628,6 +1683,8 @@ def cross_validate(
     successes: bool = False,
     errors: bool = False,
     disable_plotting: bool = False,
+    jobs: int = 1,
+    training_cache: Optional[TrainingCache] = None,
 ) -> Tuple[CVEvaluationResult, CVEvaluationResult, CVEvaluationResult]:
     """Stratified cross validation on data.
 
@@ -1639,6 +1696,9 @@ def cross_validate(
         successes: if true successful predictions are written to a file
         errors: if true incorrect predictions are written to a file
         disable_plotting: if true no confusion matrix and historgram plates are created
+        jobs: number of processes which train and evaluate the folds in parallel
+        training_cache: cache which shares the outputs of the cacheable components
+            at the beginning of the pipeline between the folds
 
     Returns:
         dictionary with key, list structure, where each entry in list
@@ -1652,8 +1712,16 @@ def cross_validate(
     if output:
         io_utils.create_directory(output)
 
-    trainer = Trainer(nlu_config)
-    trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
+    folds = generate_folds(n_folds, data)
+    if jobs > 1:
+        fold_evaluations = _evaluate_folds_in_parallel(
+            nlu_config, training_cache, folds, jobs
+        )
+    else:
+        trainer = _cross_validation_trainer(nlu_config, training_cache)
+        fold_evaluations = (
+            _evaluate_fold(trainer, train, test) for train, test in folds
+        )
 
     intent_train_metrics: IntentMetrics = defaultdict(list)
     intent_test_metrics: IntentMetrics = defaultdict(list)
@@ -1670,40 +1738,37 @@ def cross_validate(
     entity_evaluation_possible = False
     extractors: Set[Text] = set()
 
-    for train, test in generate_folds(n_folds, data):
-        interpreter = trainer.train(train)
-
+    # folds are merged in order as soon as they were evaluated
+    for fold_evaluation in fold_evaluations:
         # calculate train accuracy
-        combine_result(
+        _combine_computed_result(
             intent_train_metrics,
             entity_train_metrics,
             response_selection_train_metrics,
-            interpreter,
-            train,
+            fold_evaluation.train_metrics,
         )
         # calculate test accuracy
-        combine_result(
+        _combine_computed_result(
             intent_test_metrics,
             entity_test_metrics,
             response_selection_test_metrics,
-            interpreter,
-            test,
+            fold_evaluation.test_metrics,
             intent_test_results,
             entity_test_results,
             response_selection_test_results,
         )
 
         if not extractors:
-            extractors = get_entity_extractors(interpreter)
+            extractors = fold_evaluation.extractors
             entity_evaluation_possible = (
                 entity_evaluation_possible
                 or _contains_entity_labels(entity_test_results)
             )
 
-        if is_intent_classifier_present(interpreter):
+        if fold_evaluation.intent_classifier_present:
             intent_classifier_present = True
 
-        if is_response_selector_present(interpreter):
+        if fold_evaluation.response_selector_present:
             response_selector_present = True
 
     if intent_classifier_present and intent_test_results:
@@ -1738,6 +1803,78 @@ def cross_validate(
     )
 
 
+def _cross_validation_trainer(
+    nlu_config: RasaNLUModelConfig, training_cache: Optional[TrainingCache]
+) -> Trainer:
+    trainer = Trainer(nlu_config, training_cache=training_cache)
+    trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
+    return trainer
+
+
+def _evaluate_fold(
+    trainer: Trainer, train: TrainingData, test: TrainingData
+) -> FoldEvaluation:
+    interpreter = trainer.train(train)
+
+    return FoldEvaluation(
+        compute_metrics(interpreter, train),
+        compute_metrics(interpreter, test),
+        get_entity_extractors(interpreter),
+        is_intent_classifier_present(interpreter),
+        is_response_selector_present(interpreter),
+    )
+
+
+def _evaluate_fold_in_worker(
+    fold: Tuple[
+        RasaNLUModelConfig, Optional[TrainingCache], TrainingData, TrainingData
+    ]
+) -> FoldEvaluation:
+    nlu_config, training_cache, train, test = fold
+    trainer = _cross_validation_trainer(nlu_config, training_cache)
+    return _evaluate_fold(trainer, train, test)
+
+
+def _evaluate_folds_in_parallel(
+    nlu_config: RasaNLUModelConfig,
+    training_cache: Optional[TrainingCache],
+    folds: Iterable[Tuple[TrainingData, TrainingData]],
+    jobs: int,
+) -> Iterator[FoldEvaluation]:
+    """Trains and evaluates the folds in a pool of `jobs` processes.
+
+    The evaluations are yielded in the order of the folds.
+    """
+    with _evaluation_pool(jobs) as pool:
+        yield from pool.imap(
+            _evaluate_fold_in_worker,
+            ((nlu_config, training_cache, train, test) for train, test in folds),
+        )
+
+
+def _init_evaluation_worker(num_threads: int) -> None:
+    """Limits the threads of TensorFlow so that the workers don't compete for CPUs.
+
+    Thread limits which were configured explicitly are kept.
+    """
+    from rasa.constants import ENV_CPU_INTER_OP_CONFIG, ENV_CPU_INTRA_OP_CONFIG
+    from rasa.utils.tensorflow.environment import setup_tf_environment
+
+    os.environ.setdefault(ENV_CPU_INTER_OP_CONFIG, str(num_threads))
+    os.environ.setdefault(ENV_CPU_INTRA_OP_CONFIG, str(num_threads))
+    setup_tf_environment()
+
+
+def _evaluation_pool(jobs: int) -> multiprocessing.pool.Pool:
+    """Create a pool of processes which share the CPUs of the machine."""
+    num_threads = max(1, (os.cpu_count() or 1) // jobs)
+
+    # TensorFlow doesn't support forking once it was initialized
+    return multiprocessing.get_context("spawn").Pool(
+        jobs, initializer=_init_evaluation_worker, initargs=(num_threads,)
+    )
+
+
 def _targets_predictions_from(
     results: Union[
         List[IntentEvaluationResult], List[ResponseSelectionEvaluationResult]
@@ -1813,6 +1950,7 @@ def compare_nlu(
     model_names: List[Text],
     output: Text,
     runs: int,
+    jobs: int = 1,
 ) -> List[int]:
     """
     Trains and compares multiple NLU models.
@@ -1829,13 +1967,14 @@ def compare_nlu(
         model_names: names of the models to train
         output: the output directory
         runs: number of comparison runs
+        jobs: number of processes which train and evaluate the models in parallel
 
     Returns: training examples per run
     """
 
-    from rasa.train import train_nlu
-
     training_examples_per_run = []
+    # one model is trained and evaluated per cell
+    comparison_cells = []
 
     for run in range(runs):
 
@@ -1871,39 +2010,73 @@ def compare_nlu(
             )
 
             for nlu_config, model_name in zip(configs, model_names):
-                logger.info(
-                    "Evaluating configuration '{}' with {} training data.".format(
-                        model_name, percent_string
-                    )
-                )
-
-                try:
-                    model_path = train_nlu(
+                comparison_cells.append(
+                    (
+                        run,
                         nlu_config,
+                        model_name,
+                        percent_string,
                         train_split_path,
                         model_output_path,
-                        fixed_model_name=model_name,
+                        test_path,
                     )
-                except Exception as e:  # skipcq: PYL-W0703
-                    # general exception catching needed to continue evaluating other
-                    # model configurations
-                    logger.warning(f"Training model '{model_name}' failed. Error: {e}")
-                    f_score_results[model_name][run].append(0.0)
-                    continue
-
-                model_path = os.path.join(get_model(model_path), "nlu")
-
-                output_path = os.path.join(model_output_path, f"{model_name}_report")
-                result = run_evaluation(
-                    test_path, model_path, output_directory=output_path, errors=True
                 )
 
-                f1 = result["intent_evaluation"]["f1_score"]
-                f_score_results[model_name][run].append(f1)
+    if jobs > 1:
+        with _evaluation_pool(jobs) as pool:
+            for cell, f1 in zip(
+                comparison_cells, pool.imap(_train_and_evaluate_model, comparison_cells)
+            ):
+                f_score_results[cell[2]][cell[0]].append(f1)
+    else:
+        for cell in comparison_cells:
+            f_score_results[cell[2]][cell[0]].append(_train_and_evaluate_model(cell))
 
     return training_examples_per_run
 
 
+def _train_and_evaluate_model(
+    comparison_cell: Tuple[int, Text, Text, Text, Text, Text, Text]
+) -> float:
+    """Trains a model of the comparison and returns its F1 score on the test data."""
+    from rasa.train import train_nlu
+
+    (
+        _,
+        nlu_config,
+        model_name,
+        percent_string,
+        train_split_path,
+        model_output_path,
+        test_path,
+    ) = comparison_cell
+
+    logger.info(
+        "Evaluating configuration '{}' with {} training data.".format(
+            model_name, percent_string
+        )
+    )
+
+    try:
+        model_path = train_nlu(
+            nlu_config, train_split_path, model_output_path, fixed_model_name=model_name
+        )
+    except Exception as e:  # skipcq: PYL-W0703
+        # general exception catching needed to continue evaluating other
+        # model configurations
+        logger.warning(f"Training model '{model_name}' failed. Error: {e}")
+        return 0.0
+
+    model_path = os.path.join(get_model(model_path), "nlu")
+
+    output_path = os.path.join(model_output_path, f"{model_name}_report")
+    result = run_evaluation(
+        test_path, model_path, output_directory=output_path, errors=True
+    )
+
+    return result["intent_evaluation"]["f1_score"]
+
+
 def _compute_metrics(
     results: Union[
         List[IntentEvaluationResult], List[ResponseSelectionEvaluationResult]
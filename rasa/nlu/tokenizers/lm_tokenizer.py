@@ -19,6 +19,8 @@ class LanguageModelTokenizer(Tokenizer):
     def required_components(cls) -> List[Type[Component]]:
         return [HFTransformersNLP]
 
+    cacheable_training_outputs = True
+
     defaults = {
         # Flag to check whether to split intents
         "intent_tokenization_flag": False,
@@ -7,6 +7,7 @@ from rasa.nlu import config, utils
 from rasa.nlu.components import ComponentBuilder
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.model import Interpreter, Trainer
+from rasa.nlu.training_cache import TrainingCache
 from rasa.shared.nlu.training_data.loading import load_data
 from rasa.utils import io as io_utils
 from rasa.utils.endpoints import EndpointConfig
@@ -81,9 +82,14 @@ async def train(
     component_builder: Optional[ComponentBuilder] = None,
     training_data_endpoint: Optional[EndpointConfig] = None,
     persist_nlu_training_data: bool = False,
+    training_cache: Optional[TrainingCache] = None,
     **kwargs: Any,
 ) -> Tuple[Trainer, Interpreter, Optional[Text]]:
-    """Loads the trainer and the data and runs the training of the model."""
+    """Loads the trainer and the data and runs the training of the model.
+
+    If a `training_cache` is passed, the outputs of the cacheable components are
+    reused from previous trainings.
+    """
     from rasa.importers.importer import TrainingDataImporter
 
     if not isinstance(nlu_config, RasaNLUModelConfig):
@@ -92,7 +98,7 @@ async def train(
     # Ensure we are training a model that we can save in the end
     # WARN: there is still a race condition if a model with the same name is
     # trained in another subprocess
-    trainer = Trainer(nlu_config, component_builder)
+    trainer = Trainer(nlu_config, component_builder, training_cache=training_cache)
     persistor = create_persistor(storage)
     if training_data_endpoint is not None:
         training_data = await load_data_from_endpoint(
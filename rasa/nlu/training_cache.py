@@ -0,0 +1,267 @@
+import copy
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Text, Tuple
+
+import rasa
+from rasa.constants import DEFAULT_MAX_CACHE_SIZE_IN_MB
+from rasa.nlu.components import Component
+from rasa.nlu.config import RasaNLUModelConfig
+from rasa.nlu.utils import module_path_from_object
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+from rasa.utils.io import DiskCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+NLU_TRAINING_CACHE_SUBDIRECTORY = "nlu_training"
+# number of characters of the example keys which determine the shard of an example
+SHARD_PREFIX_LENGTH = 2
+
+# data values and features which a component added to a single training example
+ExampleOutputs = Tuple[Dict[Text, Any], List[Features]]
+
+
+def _example_key(example: Message) -> Optional[Text]:
+    """Return a key which changes whenever the content of `example` changes.
+
+    Examples which have features before the pipeline runs can't be cached.
+    """
+    if example.features:
+        return None
+
+    return cache_key(example.data)
+
+
+def _shards(example_keys: Iterable[Optional[Text]]) -> Set[Text]:
+    return {
+        example_key[:SHARD_PREFIX_LENGTH]
+        for example_key in example_keys
+        if example_key is not None
+    }
+
+
+class TrainingCache:
+    """Stores the outputs of pipeline components for each training example.
+
+    Components whose outputs for an example only depend on their configuration
+    and the example itself (see `Component.cacheable_training_outputs`) don't
+    have to process unchanged examples again when the model is retrained. The
+    outputs of every pipeline stage are keyed by the configurations of the component
+    and all components before it. Within a stage the outputs are keyed by the content
+    of the training example. The outputs of a stage are split into shards by the
+    beginning of the example keys, so that large training data sets don't end up in
+    a single file which is larger than the whole cache.
+    """
+
+    def __init__(
+        self, cache_dir: Text, max_size_in_mb: float = DEFAULT_MAX_CACHE_SIZE_IN_MB,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            cache_dir: The cache directory which is shared by all caches.
+            max_size_in_mb: Maximum size of the whole cache directory.
+        """
+        self.disk_cache = DiskCache(
+            cache_dir, NLU_TRAINING_CACHE_SUBDIRECTORY, max_size_in_mb
+        )
+
+    @classmethod
+    def from_environment(cls) -> Optional["TrainingCache"]:
+        """Create the cache configured by environment variables.
+
+        Returns:
+            `None` in case the cache was disabled by setting its maximum size to 0.
+        """
+        disk_cache = DiskCache.from_environment(NLU_TRAINING_CACHE_SUBDIRECTORY)
+        if disk_cache is None:
+            return None
+
+        return cls(str(disk_cache.cache_dir), disk_cache.max_size_in_mb)
+
+    def for_training_data(self, training_data: TrainingData) -> "CachedTraining":
+        """Start a training run of a pipeline on `training_data`."""
+
+        return CachedTraining(self, training_data)
+
+    @staticmethod
+    def _shard_key(stage_key: Text, shard: Text) -> Text:
+        return f"{stage_key}_{shard}"
+
+    def load(
+        self, stage_key: Text, example_keys: Iterable[Optional[Text]]
+    ) -> Dict[Text, ExampleOutputs]:
+        """Load the cached outputs of a pipeline stage.
+
+        Args:
+            stage_key: The key of the pipeline stage.
+            example_keys: Keys of the examples whose outputs are needed.
+
+        Returns:
+            The cached outputs of the shards which contain the examples.
+        """
+        outputs = {}
+        for shard in _shards(example_keys):
+            outputs.update(
+                self.disk_cache.load(self._shard_key(stage_key, shard)) or {}
+            )
+
+        return outputs
+
+    def save(
+        self,
+        stage_key: Text,
+        outputs: Dict[Text, ExampleOutputs],
+        changed_example_keys: Iterable[Optional[Text]],
+    ) -> None:
+        """Store the outputs of a pipeline stage and evict old entries if needed.
+
+        Args:
+            stage_key: The key of the pipeline stage.
+            outputs: The outputs of all examples of the stage.
+            changed_example_keys: Keys of the examples whose outputs weren't cached.
+                Only the shards which contain these examples are stored again.
+        """
+        shard_outputs = {shard: {} for shard in _shards(changed_example_keys)}
+        for example_key, example_outputs in outputs.items():
+            shard = example_key[:SHARD_PREFIX_LENGTH]
+            if shard in shard_outputs:
+                shard_outputs[shard][example_key] = example_outputs
+
+        for shard, outputs_of_shard in shard_outputs.items():
+            self.disk_cache.save(self._shard_key(stage_key, shard), outputs_of_shard)
+
+
+class CachedTraining:
+    """Trains the cacheable components at the beginning of a pipeline.
+
+    Caching stops at the first component which isn't cacheable, as the outputs of
+    that component depend on the training data as a whole.
+    """
+
+    def __init__(self, cache: TrainingCache, training_data: TrainingData) -> None:
+        self.cache = cache
+        self.stage_key = cache_key(rasa.__version__)
+        self.example_keys = {
+            id(example): _example_key(example)
+            for example in training_data.training_examples
+        }
+
+    def can_train(self, component: Component) -> bool:
+        return component.cacheable_training_outputs
+
+    def train(
+        self,
+        component: Component,
+        training_data: TrainingData,
+        config: Optional[RasaNLUModelConfig] = None,
+        **kwargs: Any,
+    ) -> Optional[Dict[Text, Any]]:
+        """Train `component` only on the examples whose outputs aren't cached.
+
+        The cached outputs are added to all other examples.
+        """
+        self.stage_key = cache_key(
+            [
+                self.stage_key,
+                module_path_from_object(component),
+                component.component_config,
+            ]
+        )
+        cached_outputs = self.cache.load(self.stage_key, self.example_keys.values())
+
+        outputs: Dict[Text, ExampleOutputs] = {}
+        examples_to_train = {}
+        for example in training_data.training_examples:
+            example_key = self.example_keys.get(id(example))
+            example_outputs = cached_outputs.get(example_key)
+
+            if example_outputs is None:
+                examples_to_train[id(example)] = (
+                    example_key,
+                    dict(example.data),
+                    len(example.features),
+                )
+            elif example_key in outputs:
+                # equal examples must not share their outputs
+                _apply(example, copy.deepcopy(example_outputs))
+            else:
+                _apply(example, example_outputs)
+                outputs[example_key] = example_outputs
+
+        number_of_cached_examples = len(training_data.training_examples) - len(
+            examples_to_train
+        )
+        if number_of_cached_examples:
+            logger.info(
+                f"Reusing cached outputs of component {component.name} for "
+                f"{number_of_cached_examples} of "
+                f"{len(training_data.training_examples)} training examples."
+            )
+
+        if not examples_to_train:
+            return None
+
+        updates = component.train(
+            _with_training_examples(
+                training_data,
+                [
+                    example
+                    for example in training_data.training_examples
+                    if id(example) in examples_to_train
+                ],
+            ),
+            config,
+            **kwargs,
+        )
+
+        for example in training_data.training_examples:
+            if id(example) not in examples_to_train:
+                continue
+
+            example_key, data_before, number_of_features = examples_to_train[
+                id(example)
+            ]
+            if example_key is not None:
+                outputs[example_key] = (
+                    {
+                        key: value
+                        for key, value in example.data.items()
+                        if key not in data_before or data_before[key] is not value
+                    },
+                    example.features[number_of_features:],
+                )
+
+        self.cache.save(
+            self.stage_key,
+            outputs,
+            [example_key for example_key, _, _ in examples_to_train.values()],
+        )
+
+        return updates
+
+
+def _apply(example: Message, outputs: ExampleOutputs) -> None:
+    data, features = outputs
+    example.data.update(data)
+    example.features.extend(features)
+
+
+def _with_training_examples(
+    training_data: TrainingData, training_examples: List[Message]
+) -> TrainingData:
+    """Return `training_data` with different training examples.
+
+    Unlike `TrainingData.filter_training_examples` this doesn't drop equal examples,
+    as all of them have to be processed.
+    """
+    filtered_data = TrainingData(
+        entity_synonyms=training_data.entity_synonyms,
+        regex_features=training_data.regex_features,
+        lookup_tables=training_data.lookup_tables,
+        responses=training_data.responses,
+    )
+    filtered_data.training_examples = training_examples
+
+    return filtered_data
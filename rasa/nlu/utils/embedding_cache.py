@@ -0,0 +1,148 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence, Text, Tuple
+
+import numpy as np
+
+import rasa
+from rasa.constants import DEFAULT_MAX_CACHE_SIZE_IN_MB
+from rasa.utils.io import DiskCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_SUBDIRECTORY = "embeddings"
+DEFAULT_MAX_IN_MEMORY_ENTRIES = 1000
+
+# sentence and sequence embedding of a single input
+Embeddings = Tuple[np.ndarray, np.ndarray]
+
+
+def _model_subdirectory(model_identifier: Any) -> Text:
+    return os.path.join(
+        EMBEDDING_CACHE_SUBDIRECTORY, cache_key([rasa.__version__, model_identifier])
+    )
+
+
+class EmbeddingCache:
+    """Stores the embeddings which a language model computed for its inputs.
+
+    Embeddings are stored in one file per input within a directory which is keyed
+    by the identity of the language model (e.g. its name and weights). Inputs are
+    keyed by a hash of everything the embeddings depend on (e.g. the text and its
+    tokens). Unless `persist` is disabled, computed embeddings are written to disk
+    so that later trainings with the same language model don't have to compute
+    them again. Additionally, the most recently used embeddings are kept in memory
+    which avoids recomputing the embeddings of repeated messages during inference.
+    The cache can be used by several threads, e.g. the NLU inference workers.
+    """
+
+    def __init__(
+        self,
+        model_identifier: Any,
+        cache_dir: Optional[Text] = None,
+        max_size_in_mb: float = DEFAULT_MAX_CACHE_SIZE_IN_MB,
+        max_in_memory_entries: int = DEFAULT_MAX_IN_MEMORY_ENTRIES,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            model_identifier: Everything which identifies the language model.
+            cache_dir: The cache directory which is shared by all caches. `None`
+                keeps embeddings in memory only.
+            max_size_in_mb: Maximum size of the whole cache directory.
+            max_in_memory_entries: Number of embeddings which are kept in memory.
+        """
+        self.disk_cache = (
+            DiskCache(cache_dir, _model_subdirectory(model_identifier), max_size_in_mb)
+            if cache_dir
+            else None
+        )
+        self.max_in_memory_entries = max_in_memory_entries
+
+        self._in_memory: "OrderedDict[Text, Embeddings]" = OrderedDict()
+        self._in_memory_lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, model_identifier: Any) -> "EmbeddingCache":
+        """Create the cache configured by environment variables.
+
+        Setting the maximum cache size to 0 disables the cache on disk.
+        """
+        disk_cache = DiskCache.from_environment(_model_subdirectory(model_identifier))
+        if disk_cache is None:
+            return cls(model_identifier)
+
+        return cls(
+            model_identifier, str(disk_cache.cache_dir), disk_cache.max_size_in_mb
+        )
+
+    def embeddings_for(
+        self,
+        keys: Sequence[Any],
+        compute: Callable[[List[int]], Tuple[Sequence[Any], Sequence[Any]]],
+        persist: bool = True,
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """Return the sentence and sequence embeddings of a batch of inputs.
+
+        Args:
+            keys: Everything the embeddings of each input depend on.
+            compute: Computes the sentence and sequence embeddings of the inputs
+                at the given indices in one batch. It's only called for inputs
+                whose embeddings aren't cached.
+            persist: Whether to write computed embeddings to disk.
+
+        Returns:
+            Sentence and sequence embeddings for each input.
+        """
+        hashes = [cache_key(key) for key in keys]
+        sentence_embeddings: List[Optional[np.ndarray]] = [None] * len(keys)
+        sequence_embeddings: List[Optional[np.ndarray]] = [None] * len(keys)
+
+        missing_indices = []
+        for index, key_hash in enumerate(hashes):
+            embeddings = self._lookup(key_hash)
+            if embeddings is None:
+                missing_indices.append(index)
+            else:
+                sentence_embeddings[index], sequence_embeddings[index] = embeddings
+
+        if missing_indices:
+            computed_sentence_embeddings, computed_sequence_embeddings = compute(
+                missing_indices
+            )
+            for position, index in enumerate(missing_indices):
+                embeddings = (
+                    np.asarray(computed_sentence_embeddings[position]),
+                    np.asarray(computed_sequence_embeddings[position]),
+                )
+                sentence_embeddings[index], sequence_embeddings[index] = embeddings
+                self._remember(hashes[index], embeddings)
+                if persist and self.disk_cache:
+                    self.disk_cache.save(hashes[index], embeddings)
+
+        return sentence_embeddings, sequence_embeddings
+
+    def _lookup(self, key_hash: Text) -> Optional[Embeddings]:
+        with self._in_memory_lock:
+            embeddings = self._in_memory.get(key_hash)
+            if embeddings is not None:
+                self._in_memory.move_to_end(key_hash)
+                return embeddings
+
+        embeddings = self.disk_cache.load(key_hash) if self.disk_cache else None
+        if embeddings is not None:
+            self._remember(key_hash, embeddings)
+
+        return embeddings
+
+    def _remember(self, key_hash: Text, embeddings: Embeddings) -> None:
+        if self.max_in_memory_entries <= 0:
+            return
+
+        with self._in_memory_lock:
+            self._in_memory[key_hash] = embeddings
+            self._in_memory.move_to_end(key_hash)
+            while len(self._in_memory) > self.max_in_memory_entries:
+                self._in_memory.popitem(last=False)
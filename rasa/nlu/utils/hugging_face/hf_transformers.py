@@ -9,6 +9,7 @@ from rasa.nlu.config import RasaNLUModelConfig
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.tokenizers.tokenizer import Token
+from rasa.nlu.utils.embedding_cache import EmbeddingCache
 import rasa.utils.train_utils as train_utils
 import numpy as np
 
@@ -55,6 +56,8 @@ class HFTransformersNLP(Component):
         "cache_dir": None,
     }
 
+    cacheable_training_outputs = True
+
     def __init__(
         self,
         component_config: Optional[Dict[Text, Any]] = None,
@@ -65,6 +68,9 @@ class HFTransformersNLP(Component):
         self._load_model_metadata()
         self._load_model_instance(skip_model_load)
         self.whitespace_tokenizer = WhitespaceTokenizer()
+        self.embedding_cache = EmbeddingCache.from_environment(
+            [self.model_name, self.model_weights]
+        )
 
     def _load_model_metadata(self) -> None:
 
@@ -645,11 +651,29 @@ class HFTransformersNLP(Component):
             batch_examples, attribute
         )
 
+        # Only examples whose features aren't cached yet are fed to the model.
+        # Features of training examples are persisted so that they can be reused
+        # by later trainings with the same model.
         (
             batch_sentence_features,
             batch_sequence_features,
-        ) = self._get_model_features_for_batch(
-            batch_token_ids, batch_tokens, batch_examples, attribute, inference_mode
+        ) = self.embedding_cache.embeddings_for(
+            [
+                (
+                    token_ids,
+                    [token.get(NUMBER_OF_SUB_TOKENS) for token in tokens],
+                    inference_mode,
+                )
+                for token_ids, tokens in zip(batch_token_ids, batch_tokens)
+            ],
+            lambda indices: self._get_model_features_for_batch(
+                [batch_token_ids[index] for index in indices],
+                [batch_tokens[index] for index in indices],
+                [batch_examples[index] for index in indices],
+                attribute,
+                inference_mode,
+            ),
+            persist=not inference_mode,
         )
 
         # A doc consists of
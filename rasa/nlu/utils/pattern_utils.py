@@ -1,9 +1,16 @@
+import bisect
 import re
-from typing import Dict, List, Text, Union
+from typing import Dict, List, Optional, Text, Tuple, Union
+
+import numpy as np
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
 
+LOOKUP_REGEX_PREFIX = "(\\b"
+LOOKUP_REGEX_SEPARATOR = "\\b|\\b"
+LOOKUP_REGEX_SUFFIX = "\\b)"
+
 
 def _convert_lookup_tables_to_regex(
     training_data: TrainingData, use_only_entities: bool = False
@@ -47,11 +54,50 @@ def _generate_lookup_regex(lookup_table: Dict[Text, Union[Text, List[Text]]]) ->
     else:
         elements_to_regex = read_lookup_table_file(lookup_elements)
 
+    return _lookup_regex_from_elements(elements_to_regex)
+
+
+def _lookup_regex_from_elements(elements: List[Text]) -> Text:
     # sanitize the regex, escape special characters
-    elements_sanitized = [re.escape(e) for e in elements_to_regex]
+    elements_sanitized = [re.escape(e) for e in elements]
 
     # regex matching elements with word boundaries on either side
-    return "(\\b" + "\\b|\\b".join(elements_sanitized) + "\\b)"
+    return (
+        LOOKUP_REGEX_PREFIX
+        + LOOKUP_REGEX_SEPARATOR.join(elements_sanitized)
+        + LOOKUP_REGEX_SUFFIX
+    )
+
+
+def _lookup_elements_from_regex(pattern: Text) -> Optional[List[Text]]:
+    """Recover the elements of a lookup table from its regex pattern.
+
+    Args:
+        pattern: A regex pattern.
+
+    Returns:
+        The elements of the lookup table or `None` if the pattern wasn't generated
+        from a lookup table by `_generate_lookup_regex`.
+    """
+    if not (
+        pattern.startswith(LOOKUP_REGEX_PREFIX)
+        and pattern.endswith(LOOKUP_REGEX_SUFFIX)
+    ):
+        return None
+
+    elements = [
+        re.sub(r"\\(.)", r"\1", escaped_element, flags=re.DOTALL)
+        for escaped_element in pattern[
+            len(LOOKUP_REGEX_PREFIX) : -len(LOOKUP_REGEX_SUFFIX)
+        ].split(LOOKUP_REGEX_SEPARATOR)
+    ]
+
+    # patterns written by other Python versions might be escaped differently, and
+    # custom regexes might just look like lookup tables
+    if "" in elements or _lookup_regex_from_elements(elements) != pattern:
+        return None
+
+    return elements
 
 
 def read_lookup_table_file(lookup_table_file: Text) -> List[Text]:
@@ -137,3 +183,146 @@ def extract_patterns(
         )
 
     return patterns
+
+
+def _is_word_character(character: Text) -> bool:
+    # same definition as for `\w` in unicode regexes
+    return character.isalnum() or character == "_"
+
+
+def _word_boundaries(text: Text) -> List[int]:
+    """Return all positions in `text` which match `\\b` in a regex."""
+    is_word = [_is_word_character(character) for character in text]
+
+    return [
+        index
+        for index in range(len(text) + 1)
+        if (index > 0 and is_word[index - 1]) != (index < len(text) and is_word[index])
+    ]
+
+
+def _fold_case(text: Text) -> Text:
+    # lowercase each character separately so that offsets don't change
+    return "".join(
+        lowered if len(lowered) == 1 else character
+        for character, lowered in ((character, character.lower()) for character in text)
+    )
+
+
+class RegexMatcher:
+    """Finds the matches of a precompiled regex in texts."""
+
+    def __init__(self, name: Text, pattern: Text, case_sensitive: bool) -> None:
+        self.name = name
+        self.regex = re.compile(pattern, flags=0 if case_sensitive else re.IGNORECASE)
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        """Return the start and end of all matches in `text`."""
+        return [match.span() for match in self.regex.finditer(text)]
+
+
+class LookupMatcher:
+    """Finds the elements of a lookup table in texts.
+
+    This finds the same matches as the regex generated by `_generate_lookup_regex`,
+    but instead of trying each element at each position of the text, only
+    substrings between two word boundaries are looked up in a dictionary of the
+    elements. This keeps the time to match independent of the size of the lookup
+    table.
+    """
+
+    def __init__(self, name: Text, elements: List[Text], case_sensitive: bool) -> None:
+        self.name = name
+        self.case_sensitive = case_sensitive
+
+        # like alternatives in a regex, earlier elements take precedence
+        self.element_indices: Dict[Text, int] = {}
+        for index, element in enumerate(elements):
+            self.element_indices.setdefault(self._normalize(element), index)
+
+        self.max_element_length = max(
+            (len(element) for element in self.element_indices), default=0
+        )
+
+    def _normalize(self, text: Text) -> Text:
+        return text if self.case_sensitive else _fold_case(text)
+
+    def spans(self, text: Text) -> List[Tuple[int, int]]:
+        """Return the start and end of all matches in `text`."""
+        text = self._normalize(text)
+        boundaries = _word_boundaries(text)
+
+        spans = []
+        end_of_last_match = 0
+        for boundary_index, start in enumerate(boundaries):
+            if start < end_of_last_match:
+                continue
+
+            best_match = None
+            last_end_index = bisect.bisect_right(
+                boundaries, start + self.max_element_length
+            )
+            for end in boundaries[boundary_index + 1 : last_end_index]:
+                element_index = self.element_indices.get(text[start:end])
+                if element_index is not None and (
+                    best_match is None or element_index < best_match[0]
+                ):
+                    best_match = (element_index, end)
+
+            if best_match is not None:
+                spans.append((start, best_match[1]))
+                end_of_last_match = best_match[1]
+
+        return spans
+
+
+def compile_patterns(
+    patterns: List[Dict[Text, Text]], case_sensitive: bool
+) -> List[Union[RegexMatcher, LookupMatcher]]:
+    """Compile patterns so that they can be matched efficiently.
+
+    Patterns which were generated from lookup tables are matched by a
+    `LookupMatcher`, all others by a precompiled regex.
+
+    Args:
+        patterns: The patterns as returned by `extract_patterns`.
+        case_sensitive: Whether the patterns should be matched case sensitive.
+
+    Returns:
+        One matcher per pattern.
+    """
+    matchers = []
+    for pattern in patterns:
+        elements = _lookup_elements_from_regex(pattern["pattern"])
+        if elements is None:
+            matchers.append(
+                RegexMatcher(pattern["name"], pattern["pattern"], case_sensitive)
+            )
+        else:
+            matchers.append(LookupMatcher(pattern["name"], elements, case_sensitive))
+
+    return matchers
+
+
+def tokens_matching_spans(
+    token_starts: np.ndarray, token_ends: np.ndarray, spans: List[Tuple[int, int]]
+) -> np.ndarray:
+    """Return which tokens overlap with any of the given spans.
+
+    Args:
+        token_starts: Start offset of each token.
+        token_ends: End offset of each token.
+        spans: Start and end offsets of the spans.
+
+    Returns:
+        A boolean array with an entry for each token.
+    """
+    if not spans:
+        return np.zeros(len(token_starts), dtype=bool)
+
+    span_starts, span_ends = np.array(spans).T
+    return np.any(
+        (token_starts[:, np.newaxis] < span_ends[np.newaxis, :])
+        & (token_ends[:, np.newaxis] > span_starts[np.newaxis, :]),
+        axis=1,
+    )
@@ -37,6 +37,7 @@ from rasa.core.channels.channel import (
 from rasa.core.domain import InvalidDomain
 from rasa.core.events import Event
 from rasa.core.lock_store import LockStore
+from rasa.core.reminder_store import ReminderStore
 from rasa.core.test import test
 from rasa.core.tracker_store import TrackerStore
 from rasa.core.trackers import DialogueStateTracker, EventVerbosity
@@ -325,6 +326,7 @@ async def _load_agent(
     remote_storage: Optional[Text] = None,
     endpoints: Optional[AvailableEndpoints] = None,
     lock_store: Optional[LockStore] = None,
+    reminder_store: Optional[ReminderStore] = None,
 ) -> Agent:
     try:
         tracker_store = None
@@ -340,6 +342,8 @@ async def _load_agent(
             action_endpoint = endpoints.action
             if not lock_store:
                 lock_store = LockStore.create(endpoints.lock_store)
+            if not reminder_store:
+                reminder_store = ReminderStore.create(endpoints.reminder_store)
 
         loaded_agent = await rasa.core.agent.load_agent(
             model_path,
@@ -348,6 +352,7 @@ async def _load_agent(
             generator=generator,
             tracker_store=tracker_store,
             lock_store=lock_store,
+            reminder_store=reminder_store,
             action_endpoint=action_endpoint,
         )
     except Exception as e:
@@ -497,14 +502,14 @@ def create_app(
         try:
             async with app.agent.lock_store.lock(conversation_id):
                 processor = app.agent.create_processor()
-                tracker = processor.get_tracker(conversation_id)
+                tracker = await processor.get_tracker_async(conversation_id)
                 _validate_tracker(tracker, conversation_id)
 
                 events = _get_events_from_request_body(request)
 
                 for event in events:
                     tracker.update(event, app.agent.domain)
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -556,7 +561,7 @@ def create_app(
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -988,7 +993,12 @@ def create_app(
                 )
 
         app.agent = await _load_agent(
-            model_path, model_server, remote_storage, endpoints, app.agent.lock_store
+            model_path,
+            model_server,
+            remote_storage,
+            endpoints,
+            app.agent.lock_store,
+            app.agent.reminder_store,
         )
 
         logger.debug(f"Successfully loaded model '{model_path}'.")
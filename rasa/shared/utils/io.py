@@ -1,19 +1,25 @@
+import copy
 import glob
 import json
 import os
 import re
+import threading
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
 from io import StringIO
 from pathlib import Path
-from typing import Any, Text, Optional, Type, Union, List, Dict
+from typing import Any, Iterable, Text, Optional, Type, Union, List, Dict, Tuple
 
 from ruamel import yaml as yaml
 from ruamel.yaml import RoundTripRepresenter
 
 DEFAULT_ENCODING = "utf-8"
 
+# maximum number of parsed yaml documents which are kept in memory
+MAX_CACHED_YAML_DOCUMENTS = 512
+
 
 class bcolors:
     HEADER = "\033[95m"
@@ -220,23 +226,41 @@ def replace_environment_variables() -> None:
     yaml.SafeConstructor.add_constructor("!env_var", env_var_constructor)
 
 
-def read_yaml(content: Text) -> Any:
-    """Parses yaml from a text.
+_yaml_lock = threading.Lock()
+_yaml_parsers = threading.local()
+_yaml_loader_is_prepared = False
+# parsed documents by hash of their content
+_parsed_yaml_documents: "OrderedDict[Text, Any]" = OrderedDict()
+# content hashes of yaml files by path, modification time and size
+_yaml_file_content_hashes: Dict[Tuple[Text, int, int], Text] = {}
+# cache which persists parsed documents, e.g. a `rasa.utils.io.DiskCache`
+_persisted_yaml_cache: Optional[Any] = None
 
-    Args:
-        content: A text containing yaml content.
 
-    Raises:
-        ruamel.yaml.parser.ParserError: If there was an error when parsing the YAML.
+def _yaml_parser() -> yaml.YAML:
+    """Return the yaml parser of the current thread.
+
+    The constructors of the loaders are only registered once per process.
     """
-    fix_yaml_loader()
+    global _yaml_loader_is_prepared
+
+    with _yaml_lock:
+        if not _yaml_loader_is_prepared:
+            fix_yaml_loader()
+            replace_environment_variables()
+            _yaml_loader_is_prepared = True
+
+    parser = getattr(_yaml_parsers, "parser", None)
+    if parser is None:
+        parser = yaml.YAML(typ="safe")
+        parser.version = YAML_VERSION
+        parser.preserve_quotes = True
+        _yaml_parsers.parser = parser
 
-    replace_environment_variables()
+    return parser
 
-    yaml_parser = yaml.YAML(typ="safe")
-    yaml_parser.version = YAML_VERSION
-    yaml_parser.preserve_quotes = True
 
+def _parse_yaml(content: Text) -> Any:
     if _is_ascii(content):
         # Required to make sure emojis are correctly parsed
         content = (
@@ -246,7 +270,82 @@ def read_yaml(content: Text) -> Any:
             .decode("utf-16")
         )
 
-    return yaml_parser.load(content) or {}
+    return _yaml_parser().load(content) or {}
+
+
+def _yaml_content_hash(content: Text) -> Text:
+    return get_text_hash(f"{yaml.__version__}{YAML_VERSION}{content}")
+
+
+def configure_yaml_cache(persisted_cache: Optional[Any]) -> None:
+    """Persist parsed yaml documents so that later processes don't parse them again.
+
+    Args:
+        persisted_cache: Cache which stores the parsed documents, e.g. a
+            `rasa.utils.io.DiskCache`. It has to provide `load(key)`, which returns
+            `None` for documents which aren't cached, and `save(key, document)`.
+            `None` disables the persisted cache.
+    """
+    global _persisted_yaml_cache
+
+    _persisted_yaml_cache = persisted_cache
+
+
+def _cached_yaml(content_hash: Text) -> Tuple[bool, Any]:
+    """Return whether a document was cached and a copy of the cached document."""
+    with _yaml_lock:
+        document = _parsed_yaml_documents.get(content_hash)
+        if document is not None:
+            _parsed_yaml_documents.move_to_end(content_hash)
+
+    if document is None and _persisted_yaml_cache is not None:
+        document = _persisted_yaml_cache.load(content_hash)
+        if document is not None:
+            _cache_yaml_in_memory(content_hash, document)
+
+    if document is None:
+        return False, None
+
+    # callers are allowed to modify the returned document
+    return True, copy.deepcopy(document)
+
+
+def _cache_yaml_in_memory(content_hash: Text, document: Any) -> None:
+    with _yaml_lock:
+        _parsed_yaml_documents[content_hash] = document
+        if len(_parsed_yaml_documents) > MAX_CACHED_YAML_DOCUMENTS:
+            _parsed_yaml_documents.popitem(last=False)
+
+
+def _read_yaml_with_hash(content: Text, content_hash: Text) -> Any:
+    is_cached, document = _cached_yaml(content_hash)
+    if is_cached:
+        return document
+
+    document = _parse_yaml(content)
+    _cache_yaml_in_memory(content_hash, document)
+    if _persisted_yaml_cache is not None:
+        _persisted_yaml_cache.save(content_hash, document)
+
+    return copy.deepcopy(document)
+
+
+def read_yaml(content: Text) -> Any:
+    """Parses yaml from a text.
+
+    Parsed documents are cached by their content, unless they contain environment
+    variables which are substituted during parsing.
+
+    Args:
+        content: A text containing yaml content.
+
+    Raises:
+        ruamel.yaml.parser.ParserError: If there was an error when parsing the YAML.
+    """
+    if "${" in content:
+        return _parse_yaml(content)
+
+    return _read_yaml_with_hash(content, _yaml_content_hash(content))
 
 
 def _is_ascii(text: Text) -> bool:
@@ -259,10 +358,56 @@ YAML_VERSION = (1, 2)
 def read_yaml_file(filename: Union[Text, Path]) -> Union[List[Any], Dict[Text, Any]]:
     """Parses a yaml file.
 
+    Files which weren't modified since they were read the last time aren't read
+    again.
+
     Args:
         filename: The path to the file which should be read.
     """
-    return read_yaml(read_file(filename, DEFAULT_ENCODING))
+    try:
+        stat = os.stat(filename)
+        file_key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        # let `read_file` raise the appropriate error
+        file_key = None
+
+    content_hash = _yaml_file_content_hashes.get(file_key) if file_key else None
+    if content_hash is not None:
+        is_cached, document = _cached_yaml(content_hash)
+        if is_cached:
+            return document
+
+    content = read_file(filename, DEFAULT_ENCODING)
+    if file_key and "${" not in content:
+        content_hash = _yaml_content_hash(content)
+        document = _read_yaml_with_hash(content, content_hash)
+        _yaml_file_content_hashes[file_key] = content_hash
+        return document
+
+    return read_yaml(content)
+
+
+def preload_yaml_files(
+    filenames: Iterable[Union[Text, Path]], max_workers: Optional[int] = None
+) -> None:
+    """Reads and parses yaml files concurrently so that later reads are cached.
+
+    Files which can't be read or parsed are skipped. The errors are raised once
+    the files are actually read.
+
+    Args:
+        filenames: Paths of yaml files.
+        max_workers: Maximum number of threads which read the files.
+    """
+
+    def preload(filename: Union[Text, Path]) -> None:
+        try:
+            read_yaml_file(filename)
+        except Exception:
+            pass
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        list(executor.map(preload, filenames))
 
 
 def write_yaml(
@@ -207,6 +207,7 @@ def compare_nlu_models(
     output: Text,
     runs: int,
     exclusion_percentages: List[int],
+    jobs: int = 1,
 ):
     """Trains multiple models, compares them and saves the results."""
 
@@ -236,6 +237,7 @@ def compare_nlu_models(
         model_names,
         output,
         runs,
+        jobs,
     )
 
     f1_path = os.path.join(output, RESULTS_FILE)
@@ -277,6 +279,7 @@ def perform_nlu_cross_validation(
         log_results,
         log_entity_results,
     )
+    from rasa.nlu.training_cache import TrainingCache
 
     additional_arguments = additional_arguments or {}
     folds = int(additional_arguments.get("folds", 3))
@@ -285,7 +288,12 @@ def perform_nlu_cross_validation(
     data = drop_intents_below_freq(data, cutoff=folds)
     kwargs = utils.minimal_kwargs(additional_arguments, cross_validate)
     results, entity_results, response_selection_results = cross_validate(
-        data, folds, nlu_config, output, **kwargs
+        data,
+        folds,
+        nlu_config,
+        output,
+        training_cache=TrainingCache.from_environment(),
+        **kwargs,
     )
     logger.info(f"CV evaluation (n={folds})")
 
@@ -11,6 +11,7 @@ from rasa.model import FingerprintComparisonResult
 from rasa.core.domain import Domain
 from rasa.nlu.model import Interpreter
 from rasa.utils.common import TempDirectoryPath
+import rasa.utils.io
 
 from rasa.cli.utils import print_success, print_warning, print_error, print_color
 import rasa.shared.utils.io
@@ -84,6 +85,7 @@ async def train_async(
     Returns:
         Path of the trained model archive.
     """
+    rasa.utils.io.configure_yaml_cache_from_environment()
 
     file_importer = TrainingDataImporter.load_from_config(
         config, domain, training_files
@@ -342,6 +344,7 @@ async def train_core_async(
         otherwise the path to the directory with the trained model files.
 
     """
+    rasa.utils.io.configure_yaml_cache_from_environment()
 
     file_importer = TrainingDataImporter.load_core_importer_from_config(
         config, domain, [stories]
@@ -481,6 +484,8 @@ async def _train_nlu_async(
         )
         return
 
+    rasa.utils.io.configure_yaml_cache_from_environment()
+
     # training NLU only hence the training files still have to be selected
     file_importer = TrainingDataImporter.load_nlu_importer_from_config(
         config, training_data_paths=[nlu_data]
@@ -516,6 +521,7 @@ async def _train_nlu_with_validated_data(
     """Train NLU with validated training and config data."""
 
     import rasa.nlu.train
+    from rasa.nlu.training_cache import TrainingCache
 
     if additional_arguments is None:
         additional_arguments = {}
@@ -535,6 +541,7 @@ async def _train_nlu_with_validated_data(
             _train_path,
             fixed_model_name="nlu",
             persist_nlu_training_data=persist_nlu_training_data,
+            training_cache=TrainingCache.from_environment(),
             **additional_arguments,
         )
         print_color(
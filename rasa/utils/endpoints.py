@@ -1,3 +1,4 @@
+import asyncio
 import aiohttp
 import logging
 import os
@@ -6,11 +7,19 @@ from sanic.request import Request
 from typing import Any, Optional, Text, Dict
 
 import rasa.utils.io
-from rasa.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.constants import (
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# long-lived sessions of all endpoints, closed by `close_pooled_sessions`
+_pooled_sessions: Dict[aiohttp.ClientSession, asyncio.AbstractEventLoop] = {}
+
 
 def read_endpoint_config(
     filename: Text, endpoint_type: Text
@@ -89,7 +98,13 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.kwargs = kwargs
 
-    def session(self) -> aiohttp.ClientSession:
+        self._pooled_session: Optional[aiohttp.ClientSession] = None
+        self._pooled_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def session(
+        self, connector: Optional[aiohttp.BaseConnector] = None
+    ) -> aiohttp.ClientSession:
+        """Create a new session. The caller has to close it."""
         # create authentication parameters
         if self.basic_auth:
             auth = aiohttp.BasicAuth(
@@ -102,8 +117,45 @@ class EndpointConfig:
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            connector=connector,
         )
 
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived session of this endpoint.
+
+        The session keeps its connections alive, so that subsequent requests don't
+        have to open a new connection. The size of the connection pool can be
+        configured with `connection_limit`, `connection_limit_per_host` and
+        `keepalive_timeout`. The session must not be closed by the caller.
+
+        Returns:
+            The session for the running event loop.
+        """
+        loop = asyncio.get_event_loop()
+
+        if (
+            self._pooled_session is None
+            or self._pooled_session.closed
+            or self._pooled_session_loop is not loop
+        ):
+            # sessions can't be shared across event loops
+            _pooled_sessions.pop(self._pooled_session, None)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.kwargs.get("connection_limit", DEFAULT_CONNECTION_LIMIT),
+                limit_per_host=self.kwargs.get(
+                    "connection_limit_per_host", DEFAULT_CONNECTION_LIMIT_PER_HOST
+                ),
+                keepalive_timeout=self.kwargs.get(
+                    "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+                ),
+            )
+            self._pooled_session = self.session(connector)
+            self._pooled_session_loop = loop
+            _pooled_sessions[self._pooled_session] = loop
+
+        return self._pooled_session
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -141,22 +193,21 @@ class EndpointConfig:
             del kwargs["headers"]
 
         url = concat_url(self.url, subpath)
-        async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status, response.reason, await response.content.read()
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+        async with self.pooled_session().request(
+            method,
+            url,
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            **kwargs,
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status, response.reason, await response.content.read()
+                )
+            try:
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data) -> "EndpointConfig":
@@ -173,6 +224,13 @@ class EndpointConfig:
             **self.kwargs,
         )
 
+    def __getstate__(self) -> Dict[Text, Any]:
+        # sessions are bound to an event loop and can't be copied
+        state = self.__dict__.copy()
+        state["_pooled_session"] = None
+        state["_pooled_session_loop"] = None
+        return state
+
     def __eq__(self, other) -> bool:
         if isinstance(self, type(other)):
             return (
@@ -190,6 +248,22 @@ class EndpointConfig:
         return not self.__eq__(other)
 
 
+async def close_pooled_sessions() -> None:
+    """Close the long-lived sessions of all endpoints.
+
+    Only the sessions of the running event loop can be closed, sessions of other
+    event loops are discarded.
+    """
+    loop = asyncio.get_event_loop()
+
+    sessions = list(_pooled_sessions.items())
+    _pooled_sessions.clear()
+
+    for session, session_loop in sessions:
+        if session_loop is loop and not session.closed:
+            await session.close()
+
+
 class ClientResponseError(aiohttp.ClientError):
     def __init__(self, status: int, message: Text, text: Text) -> None:
         self.status = status
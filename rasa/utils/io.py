@@ -6,19 +6,50 @@ import os
 import pickle
 import tarfile
 import tempfile
+import threading
 import warnings
 import zipfile
 from asyncio import AbstractEventLoop
 from io import BytesIO as IOReader
 from pathlib import Path
-from typing import Text, Any, Dict, Union, List, Type, Callable, TYPE_CHECKING
-
-from rasa.constants import ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL
+from typing import (
+    Text,
+    Any,
+    Dict,
+    Union,
+    List,
+    Type,
+    Callable,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from rasa.constants import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_LOG_LEVEL,
+    DEFAULT_MAX_CACHE_SIZE_IN_MB,
+    ENV_CACHE_DIR,
+    ENV_LOG_LEVEL,
+    ENV_MAX_CACHE_SIZE,
+)
+import rasa.shared.utils.io
 from rasa.shared.utils.io import write_text_file, DEFAULT_ENCODING, read_file, read_yaml
 
 if TYPE_CHECKING:
     from prompt_toolkit.validation import Validator
 
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = ".pkl"
+# fraction of the maximum size the cache directory is reduced to once it got too
+# large, so that it doesn't have to be scanned again after every write
+CACHE_EVICTION_TARGET_RATIO = 0.8
+
+_cache_lock = threading.Lock()
+# sizes of the cache directories, which are only determined once per process
+_cache_sizes: Dict[Text, int] = {}
+
 
 def configure_colored_logging(loglevel: Text) -> None:
     import coloredlogs
@@ -86,6 +117,200 @@ def pickle_load(filename: Union[Text, Path]) -> Any:
         return pickle.load(f)
 
 
+def cache_key(content: Any) -> Text:
+    """Return a key which changes whenever `content` changes.
+
+    Args:
+        content: The content. Objects which can't be serialised to json are
+            represented by their string representation.
+
+    Returns:
+        The hash of the content.
+    """
+    return rasa.shared.utils.io.get_text_hash(
+        json.dumps(content, sort_keys=True, default=str)
+    )
+
+
+class DiskCache:
+    """Stores pickled values in a subdirectory of the cache directory.
+
+    All caches share the cache directory and its maximum size. Once the whole
+    cache directory exceeds the maximum size, the least recently used files of
+    all caches are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[Text, Path],
+        subdirectory: Text,
+        max_size_in_mb: float = DEFAULT_MAX_CACHE_SIZE_IN_MB,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            cache_dir: The cache directory which is shared by all caches.
+            subdirectory: Directory within `cache_dir` which stores the values of
+                this cache.
+            max_size_in_mb: Maximum size of the whole cache directory.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.directory = self.cache_dir / subdirectory
+        self.max_size_in_mb = max_size_in_mb
+
+    @classmethod
+    def from_environment(cls, subdirectory: Text) -> Optional["DiskCache"]:
+        """Create the cache configured by environment variables.
+
+        Args:
+            subdirectory: Directory within the cache directory which stores the
+                values of the cache.
+
+        Returns:
+            `None` in case the cache was disabled by setting its maximum size to 0.
+        """
+        max_size_in_mb = float(
+            os.environ.get(ENV_MAX_CACHE_SIZE, DEFAULT_MAX_CACHE_SIZE_IN_MB)
+        )
+        if max_size_in_mb <= 0:
+            return None
+
+        return cls(
+            os.environ.get(ENV_CACHE_DIR, DEFAULT_CACHE_DIR),
+            subdirectory,
+            max_size_in_mb,
+        )
+
+    def _path_for(self, key: Text) -> Path:
+        return self.directory / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def load(self, key: Text) -> Optional[Any]:
+        """Load a cached value.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The value or `None` if it isn't cached.
+        """
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+            # mark the file as recently used
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Failed to load cached value from '{path}': {e}")
+            return None
+
+    def save(self, key: Text, value: Any) -> None:
+        """Store a value and remove the least recently used files if necessary.
+
+        Args:
+            key: The key of the value.
+            value: The value, which has to be picklable.
+        """
+        path = self._path_for(key)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so that no partial files are loaded
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.directory))
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except Exception as e:
+            logger.warning(f"Failed to cache a value in '{self.directory}': {e}")
+            # the temporary file isn't counted towards the cache size or evicted
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self._add_to_cache_size(size)
+
+    def _add_to_cache_size(self, size: int) -> None:
+        """Track the size of the cache directory and evict files if it's too large.
+
+        The size is only determined once per process and then tracked, which
+        avoids scanning the whole cache directory after every write.
+        """
+        cache_dir_key = os.path.abspath(self.cache_dir)
+        max_size = self.max_size_in_mb * 1024 * 1024
+
+        with _cache_lock:
+            cache_size = _cache_sizes.get(cache_dir_key)
+            if cache_size is None:
+                cache_size = sum(
+                    file_size for _, file_size, _ in _cached_files(self.cache_dir)
+                )
+            else:
+                cache_size += size
+
+            if cache_size > max_size:
+                cache_size = _evict_least_recently_used(
+                    self.cache_dir, max_size * CACHE_EVICTION_TARGET_RATIO
+                )
+
+            _cache_sizes[cache_dir_key] = cache_size
+
+
+def _cached_files(cache_dir: Path) -> List[Tuple[float, int, Path]]:
+    files = []
+    for path in cache_dir.glob(f"**/*{CACHE_FILE_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # evicted by another process in the meantime
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    return files
+
+
+def _evict_least_recently_used(cache_dir: Path, target_size: float) -> int:
+    """Remove the least recently used files of all caches in `cache_dir`.
+
+    Args:
+        cache_dir: The cache directory.
+        target_size: Size in bytes which the cache directory is reduced to.
+
+    Returns:
+        The size of the cache directory after the eviction.
+    """
+    files = _cached_files(cache_dir)
+    size = sum(file_size for _, file_size, _ in files)
+
+    for _, file_size, path in sorted(files):
+        if size <= target_size:
+            break
+
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        size -= file_size
+
+    logger.debug(f"Evicted least recently used files from cache '{cache_dir}'.")
+    return size
+
+
+YAML_CACHE_SUBDIRECTORY = "yaml"
+
+
+def configure_yaml_cache_from_environment() -> None:
+    """Persist parsed yaml files in the cache configured by environment variables.
+
+    Setting the maximum cache size to 0 keeps parsed files in memory only.
+    """
+    rasa.shared.utils.io.configure_yaml_cache(
+        DiskCache.from_environment(YAML_CACHE_SUBDIRECTORY)
+    )
+
+
 def read_config_file(filename: Text) -> Dict[Text, Any]:
     """Parses a yaml configuration file. Content needs to be a dictionary
 
@@ -130,10 +130,10 @@ def convert_to_data_format(
 
     # In case an attribute is not present during prediction, replace it with
     # None values that will then be replaced by zero features
-    dialogue_length = 1
-    for tracker_features in state_to_tracker_features.values():
-        dialogue_length = max(dialogue_length, len(tracker_features[0]))
-    empty_features = [[None] * dialogue_length]
+    empty_features = [
+        [None] * max(1, len(features_in_tracker))
+        for features_in_tracker in tracker_state_features
+    ]
 
     for attribute in attributes:
         attribute_data[attribute] = _features_for_attribute(
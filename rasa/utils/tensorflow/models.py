@@ -81,6 +81,8 @@ class RasaModel(tf.keras.models.Model):
         self._training = None  # training phase should be defined when building a graph
 
         self._predict_function = None
+        # loaded weights are restored as soon as the variables are created
+        self._has_unrestored_variables = False
 
         self.random_seed = random_seed
 
@@ -264,17 +266,35 @@ class RasaModel(tf.keras.models.Model):
         self, predict_data: RasaModelData, eager: bool = False
     ) -> None:
         self._training = False  # needed for tf graph mode
+
+        if self._has_unrestored_variables:
+            # create the variables of the loaded model (and thereby restore their
+            # trained values) outside of the prediction graph
+            self.batch_predict(predict_data.prepare_batch(start=0, end=1))
+            self._has_unrestored_variables = False
+
         self._predict_function = self._get_tf_call_model_function(
             predict_data.as_tf_dataset, self.batch_predict, eager, "prediction"
         )
 
     def predict(self, predict_data: RasaModelData) -> Dict[Text, tf.Tensor]:
+        """Predict on all examples of the given data at once.
+
+        The examples are padded into a single batch, so that the prediction graph is
+        only invoked once.
+
+        Args:
+            predict_data: The data to predict on.
+
+        Returns:
+            The predictions. The first dimension of every prediction is the batch
+            dimension.
+        """
         if self._predict_function is None:
             logger.debug("There is no tensorflow prediction graph.")
             self.build_for_predict(predict_data)
 
-        # Prepare a single batch of size 1
-        batch_in = predict_data.prepare_batch(start=0, end=1)
+        batch_in = predict_data.prepare_batch()
 
         self._training = False  # needed for eager mode
         return self._predict_function(batch_in)
@@ -286,23 +306,27 @@ class RasaModel(tf.keras.models.Model):
     def load(
         cls, model_file_name: Text, model_data_example: RasaModelData, *args, **kwargs
     ) -> "RasaModel":
+        """Load a trained model.
+
+        The weights are restored without training the model on an example first.
+        The variables of the model are created when the model is called for the
+        first time (e.g. by `build_for_predict`) and get their trained values as
+        soon as they are created.
+
+        Args:
+            model_file_name: The file the weights were saved to.
+            model_data_example: An example of the data the model was trained on.
+
+        Returns:
+            The loaded model.
+        """
         logger.debug("Loading the model ...")
         # create empty model
         model = cls(*args, **kwargs)
-        # need to train on 1 example to build weights of the correct size
-        model.fit(
-            model_data_example,
-            epochs=1,
-            batch_size=1,
-            evaluate_every_num_epochs=0,
-            evaluate_on_num_examples=0,
-            batch_strategy=SEQUENCE,
-            silent=True,  # don't confuse users with training output
-            loading=True,  # don't use tensorboard while loading
-            eager=True,  # no need to build tf graph, eager is faster here
-        )
-        # load trained weights
-        model.load_weights(model_file_name)
+        # the weights of the optimizer and of layers which are only used during
+        # training are never created, so the checkpoint is only partially restored
+        model.load_weights(model_file_name).expect_partial()
+        model._has_unrestored_variables = True
 
         logger.debug("Finished loading the model.")
         return model
@@ -9,6 +9,7 @@ from sanic.testing import SanicTestClient
 
 from typing import Iterator, Callable
 
+from _pytest.monkeypatch import MonkeyPatch
 from _pytest.tmpdir import TempdirFactory
 from pathlib import Path
 from sanic import Sanic
@@ -17,6 +18,7 @@ from unittest.mock import Mock
 
 import rasa.shared.utils.io
 from rasa import server
+from rasa.constants import ENV_MAX_CACHE_SIZE
 from rasa.core import config
 from rasa.core.agent import Agent, load_agent
 from rasa.core.brokers.broker import EventBroker
@@ -63,6 +65,16 @@ def event_loop(request: Request) -> Iterator[asyncio.AbstractEventLoop]:
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_training_caches() -> Iterator[None]:
+    # trainings must not reuse cached outputs of other tests or write to the
+    # `.rasa/cache` of the working directory
+    monkeypatch = MonkeyPatch()
+    monkeypatch.setenv(ENV_MAX_CACHE_SIZE, "0")
+    yield
+    monkeypatch.undo()
+
+
 @pytest.fixture(scope="session")
 async def _trained_default_agent(tmpdir_factory: TempdirFactory) -> Agent:
     model_path = tmpdir_factory.mktemp("model").strpath
@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 from typing import List, Text
 
 import pytest
@@ -31,7 +33,7 @@ from rasa.core.events import (
 )
 from rasa.core.interpreter import RegexInterpreter
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy
+from rasa.core.policies.rule_policy import RulePolicy, RuleIndex
 from rasa.core.trackers import DialogueStateTracker
 from rasa.core.training.generator import TrackerWithCachedStates
 
@@ -1197,3 +1199,77 @@ def test_predict_nothing_if_fallback_disabled():
     )
 
     assert max(action_probabilities) == 0
+
+
+def test_rule_policy_predicts_after_persist_and_load(tmp_path: Path):
+    domain = Domain.from_yaml(
+        f"""
+intents:
+- {GREET_INTENT_NAME}
+actions:
+- {UTTER_GREET_ACTION}
+    """
+    )
+    policy = RulePolicy()
+    policy.train([GREET_RULE], domain, RegexInterpreter())
+    policy.persist(str(tmp_path))
+
+    loaded_policy = RulePolicy.load(str(tmp_path))
+    new_conversation = DialogueStateTracker.from_events(
+        "simple greet",
+        evts=[
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("haha", {"name": GREET_INTENT_NAME}),
+        ],
+    )
+
+    action_probabilities = loaded_policy.predict_action_probabilities(
+        new_conversation, domain, RegexInterpreter()
+    )
+
+    assert loaded_policy.lookup == policy.lookup
+    assert_predicted_action(action_probabilities, domain, UTTER_GREET_ACTION)
+
+
+def test_rule_index_only_checks_rules_with_matching_last_turn():
+    greet_rule = json.dumps(
+        [
+            {
+                "user": {"intent": GREET_INTENT_NAME},
+                "prev_action": {"action_name": ACTION_LISTEN_NAME},
+            }
+        ],
+        sort_keys=True,
+    )
+    goodbye_rule = json.dumps(
+        [
+            {
+                "user": {"intent": "goodbye"},
+                "prev_action": {"action_name": ACTION_LISTEN_NAME},
+            }
+        ],
+        sort_keys=True,
+    )
+    any_intent_rule = json.dumps(
+        [{"prev_action": {"action_name": ACTION_LISTEN_NAME}}], sort_keys=True
+    )
+    rule_index = RuleIndex(
+        {
+            greet_rule: UTTER_GREET_ACTION,
+            goodbye_rule: "utter_goodbye",
+            any_intent_rule: "utter_anything",
+        }
+    )
+    states = [
+        {
+            "user": {"intent": GREET_INTENT_NAME},
+            "prev_action": {"action_name": ACTION_LISTEN_NAME},
+        }
+    ]
+
+    assert set(rule_index._candidate_rules(states[-1])) == {
+        greet_rule,
+        any_intent_rule,
+    }
+    assert rule_index.possible_keys(states) == {greet_rule, any_intent_rule}
+    assert rule_index.rule_states(greet_rule) == json.loads(greet_rule)
@@ -1,6 +1,9 @@
-from typing import List
+import gzip
+import json
+from typing import List, Text
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 import rasa.core
@@ -356,6 +359,193 @@ async def test_remote_action_endpoint_responds_400(
     assert "Custom action 'my_action' rejected to run" in str(execinfo.value)
 
 
+@pytest.fixture
+def incremental_endpoint(monkeypatch: MonkeyPatch) -> EndpointConfig:
+    monkeypatch.setattr(action, "_action_server_states", {})
+
+    return EndpointConfig(
+        "https://example.com/webhooks/actions", incremental_payloads=True
+    )
+
+
+def _tracker_with_greeting(sender_id: Text) -> DialogueStateTracker:
+    return DialogueStateTracker.from_events(
+        sender_id,
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}),
+            ActionExecuted("my_action"),
+        ],
+    )
+
+
+async def test_remote_action_sends_only_new_events_once_acknowledged(
+    default_channel,
+    default_nlg,
+    default_domain: Domain,
+    incremental_endpoint: EndpointConfig,
+):
+    remote_action = action.RemoteAction("my_action", incremental_endpoint)
+    tracker = _tracker_with_greeting("incremental-sender")
+
+    with aioresponses() as mocked:
+        for number_of_events in [3, 5]:
+            mocked.post(
+                incremental_endpoint.url,
+                payload={
+                    "events": [],
+                    "responses": [],
+                    "tracker_event_count": number_of_events,
+                    "domain_fingerprint": default_domain.fingerprint,
+                },
+            )
+
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+
+        tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+        tracker.update(UserUttered("bye", {"name": "goodbye"}))
+        await remote_action.run(default_channel, default_nlg, tracker, default_domain)
+
+        r = latest_request(mocked, "post", incremental_endpoint.url)
+
+    first_request, second_request = [request.kwargs["json"] for request in r]
+
+    assert first_request["event_offset"] == 0
+    assert len(first_request["tracker"]["events"]) == 3
+    assert first_request["domain"] == default_domain.as_dict()
+    assert first_request["domain_fingerprint"] == default_domain.fingerprint
+
+    assert second_request["event_offset"] == 3
+    assert second_request["tracker"]["events"] == [
+        event.as_dict() for event in list(tracker.events)[3:]
+    ]
+    assert second_request["tracker"]["latest_message"]["text"] == "bye"
+    assert "domain" not in second_request
+    assert second_request["domain_fingerprint"] == default_domain.fingerprint
+
+
+async def test_remote_action_sends_full_state_without_acknowledgement(
+    default_channel,
+    default_nlg,
+    default_domain: Domain,
+    incremental_endpoint: EndpointConfig,
+):
+    remote_action = action.RemoteAction("my_action", incremental_endpoint)
+    tracker = _tracker_with_greeting("not-acknowledged-sender")
+
+    with aioresponses() as mocked:
+        mocked.post(
+            incremental_endpoint.url,
+            payload={"events": [], "responses": []},
+            repeat=True,
+        )
+
+        for _ in range(2):
+            await remote_action.run(
+                default_channel, default_nlg, tracker, default_domain
+            )
+
+        r = latest_request(mocked, "post", incremental_endpoint.url)
+
+    for request in r:
+        assert request.kwargs["json"]["event_offset"] == 0
+        assert len(request.kwargs["json"]["tracker"]["events"]) == 3
+        assert request.kwargs["json"]["domain"] == default_domain.as_dict()
+
+
+async def test_remote_action_falls_back_to_full_state_if_server_misses_state(
+    default_channel,
+    default_nlg,
+    default_domain: Domain,
+    incremental_endpoint: EndpointConfig,
+):
+    remote_action = action.RemoteAction("my_action", incremental_endpoint)
+    tracker = _tracker_with_greeting("restarted-server-sender")
+    acknowledgement = {
+        "events": [],
+        "responses": [],
+        "tracker_event_count": 3,
+        "domain_fingerprint": default_domain.fingerprint,
+    }
+
+    with aioresponses() as mocked:
+        mocked.post(incremental_endpoint.url, payload=acknowledgement)
+        # noinspection PyTypeChecker
+        mocked.post(
+            incremental_endpoint.url,
+            exception=ClientResponseError(409, None, "Unknown conversation."),
+        )
+        mocked.post(incremental_endpoint.url, payload=acknowledgement)
+
+        for _ in range(2):
+            await remote_action.run(
+                default_channel, default_nlg, tracker, default_domain
+            )
+
+        r = latest_request(mocked, "post", incremental_endpoint.url)
+
+    incremental_request, full_request = [request.kwargs["json"] for request in r[1:]]
+
+    assert incremental_request["event_offset"] == 3
+    assert "domain" not in incremental_request
+
+    assert full_request["event_offset"] == 0
+    assert len(full_request["tracker"]["events"]) == 3
+    assert full_request["domain"] == default_domain.as_dict()
+
+
+def test_action_server_state_detects_changed_conversations(default_domain: Domain):
+    state = action.ActionServerState()
+    tracker = _tracker_with_greeting("changed-sender")
+
+    state.acknowledge(
+        tracker, default_domain, {"tracker_event_count": len(tracker.events)}
+    )
+    assert state.event_offset(tracker) == 3
+
+    replaced_tracker = DialogueStateTracker.from_events(
+        "changed-sender", list(tracker.events)[:2] + [ActionExecuted("other_action")]
+    )
+    assert state.event_offset(replaced_tracker) == 0
+
+
+def test_action_server_state_forgets_least_recently_called_conversations(
+    default_domain: Domain,
+):
+    state = action.ActionServerState(max_conversations=2)
+    trackers = [_tracker_with_greeting(f"sender {i}") for i in range(3)]
+
+    for tracker in trackers:
+        state.acknowledge(tracker, default_domain, {"tracker_event_count": 3})
+
+    assert state.event_offset(trackers[0]) == 0
+    assert state.event_offset(trackers[1]) == 3
+    assert state.event_offset(trackers[2]) == 3
+
+
+async def test_remote_action_sends_compressed_payload(
+    default_channel, default_nlg, default_tracker, default_domain
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", compress_payloads=True
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(endpoint.url, payload={"events": [], "responses": []})
+
+        await remote_action.run(
+            default_channel, default_nlg, default_tracker, default_domain
+        )
+
+        r = latest_request(mocked, "post", endpoint.url)
+
+    assert r[-1].kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(r[-1].kwargs["data"])) == (
+        remote_action._action_call_format(default_tracker, default_domain)
+    )
+
+
 async def test_action_utter_retrieved_response(
     default_channel, default_nlg, default_tracker, default_domain
 ):
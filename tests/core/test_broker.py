@@ -3,12 +3,13 @@ import logging
 from pathlib import Path
 import textwrap
 
-from typing import Union, Text, List, Optional, Type
+from typing import Union, Text, List, Optional, Type, Dict, Any
 
 import pytest
 from _pytest.logging import LogCaptureFixture
 
 from _pytest.monkeypatch import MonkeyPatch
+from unittest.mock import Mock
 
 import rasa.shared.utils.io
 import rasa.utils.io
@@ -82,6 +83,194 @@ def test_pika_queues_from_args(
     assert pika_producer.queues == expected
 
 
+def _pika_broker_with_open_channel(
+    monkeypatch: MonkeyPatch, **kwargs: Any
+) -> PikaEventBroker:
+    # patch PikaEventBroker so it doesn't try to connect to RabbitMQ on init
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+    pika_producer = PikaEventBroker("", "", "", queues=["q1"], **kwargs)
+    pika_producer.channel = Mock()
+    pika_producer._pika_connection = Mock()
+    pika_producer._pika_connection.is_closed = False
+
+    return pika_producer
+
+
+# noinspection PyProtectedMember
+def test_pika_publish_does_not_block(monkeypatch: MonkeyPatch):
+    pika_producer = _pika_broker_with_open_channel(monkeypatch)
+
+    for event in TEST_EVENTS:
+        pika_producer.publish(event.as_dict())
+
+    # the messages are published by the Pika IO thread in a single batch
+    pika_producer.channel.basic_publish.assert_not_called()
+    add_callback = pika_producer._pika_connection.ioloop.add_callback_threadsafe
+    add_callback.assert_called_once_with(pika_producer._flush_unpublished_messages)
+    assert pika_producer.metrics()["unpublished_messages"] == len(TEST_EVENTS)
+
+    pika_producer._flush_unpublished_messages()
+
+    assert pika_producer.channel.basic_publish.call_count == len(TEST_EVENTS)
+    assert pika_producer.metrics()["unpublished_messages"] == 0
+    assert pika_producer.metrics()["unconfirmed_messages"] == len(TEST_EVENTS)
+
+
+# noinspection PyProtectedMember
+def test_pika_publish_again_if_not_confirmed(monkeypatch: MonkeyPatch):
+    from pika.frame import Method
+    from pika.spec import Basic
+
+    pika_producer = _pika_broker_with_open_channel(monkeypatch)
+    for event in TEST_EVENTS:
+        pika_producer.publish(event.as_dict())
+    pika_producer._flush_unpublished_messages()
+
+    pika_producer._on_delivery_confirmation(
+        Method(1, Basic.Ack(delivery_tag=2, multiple=True))
+    )
+    assert pika_producer.metrics()["unconfirmed_messages"] == 1
+
+    pika_producer._on_delivery_confirmation(Method(1, Basic.Nack(delivery_tag=3)))
+    assert pika_producer.metrics()["unconfirmed_messages"] == 0
+    assert list(pika_producer._unpublished_messages) == [
+        (json.dumps(TEST_EVENTS[2].as_dict()), None)
+    ]
+
+
+# noinspection PyProtectedMember
+@pytest.mark.parametrize(
+    "overflow_policy,expected_messages,expected_metrics",
+    [
+        ("drop_oldest", ["2", "3"], {"dropped_messages": 1, "spilled_messages": 0}),
+        ("block", ["1", "2"], {"dropped_messages": 1, "spilled_messages": 0}),
+        ("spill_to_disk", ["1", "2"], {"dropped_messages": 0, "spilled_messages": 1}),
+    ],
+)
+def test_pika_overflow_policy(
+    overflow_policy: Text,
+    expected_messages: List[Text],
+    expected_metrics: Dict[Text, int],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+):
+    spill_path = tmp_path / "unpublished_messages.jsonl"
+    pika_producer = _pika_broker_with_open_channel(
+        monkeypatch,
+        max_unpublished_messages=2,
+        overflow_policy=overflow_policy,
+        overflow_block_timeout_in_seconds=0.01,
+        overflow_spill_path=str(spill_path),
+    )
+
+    for text in ["1", "2", "3"]:
+        pika_producer.publish({"text": text})
+
+    assert [
+        json.loads(body)["text"] for body, _ in pika_producer._unpublished_messages
+    ] == expected_messages
+    metrics = pika_producer.metrics()
+    assert metrics["unpublished_messages"] == 2
+    assert {key: metrics[key] for key in expected_metrics} == expected_metrics
+
+    pika_producer._flush_unpublished_messages()
+
+    # spilled messages are published once the buffer is empty
+    number_of_published_messages = 3 if overflow_policy == "spill_to_disk" else 2
+    assert pika_producer.channel.basic_publish.call_count == (
+        number_of_published_messages
+    )
+    assert not spill_path.exists()
+
+
+def _published_texts(pika_producer: PikaEventBroker) -> List[Text]:
+    return [
+        json.loads(call[1]["body"])["text"]
+        for call in pika_producer.channel.basic_publish.call_args_list
+    ]
+
+
+# noinspection PyProtectedMember
+async def test_pika_block_overflow_policy_does_not_block_event_loop(
+    monkeypatch: MonkeyPatch,
+):
+    pika_producer = _pika_broker_with_open_channel(
+        monkeypatch,
+        max_unpublished_messages=1,
+        overflow_policy="block",
+        overflow_block_timeout_in_seconds=10,
+    )
+
+    for text in ["1", "2"]:
+        pika_producer.publish({"text": text})
+
+    # the second message waits for space in a separate thread
+    assert len(pika_producer._unpublished_messages) == 1
+    assert pika_producer._number_of_waiting_messages == 1
+
+    pika_producer._flush_unpublished_messages()
+    pika_producer._overflow_thread_pool.shutdown(wait=True)
+    pika_producer._flush_unpublished_messages()
+
+    assert _published_texts(pika_producer) == ["1", "2"]
+    assert pika_producer.metrics()["dropped_messages"] == 0
+
+
+# noinspection PyProtectedMember
+def test_pika_spilled_messages_are_published_in_order(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    spill_path = tmp_path / "unpublished_messages.jsonl"
+    pika_producer = _pika_broker_with_open_channel(
+        monkeypatch,
+        max_unpublished_messages=2,
+        overflow_policy="spill_to_disk",
+        overflow_spill_path=str(spill_path),
+    )
+    for text in ["1", "2", "3"]:
+        pika_producer.publish({"text": text})
+
+    # the channel fails after the first message was published
+    pika_producer.channel.basic_publish.side_effect = [None, Exception()]
+    pika_producer._flush_unpublished_messages()
+    pika_producer.channel.basic_publish.side_effect = None
+    pika_producer.channel.basic_publish.reset_mock()
+
+    # the buffer has space again, but "3" was spilled and has to be published first
+    pika_producer.publish({"text": "4"})
+    pika_producer._flush_unpublished_messages()
+
+    assert _published_texts(pika_producer) == ["2", "3", "4"]
+    assert pika_producer.metrics()["spilled_messages"] == 2
+    assert not spill_path.exists()
+
+
+# noinspection PyProtectedMember
+def test_pika_drops_messages_if_unpublished_messages_are_not_kept(
+    monkeypatch: MonkeyPatch,
+):
+    pika_producer = _pika_broker_with_open_channel(
+        monkeypatch, should_keep_unpublished_messages=False
+    )
+    pika_producer.channel.basic_publish.side_effect = Exception()
+    pika_producer.publish({"text": "1"})
+    pika_producer._flush_unpublished_messages()
+
+    pika_producer.channel = None
+    pika_producer.publish({"text": "2"})
+
+    metrics = pika_producer.metrics()
+    assert metrics["unpublished_messages"] == 0
+    assert metrics["dropped_messages"] == 2
+
+
+def test_pika_invalid_overflow_policy(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(PikaEventBroker, "_run_pika", lambda _: None)
+
+    with pytest.raises(ValueError):
+        PikaEventBroker("", "", "", queues=["q1"], overflow_policy="explode")
+
+
 def test_no_broker_in_config():
     cfg = read_endpoint_config(DEFAULT_ENDPOINTS_FILE, "event_broker")
 
@@ -213,6 +402,54 @@ def test_kafka_broker_from_config():
     assert actual.topic == expected.topic
 
 
+class StandInKafkaProducer:
+    """Stand-in for `kafka.KafkaProducer` which keeps the sent events in memory."""
+
+    instances = []
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.sent = []
+        self.flushed = False
+        self.closed = False
+        StandInKafkaProducer.instances.append(self)
+
+    def send(self, topic: Text, value: Dict) -> None:
+        self.sent.append((topic, value))
+
+    def flush(self) -> None:
+        self.flushed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_kafka_broker_reuses_producer(monkeypatch: MonkeyPatch):
+    import kafka
+
+    StandInKafkaProducer.instances = []
+    monkeypatch.setattr(kafka, "KafkaProducer", StandInKafkaProducer)
+
+    broker = KafkaEventBroker(
+        "localhost", "username", "password", linger_ms=10, compression_type="gzip"
+    )
+    events = [event.as_dict() for event in TEST_EVENTS]
+    for event in events:
+        broker.publish(event)
+
+    assert len(StandInKafkaProducer.instances) == 1
+    producer = StandInKafkaProducer.instances[0]
+    assert producer.kwargs["linger_ms"] == 10
+    assert producer.kwargs["compression_type"] == "gzip"
+    assert producer.sent == [("rasa_core_events", event) for event in events]
+    assert not producer.closed
+
+    broker.close()
+
+    assert producer.flushed and producer.closed
+    assert broker.producer is None
+
+
 def test_no_pika_logs_if_no_debug_mode(caplog: LogCaptureFixture):
     from rasa.core.brokers import pika
 
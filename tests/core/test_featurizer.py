@@ -1,5 +1,11 @@
+from pathlib import Path
 from typing import Text
-from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
+from unittest.mock import patch
+
+from rasa.core.featurizers.tracker_featurizers import (
+    MaxHistoryTrackerFeaturizer,
+    TrackerFeaturizer,
+)
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.core.domain import Domain
 import numpy as np
@@ -257,3 +263,73 @@ def test_single_state_featurizer_with_interpreter_state_with_no_action_name(
     assert (
         encoded[ACTIVE_LOOP][0].features != scipy.sparse.coo_matrix([[0, 0, 0, 1]])
     ).nnz == 0
+
+
+def _domain_with_intents_and_actions() -> Domain:
+    return Domain(
+        intents=["greet", "goodbye"],
+        entities=["name"],
+        slots=[],
+        templates={},
+        forms=[],
+        action_names=["utter_greet"],
+    )
+
+
+def test_single_state_featurizer_caches_features_of_intents_and_actions():
+    domain = _domain_with_intents_and_actions()
+    interpreter = RegexInterpreter()
+    f = SingleStateFeaturizer()
+
+    with patch.object(
+        RegexInterpreter, "featurize_message", return_value=None
+    ) as featurize_message:
+        f.prepare_from_domain(domain, interpreter)
+        assert featurize_message.called
+
+        featurize_message.reset_mock()
+        encoded = f.encode_state(
+            {
+                "user": {"intent": "greet", "entities": ("name",)},
+                "prev_action": {"action_name": "action_listen"},
+            },
+            interpreter,
+        )
+        encoded_actions = f.encode_all_actions(domain, interpreter)
+        featurize_message.assert_not_called()
+
+        # user texts are always featurized by the interpreter
+        f.encode_state(
+            {
+                "user": {"text": "hello"},
+                "prev_action": {"action_name": "action_listen"},
+            },
+            interpreter,
+        )
+        featurize_message.assert_called_once()
+
+    assert list(encoded.keys()) == [INTENT, ENTITIES, ACTION_NAME]
+    greet_index = domain.intents.index("greet")
+    assert encoded[INTENT][0].features.toarray()[0].nonzero()[0] == [greet_index]
+    assert len(encoded_actions) == len(domain.action_names)
+
+
+def test_single_state_featurizer_persists_cached_features(tmp_path: Path):
+    domain = _domain_with_intents_and_actions()
+    featurizer = MaxHistoryTrackerFeaturizer(SingleStateFeaturizer())
+    featurizer.state_featurizer.prepare_from_domain(domain, RegexInterpreter())
+    featurizer.persist(str(tmp_path))
+
+    loaded = TrackerFeaturizer.load(str(tmp_path))
+
+    with patch.object(RegexInterpreter, "featurize_message") as featurize_message:
+        encoded = loaded.state_featurizer.encode_state(
+            {
+                "user": {"intent": "goodbye"},
+                "prev_action": {"action_name": "action_listen"},
+            },
+            RegexInterpreter(),
+        )
+    featurize_message.assert_not_called()
+    goodbye_index = domain.intents.index("goodbye")
+    assert encoded[INTENT][0].features.toarray()[0].nonzero()[0] == [goodbye_index]
@@ -1,7 +1,14 @@
+import asyncio
+from typing import Any, Dict, List, Text, Union
+
 import pytest
 from aioresponses import aioresponses
 
-from rasa.core.interpreter import RasaNLUHttpInterpreter, RegexInterpreter
+from rasa.core.interpreter import (
+    InferenceScheduler,
+    RasaNLUHttpInterpreter,
+    RegexInterpreter,
+)
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
 from rasa.nlu.constants import INTENT_NAME_KEY
 from rasa.utils.endpoints import EndpointConfig
@@ -117,3 +124,80 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+class BatchRecorder:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts: List[Text]) -> List[Union[Dict[Text, Any], Exception]]:
+        self.batches.append(texts)
+        return [
+            ValueError(text) if text == "invalid" else {"text": text} for text in texts
+        ]
+
+
+async def test_inference_scheduler_batches_concurrent_messages():
+    recorder = BatchRecorder()
+    scheduler = InferenceScheduler(recorder, max_batch_size=2, max_wait_time_in_ms=50)
+
+    texts = ["hi", "hello", "hey"]
+    results = await asyncio.gather(*[scheduler.parse(text) for text in texts])
+    scheduler.close()
+
+    assert [result["text"] for result in results] == texts
+    assert recorder.batches == [["hi", "hello"], ["hey"]]
+
+
+async def test_inference_scheduler_fails_only_invalid_message():
+    scheduler = InferenceScheduler(BatchRecorder(), max_wait_time_in_ms=50)
+
+    valid, invalid = await asyncio.gather(
+        scheduler.parse("hi"), scheduler.parse("invalid"), return_exceptions=True
+    )
+    scheduler.close()
+
+    assert valid == {"text": "hi"}
+    assert isinstance(invalid, ValueError)
+
+
+def test_inference_scheduler_from_endpoint_config():
+    endpoint = EndpointConfig(max_batch_size=8, max_wait_time_in_ms=20, workers=2)
+    scheduler = InferenceScheduler.from_endpoint_config(BatchRecorder(), endpoint)
+    scheduler.close()
+
+    assert scheduler.max_batch_size == 8
+    assert scheduler.max_wait_time_in_seconds == 0.02
+    assert scheduler.workers == 2
+
+
+async def test_inference_scheduler_parses_messages_after_close():
+    recorder = BatchRecorder()
+    scheduler = InferenceScheduler(recorder, max_wait_time_in_ms=50)
+    scheduler.close()
+
+    assert await scheduler.parse("hi") == {"text": "hi"}
+    with pytest.raises(ValueError):
+        await scheduler.parse("invalid")
+
+
+def test_inference_scheduler_with_new_event_loop():
+    recorder = BatchRecorder()
+    scheduler = InferenceScheduler(recorder, max_wait_time_in_ms=10_000)
+
+    # the message on the first loop is never flushed before the loop is closed
+    first_loop = asyncio.new_event_loop()
+    task = first_loop.create_task(scheduler.parse("hi"))
+    first_loop.run_until_complete(asyncio.sleep(0.01))
+    task.cancel()
+    first_loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+    first_loop.close()
+
+    scheduler.max_wait_time_in_seconds = 0.01
+    second_loop = asyncio.new_event_loop()
+    result = second_loop.run_until_complete(scheduler.parse("hello"))
+    second_loop.close()
+    scheduler.close()
+
+    assert result == {"text": "hello"}
+    assert recorder.batches == [["hello"]]
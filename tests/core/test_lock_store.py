@@ -4,6 +4,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+import threading
 import time
 
 from _pytest.monkeypatch import MonkeyPatch
@@ -277,3 +278,82 @@ async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
             pass
+
+
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_waiting_ticket_is_woken_up_when_lock_is_released(lock_store: LockStore):
+    conversation_id = "my id 3"
+    acquired_at = []
+
+    async def acquire_second_ticket() -> None:
+        # a long wait time between attempts is only ok if the release wakes us up
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+            acquired_at.append(time.time())
+
+    async with lock_store.lock(conversation_id):
+        waiting = asyncio.ensure_future(acquire_second_ticket())
+        await asyncio.sleep(0.1)
+        assert not acquired_at
+        released_at = time.time()
+
+    await asyncio.wait_for(waiting, timeout=2)
+
+    assert acquired_at[0] - released_at < 1
+    assert not lock_store.get_lock(conversation_id)
+
+
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_tickets_are_served_in_order_under_contention(lock_store: LockStore):
+    conversation_id = "my id 4"
+    n_tickets = 20
+    served = []
+
+    async def serve(number: int) -> None:
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+            served.append(number)
+            await asyncio.sleep(0)
+
+    start = time.time()
+    await asyncio.gather(*(serve(i) for i in range(n_tickets)))
+
+    assert served == list(range(n_tickets))
+    assert time.time() - start < 2
+
+
+def test_redis_lock_store_issues_unique_tickets_across_stores():
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    lock_stores = [FakeRedisLockStore() for _ in range(4)]
+    for lock_store in lock_stores:
+        lock_store.red = fakeredis.FakeStrictRedis(server=server)
+
+    conversation_id = "my id 5"
+    n_tickets_per_store = 25
+    tickets = []
+
+    def issue_tickets(lock_store: LockStore) -> None:
+        for _ in range(n_tickets_per_store):
+            tickets.append(lock_store.issue_ticket(conversation_id, 10))
+
+    threads = [
+        threading.Thread(target=issue_tickets, args=(lock_store,))
+        for lock_store in lock_stores
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    n_tickets = len(lock_stores) * n_tickets_per_store
+    assert sorted(tickets) == list(range(n_tickets))
+    assert lock_stores[0].get_lock(conversation_id).last_issued == n_tickets - 1
+
+
+def test_redis_lock_store_expires_abandoned_locks():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "my id 6"
+
+    lock_store.issue_ticket(conversation_id, 10)
+
+    assert 0 < lock_store.red.pttl(conversation_id) <= 10 * 1000
@@ -51,6 +51,7 @@ from rasa.utils.tensorflow.constants import (
     MAX_RELATIVE_POSITION,
 )
 from rasa.utils import train_utils
+import rasa.utils.io
 from tests.core.conftest import (
     DEFAULT_DOMAIN_PATH_WITH_MAPPING,
     DEFAULT_DOMAIN_PATH_WITH_SLOTS,
@@ -323,6 +324,26 @@ class TestTEDPolicy(PolicyTestCollection):
 
         mock.normalize.assert_called_once()
 
+    async def test_predict_action_probabilities_batch(
+        self, trained_policy: TEDPolicy, default_domain: Domain
+    ):
+        trackers = await train_trackers(default_domain, augmentation_factor=0)
+        # trackers of different length are padded into one batch
+        trackers.append(
+            DialogueStateTracker(UserMessage.DEFAULT_SENDER_ID, default_domain.slots)
+        )
+
+        batch_probabilities = trained_policy.predict_action_probabilities_batch(
+            trackers, default_domain, RegexInterpreter()
+        )
+
+        assert len(batch_probabilities) == len(trackers)
+        for tracker, probabilities in zip(trackers, batch_probabilities):
+            expected = trained_policy.predict_action_probabilities(
+                tracker, default_domain, RegexInterpreter()
+            )
+            assert probabilities == pytest.approx(expected, abs=1e-5)
+
     async def test_gen_batch(self, trained_policy, default_domain):
         training_trackers = await train_trackers(default_domain, augmentation_factor=0)
         interpreter = RegexInterpreter()
@@ -620,6 +641,36 @@ class TestMemoizationPolicy(PolicyTestCollection):
         recalled = trained_policy.recall(states, tracker, default_domain)
         assert recalled is not None
 
+    def test_persist_and_load_lookup(
+        self, trained_policy: MemoizationPolicy, tmp_path: Path
+    ):
+        trained_policy.persist(str(tmp_path))
+        loaded = trained_policy.__class__.load(str(tmp_path))
+
+        assert loaded.lookup == trained_policy.lookup
+
+    def test_load_legacy_lookup(
+        self, trained_policy: MemoizationPolicy, default_domain: Domain, tmp_path: Path
+    ):
+        tracker = get_tracker([ActionExecuted(ACTION_LISTEN_NAME)])
+        states = trained_policy.featurizer.prediction_states([tracker], default_domain)[
+            0
+        ]
+        legacy_key = trained_policy._create_legacy_feature_key(states)
+
+        trained_policy.persist(str(tmp_path))
+        rasa.utils.io.dump_obj_as_json_to_file(
+            tmp_path / "memorized_turns.json",
+            {
+                "priority": trained_policy.priority,
+                "max_history": trained_policy.max_history,
+                "lookup": {legacy_key: "utter_greet"},
+            },
+        )
+        loaded = trained_policy.__class__.load(str(tmp_path))
+
+        assert loaded._recall_states(states) == "utter_greet"
+
 
 class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
     def create_policy(self, featurizer, priority):
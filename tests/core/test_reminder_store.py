@@ -0,0 +1,213 @@
+import datetime
+import threading
+import time
+from pathlib import Path
+from typing import Text
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.core.channels.channel import CollectingOutputChannel
+from rasa.core.events import (
+    ActionExecuted,
+    ReminderCancelled,
+    ReminderScheduled,
+    UserUttered,
+)
+from rasa.core.processor import MessageProcessor
+from rasa.core.reminder_store import (
+    InMemoryReminderStore,
+    RedisReminderStore,
+    ReminderStore,
+    SQLReminderStore,
+    ScheduledReminder,
+)
+from rasa.utils.endpoints import EndpointConfig
+
+
+class FakeRedisReminderStore(RedisReminderStore):
+    """Fake `RedisReminderStore` using `fakeredis` library."""
+
+    # noinspection PyMissingConstructor
+    def __init__(self, lease_lifetime: float = 60) -> None:
+        import fakeredis
+
+        self.red = fakeredis.FakeStrictRedis()
+        self.key_prefix = "rasa_reminders"
+        self.lease_lifetime = lease_lifetime
+        self.polling_interval = 5
+
+
+def _reminder(
+    sender_id: Text = "sender",
+    seconds_until_due: float = -1,
+    name: Text = "reminder",
+    intent: Text = "greet",
+) -> ScheduledReminder:
+    return ScheduledReminder(
+        sender_id,
+        ReminderScheduled(
+            intent,
+            datetime.datetime.now() + datetime.timedelta(seconds=seconds_until_due),
+            name=name,
+        ),
+        input_channel="rest",
+    )
+
+
+@pytest.fixture(params=["in_memory", "redis", "sql"])
+def reminder_store(request, tmp_path: Path) -> ReminderStore:
+    if request.param == "in_memory":
+        return InMemoryReminderStore()
+    if request.param == "redis":
+        return FakeRedisReminderStore()
+    return SQLReminderStore(db=str(tmp_path / "reminders.db"))
+
+
+def test_claim_due_reminders(reminder_store: ReminderStore):
+    due_reminder = _reminder(name="due")
+    reminder_store.save(due_reminder)
+    reminder_store.save(_reminder(name="later", seconds_until_due=100))
+
+    assert reminder_store.claim_due_reminders() == [due_reminder]
+
+    # claimed reminders can't be claimed by others until their lease expires
+    assert reminder_store.claim_due_reminders() == []
+    assert reminder_store.claim("sender", "due") is None
+
+
+def test_claim_reminder(reminder_store: ReminderStore):
+    reminder = _reminder()
+    reminder_store.save(reminder)
+    reminder_store.save(_reminder(name="later", seconds_until_due=100))
+
+    assert reminder_store.claim("sender", "later") is None
+    assert reminder_store.claim("other sender", "reminder") is None
+    assert reminder_store.claim("sender", "reminder") == reminder
+    assert reminder_store.claim("sender", "reminder") is None
+
+
+def test_expired_claims_can_be_claimed_again(
+    reminder_store: ReminderStore, monkeypatch: MonkeyPatch
+):
+    reminder = _reminder()
+    reminder_store.save(reminder)
+    assert reminder_store.claim_due_reminders() == [reminder]
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + reminder_store.lease_lifetime + 1)
+    if isinstance(reminder_store, FakeRedisReminderStore):
+        # leases expire in Redis itself
+        reminder_store.red.flushdb()
+        reminder_store.save(reminder)
+
+    assert reminder_store.claim_due_reminders() == [reminder]
+
+
+def test_completed_reminders_are_removed(reminder_store: ReminderStore):
+    reminder_store.save(_reminder())
+    (reminder,) = reminder_store.claim_due_reminders()
+
+    reminder_store.complete(reminder)
+
+    assert reminder_store.cancel("sender", ReminderCancelled()) == []
+
+
+def test_rescheduled_reminders_are_not_completed(reminder_store: ReminderStore):
+    reminder_store.save(_reminder())
+    (reminder,) = reminder_store.claim_due_reminders()
+
+    rescheduled_reminder = _reminder(intent="goodbye")
+    reminder_store.save(rescheduled_reminder)
+    reminder_store.complete(reminder)
+
+    assert reminder_store.claim_due_reminders() == [rescheduled_reminder]
+
+
+@pytest.mark.parametrize(
+    "cancellation, cancelled_names",
+    [
+        (ReminderCancelled(), ["first", "second", "third"]),
+        (ReminderCancelled(name="second"), ["second"]),
+        (ReminderCancelled(intent="greet"), ["first", "third"]),
+        (ReminderCancelled(name="second", intent="greet"), []),
+    ],
+)
+def test_cancel_reminders(
+    reminder_store: ReminderStore, cancellation: ReminderCancelled, cancelled_names
+):
+    reminder_store.save(_reminder(name="first"))
+    reminder_store.save(_reminder(name="second", intent="goodbye"))
+    reminder_store.save(_reminder(name="third"))
+    other_reminder = _reminder(sender_id="other sender", name="first")
+    reminder_store.save(other_reminder)
+
+    cancelled = reminder_store.cancel("sender", cancellation)
+
+    assert sorted(reminder.name for reminder in cancelled) == cancelled_names
+    remaining = reminder_store.claim_due_reminders()
+    assert other_reminder in remaining
+    assert len(remaining) == 4 - len(cancelled_names)
+
+
+def test_create_reminder_store_from_endpoint_config(tmp_path: Path):
+    assert isinstance(ReminderStore.create(None), InMemoryReminderStore)
+
+    store = ReminderStore.create(
+        EndpointConfig(type="sql", db=str(tmp_path / "reminders.db"), lease_lifetime=10)
+    )
+    assert isinstance(store, SQLReminderStore)
+    assert store.lease_lifetime == 10
+
+
+async def test_async_methods_run_blocking_methods_in_thread_pool(tmp_path: Path):
+    reminder_store = SQLReminderStore(db=str(tmp_path / "reminders.db"))
+    threads = []
+    claim_due_reminders = reminder_store.claim_due_reminders
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        return claim_due_reminders(*args)
+
+    reminder_store.claim_due_reminders = record_thread
+    reminder = _reminder()
+    await reminder_store.save_async(reminder)
+
+    assert await reminder_store.claim_due_reminders_async() == [reminder]
+    await reminder_store.complete_async(reminder)
+    assert await reminder_store.cancel_async("sender", ReminderCancelled()) == []
+
+    reminder_store.close()
+    assert threads and threading.current_thread() not in threads
+    assert getattr(reminder_store, "_thread_pool", None) is None
+
+
+async def test_processor_triggers_reminders_from_persistent_store(
+    default_processor: MessageProcessor, tmp_path: Path
+):
+    default_processor.reminder_store = SQLReminderStore(
+        db=str(tmp_path / "reminders.db")
+    )
+    tracker = default_processor.tracker_store.get_or_create_tracker("reminder user")
+    tracker.update(UserUttered("test"))
+    tracker.update(ActionExecuted("action_schedule_reminder"))
+    reminder = ReminderScheduled(
+        "greet", datetime.datetime.now(), kill_on_user_message=False
+    )
+    tracker.update(reminder)
+    default_processor.tracker_store.save(tracker)
+
+    # a reminder scheduled by another server or before a restart
+    default_processor.reminder_store.save(
+        ScheduledReminder(tracker.sender_id, reminder, "rest")
+    )
+
+    output_channel = CollectingOutputChannel()
+    await default_processor.handle_due_reminders(lambda _: output_channel)
+
+    tracker = default_processor.tracker_store.retrieve("reminder user")
+    assert any(
+        isinstance(event, UserUttered) and event.intent_name == "greet"
+        for event in tracker.events
+    )
+    assert default_processor.reminder_store.claim_due_reminders() == []
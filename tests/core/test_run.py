@@ -3,8 +3,12 @@ from typing import Text
 from sanic import Sanic
 from asyncio import AbstractEventLoop
 from pathlib import Path
+from unittest.mock import Mock
 from rasa.core import run, interpreter, policies, domain
+from rasa.core.agent import Agent
+from rasa.core.tracker_store import InMemoryTrackerStore
 from rasa.core.utils import AvailableEndpoints
+from rasa.utils.endpoints import EndpointConfig
 
 CREDENTIALS_FILE = "examples/moodbot/credentials.yml"
 
@@ -79,3 +83,36 @@ async def test_load_agent_on_start_with_bad_model_file(
     assert isinstance(agent.interpreter, interpreter.RegexInterpreter)
     assert agent.policy_ensemble is None
     assert isinstance(agent.domain, domain.Domain)
+
+
+async def test_close_resources_closes_event_broker(
+    loop: AbstractEventLoop, default_domain: domain.Domain
+):
+    event_broker = Mock()
+    app = Sanic(__name__)
+    app.agent = Agent(
+        default_domain,
+        tracker_store=InMemoryTrackerStore(default_domain, event_broker),
+    )
+
+    await run.close_resources(app, loop)
+
+    event_broker.close.assert_called_once()
+
+
+async def test_open_pooled_sessions(
+    loop: AbstractEventLoop, default_domain: domain.Domain
+):
+    action_endpoint = EndpointConfig("https://example.com/webhook")
+    app = Sanic(__name__)
+    app.agent = Agent(default_domain, action_endpoint=action_endpoint)
+
+    await run.open_pooled_sessions(app, loop)
+    session = action_endpoint._pooled_session
+
+    assert session is not None
+    assert action_endpoint.pooled_session() is session
+
+    await run.close_resources(app, loop)
+
+    assert session.closed
@@ -1,4 +1,5 @@
 import logging
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -15,10 +16,11 @@ from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
 from typing import Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import rasa.core.tracker_store
 from rasa.core.actions.action import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
+from rasa.core.brokers.broker import EventBroker
 from rasa.core.channels.channel import UserMessage
 from rasa.core.constants import POSTGRESQL_SCHEMA
 from rasa.core.domain import Domain
@@ -92,6 +94,25 @@ def test_dynamo_tracker_floats():
     assert retrieved_timestamp == timestamp
 
 
+@mock_dynamodb2
+async def test_dynamo_async_methods_use_table_per_thread():
+    conversation_id = uuid.uuid4().hex
+    tracker_store = DynamoTrackerStore(domain)
+
+    tracker = await tracker_store.get_or_create_tracker_async(conversation_id)
+    retrieved = await tracker_store.retrieve_async(conversation_id)
+    tracker_store.close()
+
+    assert list(retrieved.events) == list(tracker.events)
+
+    tables = []
+    thread = threading.Thread(target=lambda: tables.append(tracker_store.db))
+    thread.start()
+    thread.join()
+
+    assert tables[0] is not tracker_store.db
+
+
 def test_restart_after_retrieval_from_tracker_store(default_domain: Domain):
     store = InMemoryTrackerStore(default_domain)
     tr = store.get_or_create_tracker("myuser")
@@ -528,6 +549,222 @@ def test_mongo_additional_events_with_session_start(default_domain: Domain):
     assert isinstance(additional_events[0], UserUttered)
 
 
+def test_mongo_save_retrieved_tracker_without_loading_events(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    sender_id = "test_mongo_save_retrieved_tracker_without_loading_events"
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), SessionStarted(), UserUttered("hi again")],
+        )
+    )
+
+    find_one = Mock(wraps=tracker_store.conversations.find_one)
+    monkeypatch.setattr(tracker_store.conversations, "find_one", find_one)
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == [SessionStarted(), UserUttered("hi again")]
+
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    # the stored events were never loaded completely
+    for call in find_one.call_args_list:
+        assert len(call[0]) == 2
+
+    assert list(tracker_store.retrieve(sender_id).events) == [
+        SessionStarted(),
+        UserUttered("hi again"),
+        BotUttered("hey"),
+    ]
+
+
+def test_mongo_retrieve_and_save_conversation_without_event_count(
+    default_domain: Domain,
+):
+    sender_id = "test_mongo_retrieve_and_save_conversation_without_event_count"
+    tracker_store = MockedMongoTrackerStore(default_domain)
+    # conversations stored by previous versions don't have the event count
+    tracker_store.conversations.insert_one(
+        {
+            "sender_id": sender_id,
+            "events": [
+                UserUttered("hi").as_dict(),
+                SessionStarted().as_dict(),
+                UserUttered("hi again").as_dict(),
+            ],
+        }
+    )
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == [SessionStarted(), UserUttered("hi again")]
+
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert len(stored["events"]) == 4
+    assert stored[rasa.core.tracker_store.SESSION_EVENT_COUNT_KEY] == 3
+    assert len(tracker_store.retrieve(sender_id).events) == 3
+
+
+def test_fail_safe_mongo_retrieve_and_save_conversation_without_event_count(
+    default_domain: Domain,
+):
+    sender_id = "test_fail_safe_mongo_save_conversation_without_event_count"
+    mongo_tracker_store = MockedMongoTrackerStore(default_domain)
+    # conversations stored by previous versions don't have the event count
+    mongo_tracker_store.conversations.insert_one(
+        {
+            "sender_id": sender_id,
+            "events": [
+                UserUttered("hi").as_dict(),
+                SessionStarted().as_dict(),
+                UserUttered("hi again").as_dict(),
+            ],
+        }
+    )
+    tracker_store = FailSafeTrackerStore(mongo_tracker_store)
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    stored = mongo_tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored[rasa.core.tracker_store.SESSION_EVENT_COUNT_KEY] == 3
+    assert list(tracker_store.retrieve(sender_id).events) == [
+        SessionStarted(),
+        UserUttered("hi again"),
+        BotUttered("hey"),
+    ]
+
+
+def test_redis_save_appends_new_events(default_domain: Domain):
+    from tests.core.test_trackers import MockRedisTrackerStore
+
+    sender_id = "test_redis_save_appends_new_events"
+    tracker_store = MockRedisTrackerStore(default_domain)
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), SessionStarted(), UserUttered("hi again")]
+        )
+    )
+
+    tracker = tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == [SessionStarted(), UserUttered("hi again")]
+
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+    tracker_store.save(tracker)
+
+    # noinspection PyProtectedMember
+    stored_events = tracker_store.red.lrange(
+        tracker_store._events_key(sender_id), 0, -1
+    )
+    assert len(stored_events) == 4
+    assert list(tracker_store.retrieve(sender_id).events) == list(tracker.events)
+    assert list(tracker_store.keys()) == [sender_id]
+
+
+def test_redis_retrieve_loads_events_in_one_call(default_domain: Domain):
+    from tests.core.test_trackers import MockRedisTrackerStore
+
+    sender_id = "test_redis_retrieve_loads_events_in_one_call"
+    tracker_store = MockRedisTrackerStore(default_domain)
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), SessionStarted(), UserUttered("hi again")]
+        )
+    )
+
+    with patch.object(
+        tracker_store.red, "execute_command", wraps=tracker_store.red.execute_command
+    ) as execute_command:
+        tracker = tracker_store.retrieve(sender_id)
+
+    execute_command.assert_called_once()
+    assert list(tracker.events) == [SessionStarted(), UserUttered("hi again")]
+
+    tracker_store.load_events_from_previous_conversation_sessions = True
+    assert len(tracker_store.retrieve(sender_id).events) == 3
+
+
+def test_redis_keys_ignore_keys_of_other_applications(default_domain: Domain):
+    from tests.core.test_trackers import MockRedisTrackerStore
+
+    sender_id = "test_redis_keys_ignore_keys_of_other_applications"
+    tracker_store = MockRedisTrackerStore(default_domain)
+    tracker_store.save(DialogueStateTracker.from_events(sender_id, [UserUttered("hi")]))
+    tracker_store.red.set("other_application", "value")
+    tracker_store.red.rpush("events:other_application", "value")
+
+    assert list(tracker_store.keys()) == [sender_id]
+
+
+def test_redis_keys_are_read_from_set_of_conversation_ids(default_domain: Domain):
+    from tests.core.test_trackers import MockRedisTrackerStore
+
+    tracker_store = MockRedisTrackerStore(default_domain)
+    sender_ids = ["first", "second"]
+    for sender_id in sender_ids:
+        tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+        )
+    assert sorted(tracker_store.keys()) == sender_ids
+
+    with patch.object(
+        tracker_store.red, "scan_iter", wraps=tracker_store.red.scan_iter
+    ) as scan_iter:
+        assert sorted(tracker_store.keys()) == sender_ids
+
+    scan_iter.assert_not_called()
+
+
+def test_redis_keys_do_not_contain_expired_conversations(default_domain: Domain):
+    from tests.core.test_trackers import MockRedisTrackerStore
+
+    tracker_store = MockRedisTrackerStore(default_domain)
+    tracker_store.record_exp = 100
+    for sender_id in ["expired", "stored"]:
+        tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+        )
+
+    # noinspection PyProtectedMember
+    tracker_store.red.delete(
+        tracker_store._events_key("expired"),
+        tracker_store._session_events_key("expired"),
+    )
+
+    assert list(tracker_store.keys()) == ["stored"]
+    # noinspection PyProtectedMember
+    assert tracker_store.red.smembers(tracker_store._conversations_key) == {b"stored"}
+
+
+def test_redis_retrieve_migrates_serialised_tracker(default_domain: Domain):
+    from tests.core.test_trackers import MockRedisTrackerStore
+
+    sender_id = "test_redis_retrieve_migrates_serialised_tracker"
+    tracker_store = MockRedisTrackerStore(default_domain)
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hi"), SessionStarted(), UserUttered("hi again")]
+    )
+    # previous versions stored the serialised tracker under the conversation ID
+    tracker_store.red.set(sender_id, tracker_store.serialise_tracker(tracker))
+    assert list(tracker_store.keys()) == [sender_id]
+
+    retrieved = tracker_store.retrieve(sender_id)
+
+    assert list(retrieved.events) == [SessionStarted(), UserUttered("hi again")]
+    assert tracker_store.red.get(sender_id) is None
+    assert list(tracker_store.keys()) == [sender_id]
+
+    retrieved.update(BotUttered("hey"))
+    tracker_store.save(retrieved)
+    assert len(tracker_store.retrieve(sender_id).events) == 3
+
+
 # we cannot parametrise over this and the previous test due to the different ways of
 # calling _additional_events()
 def test_sql_additional_events(default_domain: Domain):
@@ -834,3 +1071,210 @@ def test_current_state_without_events(default_domain: Domain):
 
     # `events` key should not be in there
     assert state and "events" not in state
+
+
+def test_sql_additional_events_of_retrieved_tracker_without_counting(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    sender_id = "test_sql_additional_events_without_counting"
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), ActionExecuted(ACTION_LISTEN_NAME)]
+        )
+    )
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(UserUttered("hi2"))
+
+    count = Mock(side_effect=AssertionError("stored events should not be counted"))
+    monkeypatch.setattr("sqlalchemy.orm.Query.count", count)
+
+    with tracker_store.session_scope() as session:
+        # noinspection PyProtectedMember
+        additional_events = list(tracker_store._additional_events(session, tracker))
+
+    assert additional_events == [UserUttered("hi2")]
+
+
+def test_sql_repeated_saves_append_only_new_events(default_domain: Domain):
+    sender_id = "test_sql_repeated_saves_append_only_new_events"
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    tracker_store.save(tracker)
+
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker_store.save(tracker)
+    tracker_store.save(tracker)
+
+    retrieved = tracker_store.retrieve(sender_id)
+    assert list(retrieved.events) == list(tracker.events)
+
+    retrieved.update(UserUttered("hi2"))
+    tracker_store.save(retrieved)
+
+    assert len(tracker_store.retrieve(sender_id).events) == 3
+
+
+def test_stream_events_of_retrieved_tracker_without_retrieving_it_again(
+    default_domain: Domain,
+):
+    event_broker = Mock()
+    tracker_store = InMemoryTrackerStore(default_domain, event_broker)
+    sender_id = "test_stream_events_of_retrieved_tracker"
+    tracker_store.save(DialogueStateTracker.from_events(sender_id, [UserUttered("hi")]))
+
+    tracker = tracker_store.retrieve(sender_id)
+    bot_uttered = BotUttered("hey")
+    tracker.update(bot_uttered)
+    event_broker.publish.reset_mock()
+    tracker_store.retrieve = Mock()
+
+    tracker_store.save(tracker)
+
+    tracker_store.retrieve.assert_not_called()
+    event_broker.publish.assert_called_once_with(
+        {"sender_id": sender_id, **bot_uttered.as_dict()}
+    )
+
+
+class CustomTrackerStore(TrackerStore):
+    """Tracker store which doesn't keep track of the persisted events itself."""
+
+    def __init__(self, _domain: Domain, event_broker: Mock) -> None:
+        self.store = {}
+        super().__init__(_domain, event_broker)
+
+    def save(self, tracker: DialogueStateTracker) -> None:
+        self.stream_events(tracker)
+        self.store[tracker.sender_id] = self.serialise_tracker(tracker)
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        if sender_id in self.store:
+            return self.deserialise_tracker(sender_id, self.store[sender_id])
+        return None
+
+
+def test_fail_safe_tracker_store_streams_only_new_events_of_custom_store(
+    default_domain: Domain,
+):
+    event_broker = Mock()
+    tracker_store = FailSafeTrackerStore(
+        CustomTrackerStore(default_domain, event_broker)
+    )
+    sender_id = "test_fail_safe_tracker_store_streams_only_new_events"
+    tracker = tracker_store.get_or_create_tracker(sender_id)
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+    assert event_broker.publish.call_count == 2
+
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+    assert event_broker.publish.call_count == 3
+
+    # the custom tracker store doesn't know which of the events are persisted
+    tracker = tracker_store.retrieve(sender_id)
+    assert tracker.unpersisted_events() is None
+
+
+def test_fail_safe_tracker_store_forgets_persisted_events_on_save_error():
+    tracker_store = FailSafeTrackerStore(
+        Mock(save=Mock(side_effect=Exception())), Mock(), Mock()
+    )
+    tracker = DialogueStateTracker.from_events("default", [UserUttered("hi")])
+    tracker.mark_events_as_persisted()
+    tracker.update(BotUttered("hey"))
+
+    tracker_store.save(tracker)
+
+    assert tracker.unpersisted_events() is None
+
+
+class ThreadRecordingTrackerStore(InMemoryTrackerStore):
+    """Tracker store which records the threads its blocking methods are run in."""
+
+    def __init__(
+        self, _domain: Domain, event_broker: Optional[EventBroker] = None
+    ) -> None:
+        self.threads = []
+        super().__init__(_domain, event_broker)
+
+    @property
+    def has_blocking_io(self) -> bool:
+        return True
+
+    def save(self, tracker: DialogueStateTracker) -> None:
+        self.threads.append(threading.current_thread())
+        super().save(tracker)
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        self.threads.append(threading.current_thread())
+        return super().retrieve(sender_id)
+
+
+async def test_async_tracker_store_methods_run_blocking_methods_in_thread_pool(
+    default_domain: Domain,
+):
+    tracker_store = ThreadRecordingTrackerStore(default_domain)
+    sender_id = "test_async_tracker_store_methods"
+
+    tracker = await tracker_store.get_or_create_tracker_async(sender_id)
+    tracker.update(UserUttered("hi"))
+    await tracker_store.save_async(tracker)
+
+    retrieved = await tracker_store.retrieve_async(sender_id)
+
+    assert list(retrieved.events) == list(tracker.events)
+    assert list(await tracker_store.keys_async()) == [sender_id]
+    assert len(tracker_store.threads) == 4
+    assert threading.current_thread() not in tracker_store.threads
+
+
+async def test_async_save_publishes_events_on_event_loop(default_domain: Domain):
+    publishing_threads = []
+    event_broker = Mock(
+        publish=Mock(
+            side_effect=lambda _: publishing_threads.append(threading.current_thread())
+        )
+    )
+    tracker_store = ThreadRecordingTrackerStore(default_domain, event_broker)
+    tracker = DialogueStateTracker.from_events(
+        "test_async_save_publishes_events_on_event_loop", [UserUttered("hi")]
+    )
+
+    await tracker_store.save_async(tracker)
+    tracker_store.close()
+
+    assert event_broker.publish.call_count == 1
+    assert publishing_threads == [threading.current_thread()]
+    assert tracker_store.threads[0] is not threading.current_thread()
+    assert getattr(tracker_store, "_thread_pool", None) is None
+
+
+async def test_async_tracker_store_methods_without_blocking_io(default_domain: Domain,):
+    tracker_store = InMemoryTrackerStore(default_domain)
+    sender_id = "test_async_tracker_store_methods_without_blocking_io"
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+
+    await tracker_store.save_async(tracker)
+
+    assert await tracker_store.retrieve_async(sender_id) is not None
+    # no thread pool is needed if the tracker store doesn't wait for IO
+    assert getattr(tracker_store, "_thread_pool", None) is None
+
+
+async def test_fail_safe_tracker_store_async_with_save_error(default_domain: Domain):
+    primary_tracker_store = InMemoryTrackerStore(default_domain)
+    primary_tracker_store.save = Mock(side_effect=Exception())
+    fallback_tracker_store = InMemoryTrackerStore(default_domain)
+    on_error_callback = Mock()
+    tracker_store = FailSafeTrackerStore(
+        primary_tracker_store, on_error_callback, fallback_tracker_store
+    )
+    tracker = DialogueStateTracker.from_events("default", [UserUttered("hi")])
+
+    await tracker_store.save_async(tracker)
+
+    on_error_callback.assert_called_once()
+    assert fallback_tracker_store.retrieve("default") is not None
+    assert tracker.unpersisted_events() is None
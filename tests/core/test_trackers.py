@@ -38,6 +38,7 @@ from rasa.shared.core.slots import (
     Slot,
 )
 from rasa.core.tracker_store import (
+    DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
     InMemoryTrackerStore,
     RedisTrackerStore,
     SQLTrackerStore,
@@ -65,6 +66,7 @@ class MockRedisTrackerStore(RedisTrackerStore):
     def __init__(self, _domain: Domain) -> None:
         self.red = fakeredis.FakeStrictRedis()
         self.record_exp = None
+        self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -1121,3 +1123,115 @@ def test_change_form_to_deprecation_warning():
         tracker.change_form_to(new_form)
 
     assert tracker.active_loop_name == new_form
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("goodbye"),
+            ActionExecuted("utter_goodbye"),
+        ],
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            ActionReverted(),
+            ActionExecuted("utter_goodbye"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("goodbye"),
+            UserUtteranceReverted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+        ],
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            Restarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("goodbye"),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+        ],
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            SlotSet(REQUESTED_SLOT, "bla"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("fill slots"),
+            ActionExecuted("loop"),
+            SlotSet(REQUESTED_SLOT, None),
+            ActiveLoop(None),
+        ],
+    ],
+)
+def test_past_states_are_updated_incrementally(
+    default_domain: Domain, events: List[Event]
+):
+    tracker = DialogueStateTracker("default", default_domain.slots)
+
+    for event in events:
+        tracker.update(event)
+
+        assert tracker.past_states(
+            default_domain
+        ) == default_domain.states_for_tracker_history(tracker)
+
+
+def test_past_states_only_replay_new_events(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        default_domain.slots,
+    )
+    tracker.past_states(default_domain)
+
+    new_event = ActionExecuted("utter_greet")
+    tracker.update(new_event)
+    shadow_tracker = tracker._past_states_cache._shadow_tracker
+
+    tracker.past_states(default_domain)
+
+    assert tracker._past_states_cache._shadow_tracker is shadow_tracker
+    assert shadow_tracker.events[-1] is new_event
+
+
+def test_past_states_cannot_be_modified_by_caller(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        default_domain.slots,
+    )
+
+    states = tracker.past_states(default_domain)
+    del states[-1]["user"]["intent"]
+
+    assert tracker.past_states(
+        default_domain
+    ) == default_domain.states_for_tracker_history(tracker)
+
+
+def test_unpersisted_events():
+    tracker = DialogueStateTracker.from_events("default", [UserUttered("hi")])
+    # it's unknown which events are persisted
+    assert tracker.unpersisted_events() is None
+
+    tracker.mark_events_as_persisted()
+    assert tracker.unpersisted_events() == []
+
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    assert tracker.unpersisted_events() == [ActionExecuted(ACTION_LISTEN_NAME)]
+
+    tracker.mark_events_as_persisted()
+    tracker.events.clear()
+    tracker.update(UserUttered("hi2"))
+    # the latest persisted event isn't part of the tracker anymore
+    assert tracker.unpersisted_events() is None
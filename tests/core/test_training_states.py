@@ -0,0 +1,82 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from rasa.core import training
+from rasa.core.domain import Domain
+from rasa.core.featurizers.tracker_featurizers import (
+    FullDialogueTrackerFeaturizer,
+    MaxHistoryTrackerFeaturizer,
+)
+from rasa.core.featurizers.training_states import TrainingStates
+from rasa.core.trackers import DialogueStateTracker
+from tests.core.conftest import DEFAULT_STORIES_FILE
+
+
+async def test_states_are_created_once_for_all_featurizers(default_domain: Domain):
+    trackers = await training.load_data(
+        DEFAULT_STORIES_FILE, default_domain, augmentation_factor=0
+    )
+    training_states = TrainingStates(default_domain)
+
+    with patch.object(
+        DialogueStateTracker,
+        "past_states",
+        autospec=True,
+        side_effect=DialogueStateTracker.past_states,
+    ) as past_states:
+        for featurizer in [
+            MaxHistoryTrackerFeaturizer(max_history=1),
+            MaxHistoryTrackerFeaturizer(max_history=5),
+            FullDialogueTrackerFeaturizer(),
+        ]:
+            expected = featurizer.training_states_and_actions(trackers, default_domain)
+            shared = featurizer.training_states_and_actions(
+                trackers, default_domain, training_states
+            )
+
+            assert shared == expected
+
+    # featurizers without shared states create the states every time
+    assert past_states.call_count == 4 * len(trackers)
+
+
+async def test_states_are_reused_between_trainings(
+    default_domain: Domain, tmp_path: Path
+):
+    trackers = await training.load_data(
+        DEFAULT_STORIES_FILE, default_domain, augmentation_factor=0
+    )
+    featurizer = MaxHistoryTrackerFeaturizer(max_history=3)
+
+    training_states = TrainingStates(default_domain, str(tmp_path))
+    expected = featurizer.training_states_and_actions(
+        trackers, default_domain, training_states
+    )
+    training_states.persist()
+
+    with patch.object(DialogueStateTracker, "past_states") as past_states:
+        training_states = TrainingStates(default_domain, str(tmp_path))
+        actual = featurizer.training_states_and_actions(
+            trackers, default_domain, training_states
+        )
+
+        past_states.assert_not_called()
+        assert actual == expected
+
+
+async def test_states_are_not_reused_for_changed_domain(
+    default_domain: Domain, tmp_path: Path
+):
+    trackers = await training.load_data(
+        DEFAULT_STORIES_FILE, default_domain, augmentation_factor=0
+    )
+    training_states = TrainingStates(default_domain, str(tmp_path))
+    for tracker in trackers:
+        training_states.for_tracker(tracker)
+    training_states.persist()
+
+    changed_domain = Domain.from_dict(
+        {**default_domain.as_dict(), "intents": default_domain.intents + ["new"]}
+    )
+
+    assert not TrainingStates(changed_domain, str(tmp_path))._tracker_states
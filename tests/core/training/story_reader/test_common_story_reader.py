@@ -6,6 +6,7 @@ from typing import Text, List
 
 import numpy as np
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.core import training
 from rasa.core.domain import Domain
@@ -282,3 +283,51 @@ async def test_load_training_data_reader_not_found_throws(
 
 def test_session_started_event_is_not_serialised():
     assert SessionStarted().as_story_string() is None
+
+
+async def test_generate_training_data_in_parallel(
+    default_domain: Domain, monkeypatch: MonkeyPatch
+):
+    import rasa.core.training.generator
+
+    monkeypatch.setattr(rasa.core.training.generator, "MIN_TRACKERS_PER_WORKER", 1)
+
+    trackers = await training.load_data(
+        "data/test_stories/stories_defaultdomain.md",
+        default_domain,
+        augmentation_factor=20,
+    )
+    parallel_trackers = await training.load_data(
+        "data/test_stories/stories_defaultdomain.md",
+        default_domain,
+        augmentation_factor=20,
+        generation_workers=2,
+    )
+
+    assert [t.sender_id for t in parallel_trackers] == [t.sender_id for t in trackers]
+    assert [t.past_states(default_domain) for t in parallel_trackers] == [
+        t.past_states(default_domain) for t in trackers
+    ]
+
+
+async def test_copied_tracker_equals_replayed_tracker(default_domain: Domain):
+    trackers = await training.load_data(
+        "data/test_stories/stories_defaultdomain.md",
+        default_domain,
+        augmentation_factor=0,
+    )
+
+    for tracker in trackers:
+        copied = tracker.copy(tracker.sender_id)
+        replayed = tracker.init_copy()
+        for event in tracker.events:
+            replayed.update(event)
+
+        assert copied.current_state() == replayed.current_state()
+        assert copied.hash_of_past_states(
+            default_domain
+        ) == replayed.hash_of_past_states(default_domain)
+
+        # the copy must not share mutable state with the original
+        copied.update(ActionExecuted("utter_greet"))
+        assert len(copied.events) == len(tracker.events) + 1
@@ -27,6 +27,7 @@ from rasa.utils.tensorflow.constants import (
     BILOU_FLAG,
 )
 from rasa.nlu.classifiers.diet_classifier import DIETClassifier
+from rasa.utils.tensorflow.models import RasaModel
 from rasa.nlu.model import Interpreter
 from rasa.shared.nlu.training_data.message import Message
 from rasa.utils import train_utils
@@ -402,3 +403,66 @@ async def test_train_persist_load_with_composite_entities(
     assert loaded.pipeline
     text = "I am looking for an italian restaurant"
     assert loaded.parse(text) == trained.parse(text)
+
+
+async def test_parse_batch_matches_parse(component_builder, tmpdir):
+    pipeline = as_pipeline(
+        "WhitespaceTokenizer", "CountVectorsFeaturizer", "DIETClassifier"
+    )
+    pipeline[2].update({RANDOM_SEED: 1, EPOCHS: 1})
+
+    _config = RasaNLUModelConfig({"pipeline": pipeline, "language": "en"})
+
+    _, trained, _ = await train(
+        _config,
+        path=tmpdir.strpath,
+        data="data/test/demo-rasa-composite-entities.md",
+        component_builder=component_builder,
+    )
+
+    texts = [
+        "I am looking for an italian restaurant",
+        "hi",
+        "",
+        "show me chinese restaurants in the north of town",
+    ]
+
+    results = trained.parse_batch(texts)
+
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        expected = trained.parse(text)
+
+        assert result["text"] == expected["text"]
+        assert result["intent"]["name"] == expected["intent"]["name"]
+        assert result["intent"]["confidence"] == pytest.approx(
+            expected["intent"]["confidence"], abs=1e-5
+        )
+        assert [entity["value"] for entity in result["entities"]] == [
+            entity["value"] for entity in expected["entities"]
+        ]
+
+
+async def test_load_without_training_step(component_builder, tmpdir, monkeypatch):
+    pipeline = as_pipeline(
+        "WhitespaceTokenizer", "CountVectorsFeaturizer", "DIETClassifier"
+    )
+    pipeline[2].update({RANDOM_SEED: 1, EPOCHS: 1})
+
+    _config = RasaNLUModelConfig({"pipeline": pipeline, "language": "en"})
+
+    _, trained, persisted_path = await train(
+        _config,
+        path=tmpdir.strpath,
+        data="data/test/demo-rasa-composite-entities.md",
+        component_builder=component_builder,
+    )
+
+    mock = Mock()
+    monkeypatch.setattr(RasaModel, "fit", mock.fit)
+
+    loaded = Interpreter.load(persisted_path, component_builder)
+
+    mock.fit.assert_not_called()
+    text = "I am looking for an italian restaurant"
+    assert loaded.parse(text) == trained.parse(text)
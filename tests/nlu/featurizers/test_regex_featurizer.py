@@ -274,3 +274,24 @@ def test_regex_featurizer_case_sensitive(
     sequence_featrures, sentence_features = ftr._features_for_patterns(message, TEXT)
     assert np.allclose(sequence_featrures.toarray()[0], sequence_vector, atol=1e-10)
     assert np.allclose(sentence_features.toarray()[-1], sentence_vector, atol=1e-10)
+
+
+def test_regex_featurizer_with_large_lookup_table():
+    lookup = {
+        "name": "city",
+        "elements": [f"city {index}" for index in range(10000)] + ["New York"],
+    }
+    featurizer = RegexFeaturizer({"case_sensitive": False})
+
+    message = Message(data={TEXT: "from new york to city 42 or city 42000"})
+    WhitespaceTokenizer().train(TrainingData([message]))
+
+    featurizer.train(TrainingData([message], lookup_tables=[lookup]))
+
+    seq_vecs, sen_vec = message.get_sparse_features(TEXT, [])
+
+    assert seq_vecs.features.toarray()[:, 0].tolist() == [0, 1, 1, 0, 1, 1, 0, 0, 0]
+    assert sen_vec.features.toarray().tolist() == [[1]]
+    assert [
+        token.get("pattern")["city"] for token in message.get(TOKENS_NAMES[TEXT])
+    ] == [False, True, True, False, True, True, False, False, False]
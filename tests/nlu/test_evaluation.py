@@ -385,6 +385,36 @@ def test_run_cv_evaluation(pretrained_embeddings_spacy_config):
     assert len(entity_results.test["CRFEntityExtractor"]["F1-score"]) == n_folds
 
 
+def test_run_cv_evaluation_in_parallel():
+    td = rasa.shared.nlu.training_data.loading.load_data(
+        "data/examples/rasa/demo-rasa.json"
+    )
+    nlu_config = RasaNLUModelConfig(
+        {
+            "language": "en",
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "KeywordIntentClassifier"},
+            ],
+        }
+    )
+
+    n_folds = 2
+    intent_results, _, _ = cross_validate(
+        td,
+        n_folds,
+        nlu_config,
+        successes=False,
+        errors=False,
+        disable_plotting=True,
+        jobs=2,
+    )
+
+    assert len(intent_results.train["Accuracy"]) == n_folds
+    assert len(intent_results.test["Accuracy"]) == n_folds
+    assert len(intent_results.test["F1-score"]) == n_folds
+
+
 def test_run_cv_evaluation_with_response_selector():
     training_data_obj = rasa.shared.nlu.training_data.loading.load_data(
         "data/examples/rasa/demo-rasa.md"
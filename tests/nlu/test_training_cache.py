@@ -0,0 +1,160 @@
+from pathlib import Path
+from typing import List, Text
+from unittest.mock import patch
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.nlu.config import RasaNLUModelConfig
+from rasa.nlu.constants import TOKENS_NAMES
+from rasa.nlu.model import Trainer
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.nlu.training_cache import TrainingCache
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+
+def _training_data(texts: List[Text]) -> TrainingData:
+    return TrainingData(
+        [Message.build(text=text, intent="greet") for text in texts]
+        + [Message.build(text="bye bye", intent="goodbye")]
+    )
+
+
+def _trainer(cache: TrainingCache, pipeline: List[Text]) -> Trainer:
+    config = RasaNLUModelConfig(
+        {"language": "en", "pipeline": [{"name": name} for name in pipeline]}
+    )
+    return Trainer(config, training_cache=cache)
+
+
+def _trained_examples(tokenizer_train: patch) -> List[Text]:
+    return [
+        example.get(TEXT)
+        for call in tokenizer_train.call_args_list
+        for example in call[0][1].training_examples
+    ]
+
+
+def test_cached_component_only_trains_on_changed_examples(tmp_path: Path):
+    cache = TrainingCache(str(tmp_path))
+    pipeline = ["WhitespaceTokenizer", "CountVectorsFeaturizer"]
+
+    with patch.object(
+        WhitespaceTokenizer,
+        "train",
+        autospec=True,
+        side_effect=WhitespaceTokenizer.train,
+    ) as tokenizer_train:
+        _trainer(cache, pipeline).train(_training_data(["hello there", "hi"]))
+        assert sorted(_trained_examples(tokenizer_train)) == [
+            "bye bye",
+            "hello there",
+            "hi",
+        ]
+
+        tokenizer_train.reset_mock()
+        interpreter = _trainer(cache, pipeline).train(
+            _training_data(["hello there", "hey you"])
+        )
+        assert _trained_examples(tokenizer_train) == ["hey you"]
+
+        tokenizer_train.reset_mock()
+        _trainer(cache, pipeline).train(_training_data(["hello there", "hey you"]))
+        assert not tokenizer_train.called
+
+    assert interpreter.parse("hey you")
+
+
+def test_cached_outputs_are_added_to_training_examples(tmp_path: Path):
+    cache = TrainingCache(str(tmp_path))
+    training_data = _training_data(["hello there"])
+
+    _trainer(cache, ["WhitespaceTokenizer"]).train(training_data)
+
+    cached_training = cache.for_training_data(training_data)
+    tokenizer = WhitespaceTokenizer()
+    with patch.object(WhitespaceTokenizer, "train") as tokenizer_train:
+        cached_training.train(tokenizer, training_data)
+
+    tokenizer_train.assert_not_called()
+    tokens = [
+        [token.text for token in example.get(TOKENS_NAMES[TEXT])]
+        for example in training_data.training_examples
+    ]
+    assert tokens == [["hello", "there"], ["bye", "bye"]]
+
+
+def test_only_cacheable_components_are_trained_with_cache(tmp_path: Path):
+    cache = TrainingCache(str(tmp_path))
+    trainer = _trainer(cache, ["WhitespaceTokenizer", "CountVectorsFeaturizer"])
+    training_data = _training_data(["hello there"])
+
+    cached_training = cache.for_training_data(training_data)
+    tokenizer, featurizer = trainer.pipeline
+
+    assert cached_training.can_train(tokenizer)
+    assert not cached_training.can_train(featurizer)
+
+
+def test_components_with_different_config_do_not_share_outputs(tmp_path: Path):
+    cache = TrainingCache(str(tmp_path))
+    training_data = _training_data(["hello there"])
+
+    _trainer(cache, ["WhitespaceTokenizer"]).train(training_data)
+
+    cached_training = cache.for_training_data(training_data)
+    with patch.object(
+        WhitespaceTokenizer,
+        "train",
+        autospec=True,
+        side_effect=WhitespaceTokenizer.train,
+    ) as tokenizer_train:
+        cached_training.train(
+            WhitespaceTokenizer({"intent_tokenization_flag": True}), training_data
+        )
+
+    assert len(_trained_examples(tokenizer_train)) == 2
+
+
+def test_cache_evicts_least_recently_used_stages(tmp_path: Path):
+    cache = TrainingCache(str(tmp_path), max_size_in_mb=0.00015)
+
+    cache.save("first", {"example": ({"key": "value" * 10}, [])}, ["example"])
+    cache.save("second", {"example": ({"key": "value" * 10}, [])}, ["example"])
+
+    assert not cache.load("first", ["example"])
+    assert cache.load("second", ["example"])
+
+
+def test_cache_stores_stages_in_shards(tmp_path: Path):
+    cache = TrainingCache(str(tmp_path))
+    outputs = {
+        "aa1": ({"key": "value"}, []),
+        "aa2": ({"key": "other value"}, []),
+        "bb1": ({"key": "value"}, []),
+    }
+
+    cache.save("stage", outputs, outputs.keys())
+
+    assert len(list(cache.disk_cache.directory.glob("*.pkl"))) == 2
+    assert cache.load("stage", ["aa1"]) == {
+        key: value for key, value in outputs.items() if key.startswith("aa")
+    }
+    assert cache.load("stage", outputs.keys()) == outputs
+
+    # only shards with changed examples are stored again
+    changed_outputs = {**outputs, "bb1": ({"key": "changed value"}, [])}
+    cache.save("stage", changed_outputs, ["bb1"])
+    assert cache.load("stage", outputs.keys()) == changed_outputs
+
+
+def test_training_cache_from_environment(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("RASA_CACHE_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "10")
+    cache = TrainingCache.from_environment()
+    assert cache.disk_cache.cache_dir == tmp_path
+    assert cache.disk_cache.max_size_in_mb == 10
+
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "0")
+    assert TrainingCache.from_environment() is None
@@ -0,0 +1,164 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Text, Tuple
+from unittest.mock import Mock
+
+import numpy as np
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.nlu.featurizers.dense_featurizer.convert_featurizer import ConveRTFeaturizer
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.nlu.utils.embedding_cache import EmbeddingCache
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+
+
+def _compute_embeddings(texts: List[Text]) -> Mock:
+    def compute(indices: List[int]) -> Tuple[np.ndarray, List[np.ndarray]]:
+        return (
+            np.array([[len(texts[index])] for index in indices], dtype=np.float32),
+            [np.ones((len(texts[index].split()), 2)) for index in indices],
+        )
+
+    return Mock(side_effect=compute)
+
+
+def test_only_missing_embeddings_are_computed(tmp_path: Path):
+    cache = EmbeddingCache("model", str(tmp_path))
+    texts = ["hello", "hello there"]
+
+    compute = _compute_embeddings(texts)
+    cache.embeddings_for(texts, compute)
+    compute.assert_called_once_with([0, 1])
+
+    texts = ["hello there", "hi", "hello"]
+    compute = _compute_embeddings(texts)
+    sentence_embeddings, sequence_embeddings = EmbeddingCache(
+        "model", str(tmp_path), max_in_memory_entries=0
+    ).embeddings_for(texts, compute)
+
+    compute.assert_called_once_with([1])
+    assert [embedding.tolist() for embedding in sentence_embeddings] == [
+        [11],
+        [2],
+        [5],
+    ]
+    assert [embedding.shape for embedding in sequence_embeddings] == [
+        (2, 2),
+        (1, 2),
+        (1, 2),
+    ]
+
+
+def test_models_do_not_share_embeddings(tmp_path: Path):
+    texts = ["hello"]
+    EmbeddingCache("model", str(tmp_path)).embeddings_for(
+        texts, _compute_embeddings(texts)
+    )
+
+    compute = _compute_embeddings(texts)
+    EmbeddingCache("other model", str(tmp_path)).embeddings_for(texts, compute)
+
+    compute.assert_called_once_with([0])
+
+
+def test_embeddings_are_only_kept_in_memory_if_not_persisted(tmp_path: Path):
+    cache = EmbeddingCache("model", str(tmp_path))
+    texts = ["hello"]
+
+    cache.embeddings_for(texts, _compute_embeddings(texts), persist=False)
+    assert not list(tmp_path.glob("**/*.pkl"))
+
+    compute = _compute_embeddings(texts)
+    cache.embeddings_for(texts, compute, persist=False)
+    compute.assert_not_called()
+
+
+def test_in_memory_cache_is_bounded():
+    cache = EmbeddingCache("model", max_in_memory_entries=1)
+    texts = ["hello", "hi"]
+
+    cache.embeddings_for(texts, _compute_embeddings(texts))
+
+    compute = _compute_embeddings(texts)
+    cache.embeddings_for(texts, compute)
+    compute.assert_called_once_with([0])
+
+
+def test_in_memory_cache_can_be_used_by_several_threads():
+    cache = EmbeddingCache("model", max_in_memory_entries=5)
+    texts = [f"message {index}" for index in range(20)]
+
+    def lookup(offset: int) -> List[List[float]]:
+        shifted = texts[offset:] + texts[:offset]
+        for _ in range(50):
+            sentence_embeddings, _ = cache.embeddings_for(
+                shifted, _compute_embeddings(shifted)
+            )
+        return [embedding.tolist() for embedding in sentence_embeddings]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lookup, range(4)))
+
+    for offset, sentence_embeddings in enumerate(results):
+        shifted = texts[offset:] + texts[:offset]
+        assert sentence_embeddings == [[len(text)] for text in shifted]
+    # noinspection PyProtectedMember
+    assert len(cache._in_memory) == 5
+
+
+def test_cache_evicts_least_recently_used_embeddings(tmp_path: Path):
+    cache = EmbeddingCache("model", str(tmp_path))
+    cache.embeddings_for(["first"], _compute_embeddings(["first"]))
+    file_size = next(tmp_path.glob("**/*.pkl")).stat().st_size
+
+    # the cache directory only has room for two and a half embeddings
+    cache = EmbeddingCache(
+        "model", str(tmp_path), max_size_in_mb=2.5 * file_size / 1024 / 1024
+    )
+    for text in ["second", "third"]:
+        cache.embeddings_for([text], _compute_embeddings([text]))
+
+    cached_files = list(tmp_path.glob("**/*.pkl"))
+    assert 0 < len(cached_files) < 3
+
+    cache = EmbeddingCache("model", str(tmp_path), max_in_memory_entries=0)
+    compute = _compute_embeddings(["third"])
+    cache.embeddings_for(["third"], compute)
+    compute.assert_not_called()
+
+
+def test_embedding_cache_from_environment(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("RASA_CACHE_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "10")
+    cache = EmbeddingCache.from_environment("model")
+    assert cache.disk_cache.cache_dir == tmp_path
+    assert cache.disk_cache.directory.parent == tmp_path / "embeddings"
+
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "0")
+    assert EmbeddingCache.from_environment("model").disk_cache is None
+
+
+def test_convert_featurizer_reuses_cached_features(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setenv("RASA_CACHE_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "10")
+    message = Message.build(text="hello there")
+    WhitespaceTokenizer().process(message)
+
+    featurizer = ConveRTFeaturizer()
+    compute_model_features = Mock(return_value=(np.ones((1, 2, 3)), np.ones((1, 1, 3))))
+    monkeypatch.setattr(featurizer, "_compute_model_features", compute_model_features)
+
+    sequence_features, sentence_features = featurizer._compute_features(
+        [message], module=None
+    )
+    assert sequence_features[0].shape == (2, 3)
+    assert sentence_features[0].shape == (1, 3)
+
+    featurizer = ConveRTFeaturizer()
+    monkeypatch.setattr(featurizer, "_compute_model_features", compute_model_features)
+    featurizer._compute_features([message], module=None, attribute=TEXT)
+
+    compute_model_features.assert_called_once()
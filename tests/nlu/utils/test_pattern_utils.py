@@ -1,5 +1,7 @@
+import re
 from typing import Dict, List, Text
 
+import numpy as np
 import pytest
 
 import rasa.nlu.utils.pattern_utils as pattern_utils
@@ -171,3 +173,53 @@ def test_extract_patterns_use_only_lookup_tables_or_regex_features(
     )
 
     assert actual_patterns == expected_patterns
+
+
+@pytest.mark.parametrize(
+    "elements, text",
+    [
+        (["Max", "John"], "Hi Max and john, this is Maxi from John's team"),
+        (["New York", "New York City", "York"], "I live in New York City."),
+        (["New York City", "New York"], "I live in New York City."),
+        (["a.b", "b.c", "+1"], "call a.b.c or +1 or 2+1"),
+        (["über", "straße"], "Über die Straße"),
+        (["ab", "abc", "bc"], "abc ab bcabc"),
+    ],
+)
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_lookup_matcher_matches_like_regex(
+    elements: List[Text], text: Text, case_sensitive: bool
+):
+    pattern = pattern_utils._generate_lookup_regex({"elements": elements})
+    flags = 0 if case_sensitive else re.IGNORECASE
+    expected_spans = [match.span() for match in re.finditer(pattern, text, flags)]
+
+    (matcher,) = pattern_utils.compile_patterns(
+        [{"name": "lookup", "pattern": pattern}], case_sensitive
+    )
+
+    assert isinstance(matcher, pattern_utils.LookupMatcher)
+    assert matcher.spans(text) == expected_spans
+
+
+@pytest.mark.parametrize(
+    "pattern", ["[0-9]{5}", "(\\bMax\\b|\\bJo.n\\b)", "(\\bMax\\b|\\b\\b)"]
+)
+def test_compile_patterns_uses_regexes_for_other_patterns(pattern: Text):
+    (matcher,) = pattern_utils.compile_patterns(
+        [{"name": "regex", "pattern": pattern}], case_sensitive=True
+    )
+
+    assert isinstance(matcher, pattern_utils.RegexMatcher)
+
+
+def test_tokens_matching_spans():
+    token_starts = np.array([0, 4, 10])
+    token_ends = np.array([3, 9, 14])
+
+    assert pattern_utils.tokens_matching_spans(
+        token_starts, token_ends, [(5, 6), (12, 20)]
+    ).tolist() == [False, True, True]
+    assert pattern_utils.tokens_matching_spans(
+        token_starts, token_ends, []
+    ).tolist() == [False, False, False]
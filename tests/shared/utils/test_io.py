@@ -4,8 +4,10 @@ import uuid
 from collections import OrderedDict
 from pathlib import Path
 from typing import Callable, Text, List, Set, Any
+from unittest.mock import patch
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 import rasa.shared
 import rasa.shared.utils.io
@@ -91,6 +93,68 @@ def test_read_yaml_string():
     assert content["user"] == "user" and content["password"] == "pass"
 
 
+@pytest.fixture
+def empty_yaml_cache(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(rasa.shared.utils.io, "_parsed_yaml_documents", OrderedDict())
+    monkeypatch.setattr(rasa.shared.utils.io, "_yaml_file_content_hashes", {})
+    monkeypatch.setattr(rasa.shared.utils.io, "_persisted_yaml_cache", None)
+
+
+def test_read_yaml_file_is_parsed_once(tmp_path: Path, empty_yaml_cache: None):
+    yaml_file = tmp_path / "data.yml"
+    rasa.shared.utils.io.write_text_file("nlu:\n- intent: greet\n", yaml_file)
+
+    with patch.object(
+        rasa.shared.utils.io, "_parse_yaml", wraps=rasa.shared.utils.io._parse_yaml
+    ) as parse_yaml:
+        content = rasa.shared.utils.io.read_yaml_file(yaml_file)
+        content["nlu"].append({"intent": "goodbye"})
+
+        assert rasa.shared.utils.io.read_yaml_file(yaml_file) == {
+            "nlu": [{"intent": "greet"}]
+        }
+        assert rasa.shared.utils.io.read_yaml(
+            rasa.shared.utils.io.read_file(yaml_file)
+        ) == {"nlu": [{"intent": "greet"}]}
+        parse_yaml.assert_called_once()
+
+
+def test_read_yaml_file_is_parsed_again_after_change(
+    tmp_path: Path, empty_yaml_cache: None
+):
+    yaml_file = tmp_path / "data.yml"
+    rasa.shared.utils.io.write_text_file("key: value\n", yaml_file)
+    assert rasa.shared.utils.io.read_yaml_file(yaml_file) == {"key": "value"}
+
+    rasa.shared.utils.io.write_text_file("key: other value\n", yaml_file)
+    assert rasa.shared.utils.io.read_yaml_file(yaml_file) == {"key": "other value"}
+
+
+def test_read_yaml_from_persisted_cache(tmp_path: Path, empty_yaml_cache: None):
+    rasa.shared.utils.io.configure_yaml_cache(io_utils.DiskCache(tmp_path, "yaml"))
+    assert rasa.shared.utils.io.read_yaml("key: value") == {"key": "value"}
+
+    # simulate a new process
+    rasa.shared.utils.io._parsed_yaml_documents.clear()
+    with patch.object(rasa.shared.utils.io, "_parse_yaml") as parse_yaml:
+        assert rasa.shared.utils.io.read_yaml("key: value") == {"key": "value"}
+        parse_yaml.assert_not_called()
+
+
+def test_read_yaml_with_env_var_is_not_cached(
+    monkeypatch: MonkeyPatch, empty_yaml_cache: None
+):
+    config_with_env_var = "user: ${CACHED_USER_NAME}"
+
+    monkeypatch.setenv("CACHED_USER_NAME", "user")
+    assert rasa.shared.utils.io.read_yaml(config_with_env_var) == {"user": "user"}
+
+    monkeypatch.setenv("CACHED_USER_NAME", "other user")
+    assert rasa.shared.utils.io.read_yaml(config_with_env_var) == {
+        "user": "other user"
+    }
+
+
 def test_read_yaml_string_with_env_var():
     config_with_env_var = """
     user: ${USER_NAME}
@@ -1,3 +1,4 @@
+import copy
 import logging
 
 import pytest
@@ -120,3 +121,41 @@ async def test_request_non_json_response():
         response = await endpoint.request("post", subpath="test")
 
         assert not response
+
+
+async def test_pooled_session_is_reused():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/", connection_limit=10, connection_limit_per_host=5
+    )
+
+    session = endpoint.pooled_session()
+
+    assert endpoint.pooled_session() is session
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 5
+
+    await endpoint_utils.close_pooled_sessions()
+
+
+async def test_close_pooled_sessions():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+    session = endpoint.pooled_session()
+
+    await endpoint_utils.close_pooled_sessions()
+
+    assert session.closed
+    assert not endpoint.pooled_session().closed
+
+    await endpoint_utils.close_pooled_sessions()
+
+
+async def test_endpoint_config_with_pooled_session_can_be_copied():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/", token="token")
+    endpoint.pooled_session()
+
+    copied = copy.deepcopy(endpoint)
+
+    assert copied == endpoint
+    assert copied.pooled_session() is not endpoint.pooled_session()
+
+    await endpoint_utils.close_pooled_sessions()
@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from prompt_toolkit.document import Document
 from prompt_toolkit.validation import ValidationError
 
@@ -121,3 +122,44 @@ def test_create_directory_for_file(tmp_path: Path):
     io_utils.create_directory_for_file(str(file))
     assert not os.path.exists(file)
     assert os.path.exists(os.path.dirname(file))
+
+
+def test_disk_cache_loads_saved_values(tmp_path: Path):
+    cache = io_utils.DiskCache(tmp_path, "values")
+    cache.save("key", {"value": [1, 2]})
+
+    assert io_utils.DiskCache(tmp_path, "values").load("key") == {"value": [1, 2]}
+    assert io_utils.DiskCache(tmp_path, "other values").load("key") is None
+
+
+def test_disk_caches_share_maximum_size(tmp_path: Path):
+    first_cache = io_utils.DiskCache(tmp_path, "first", max_size_in_mb=0.00015)
+    second_cache = io_utils.DiskCache(tmp_path, "second", max_size_in_mb=0.00015)
+
+    first_cache.save("key", "x" * 100)
+    second_cache.save("key", "x" * 100)
+
+    assert first_cache.load("key") is None
+    assert second_cache.load("key") == "x" * 100
+
+
+def test_disk_cache_removes_temporary_file_if_saving_fails(tmp_path: Path):
+    cache = io_utils.DiskCache(tmp_path, "values")
+
+    # lambdas can't be pickled
+    cache.save("key", lambda: None)
+
+    assert cache.load("key") is None
+    assert list(cache.directory.iterdir()) == []
+
+
+def test_disk_cache_from_environment(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("RASA_CACHE_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "10")
+    cache = io_utils.DiskCache.from_environment("values")
+
+    assert cache.directory == tmp_path / "values"
+    assert cache.max_size_in_mb == 10
+
+    monkeypatch.setenv("RASA_MAX_CACHE_SIZE", "0")
+    assert io_utils.DiskCache.from_environment("values") is None